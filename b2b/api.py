@@ -17,6 +17,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Count, Manager, Prefetch, Q
 from mitol.common.utils import now_in_utc
+from mitol.common.utils.collections import chunks
 from opaque_keys.edx.keys import CourseKey
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic import ValidationError as PydanticValidationError
@@ -26,6 +27,7 @@ from b2b.constants import (
     B2B_RUN_TAG_FORMAT,
     CONTRACT_MEMBERSHIP_AUTOS,
     CONTRACT_MEMBERSHIP_MANAGED,
+    ENROLLMENT_CODE_BULK_CREATE_CHUNK_SIZE,
     ORG_KEY_MAX_LENGTH,
     RETIREMENT_CONTRACT_NAME,
     RETIREMENT_ORG_KEY,
@@ -1031,6 +1033,59 @@ def _update_discount(
     )
 
 
+def _bulk_create_discounts_with_product(
+    product: Product, discount_amount: Decimal, redemption_type: str, count: int
+) -> list[Discount]:
+    """
+    Create a batch of discounts with fresh codes and associate them with a product.
+
+    The codes are generated in memory and the Discount and DiscountProduct rows
+    are inserted in chunks, rather than saved one by one.
+    """
+    defaults = _get_discount_defaults(discount_amount)
+    discounts = [
+        Discount(
+            discount_code=str(uuid4()),
+            redemption_type=redemption_type,
+            **defaults,
+        )
+        for _ in range(count)
+    ]
+
+    with transaction.atomic():
+        for discount_chunk in chunks(
+            discounts, chunk_size=ENROLLMENT_CODE_BULK_CREATE_CHUNK_SIZE
+        ):
+            Discount.objects.bulk_create(discount_chunk)
+            DiscountProduct.objects.bulk_create(
+                [
+                    DiscountProduct(discount=discount, product=product)
+                    for discount in discount_chunk
+                ]
+            )
+
+    return discounts
+
+
+def _bulk_update_discounts(
+    discounts: list[Discount], discount_amount: Decimal, redemption_type: str
+) -> None:
+    """Update a batch of existing discounts with new parameters in one query."""
+    defaults = _get_discount_defaults(discount_amount)
+    now = now_in_utc()
+    for discount in discounts:
+        discount.redemption_type = redemption_type
+        for field, value in defaults.items():
+            setattr(discount, field, value)
+        discount.updated_on = now
+
+    Discount.objects.bulk_update(
+        discounts,
+        ["redemption_type", *defaults.keys(), "updated_on"],
+        batch_size=ENROLLMENT_CODE_BULK_CREATE_CHUNK_SIZE,
+    )
+
+
 def _handle_extra_enrollment_codes(contract: ContractPage, product: Product) -> int:
     """Remove any extra codes, so there's just enough for the given product."""
 
@@ -1184,35 +1239,29 @@ def _handle_limited_seats(
             0,
         )
 
+    # The discounts are already filtered on the product, so they don't need to
+    # have it associated again.
+    existing_discounts = list(contract_product_discounts_qset.distinct())
     log.info(
         "Updating %s discount codes for product %s",
-        contract_product_discounts_qset.count(),
+        len(existing_discounts),
         product,
     )
 
     # Update existing discounts
-    for discount in contract_product_discounts_qset.all():
-        _update_discount(discount, discount_amount, REDEMPTION_TYPE_ONE_TIME)
-        discount.refresh_from_db()
-
-        log.info(
-            "Contract %s: updated discount %s for product %s",
-            contract,
-            discount,
-            product,
-        )
-
-        if _ensure_discount_product_association(discount, product):
-            log.debug(
-                "Contract %s: Added product %s to discount %s",
-                contract,
-                product,
-                discount,
-            )
-        updated += 1
+    _bulk_update_discounts(
+        existing_discounts, discount_amount, REDEMPTION_TYPE_ONE_TIME
+    )
+    updated = len(existing_discounts)
+    log.info(
+        "Contract %s: updated %s discounts for product %s",
+        contract,
+        updated,
+        product,
+    )
 
     # Create additional discounts if needed
-    current_discount_count = contract_product_discounts_qset.count()
+    current_discount_count = len(existing_discounts)
     create_count = contract.max_learners - current_discount_count
     log.info(
         "Contract %s has %s max learners and product %s has %s discounts",
@@ -1240,17 +1289,17 @@ def _handle_limited_seats(
 
     log.info("Creating %s discounts for product %s", create_count, product)
 
-    for _ in range(create_count):
-        discount = _create_discount_with_product(
-            product, discount_amount, REDEMPTION_TYPE_ONE_TIME
-        )
-        created += 1
-        log.info(
-            "Contract %s: Created discount %s for product %s",
-            contract,
-            discount,
-            product,
+    created = len(
+        _bulk_create_discounts_with_product(
+            product, discount_amount, REDEMPTION_TYPE_ONE_TIME, create_count
         )
+    )
+    log.info(
+        "Contract %s: Created %s discounts for product %s",
+        contract,
+        created,
+        product,
+    )
 
     return (created, updated, errors)
 
@@ -1997,9 +2046,14 @@ def process_mailgun_webhook_for_enrollment_code_emails(payload):
     # Save it to the row corresponding to the event we just got and move on with our lives
     message_id = event_data["message"]["headers"]["message-id"]
     message_timestamp = datetime.fromtimestamp(event_data["timestamp"], tz=UTC)
-    assignment = DiscountContractAttachmentRedemption.objects.get(
+    assignments = DiscountContractAttachmentRedemption.objects.filter(
         email_message_id=message_id
     )
+    # Every recipient of a batch send shares the message ID, so narrow it down by
+    # the recipient the event is for.
+    if event_data.get("recipient"):
+        assignments = assignments.filter(assigned_email__iexact=event_data["recipient"])
+    assignment = assignments.get()
     saved_event_timestamp = assignment.email_status_event_timestamp
 
     # We want to store event with the most recent timestamp we get from mailgun.
@@ -402,6 +402,41 @@ def test_ensure_enrollment_codes_clears_extras():
     assert contract.get_discounts().count() == 10
 
 
+def test_ensure_enrollment_codes_bulk_creates_codes(
+    mocker, django_assert_max_num_queries
+):
+    """Test that seat-limited codes are minted and updated in bulk."""
+
+    mocker.patch("b2b.api.ENROLLMENT_CODE_BULK_CREATE_CHUNK_SIZE", 20)
+    contract = ContractPageFactory.create(
+        max_learners=50,
+        membership_type=CONTRACT_MEMBERSHIP_CODE,
+        enrollment_fixed_price=Decimal(10),
+    )
+    run = CourseRunFactory.create(b2b_contract=contract)
+    product = ProductFactory.create(purchasable_object=run)
+
+    with django_assert_max_num_queries(15):
+        created, updated, errors = ensure_enrollment_codes_exist(contract)
+
+    assert (created, updated, errors) == (50, 0, 0)
+    discounts = contract.get_discounts().filter(products__product=product)
+    assert discounts.count() == 50
+    assert len({discount.discount_code for discount in discounts}) == 50
+
+    contract.enrollment_fixed_price = Decimal(20)
+    contract.max_learners = 60
+    contract.save()
+
+    with django_assert_max_num_queries(15):
+        created, updated, errors = ensure_enrollment_codes_exist(contract)
+
+    assert (created, updated, errors) == (10, 50, 0)
+    for discount in contract.get_discounts():
+        assert discount.amount == Decimal(20)
+        assert discount.redemption_type == REDEMPTION_TYPE_ONE_TIME
+
+
 @pytest.mark.parametrize("user_authenticated", [True, False])
 @pytest.mark.parametrize("user_in_contract", [True, False])
 @pytest.mark.parametrize("user_has_valid_edx_user", [True, False])
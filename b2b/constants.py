@@ -41,3 +41,17 @@ ORG_KEY_MAX_LENGTH = 30
 RETIREMENT_ORG_KEY = "RETIRED"
 RETIREMENT_ORG_NAME = "Retired Runs"
 RETIREMENT_CONTRACT_NAME = "Retired Runs Holding Contract"
+
+# How many enrollment codes to insert per query when minting codes for
+# seat-limited contracts.
+ENROLLMENT_CODE_BULK_CREATE_CHUNK_SIZE = 500
+
+# Number of sheet rows (or row ranges) sent per Google Sheets values update when
+# writing enrollment codes.
+ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE = 1000
+
+# How many enrollment code assignment emails each Celery task sends. Each chunk
+# goes out as a single Mailgun batch send, which accepts at most 1000 recipients.
+ENROLLMENT_CODE_EMAIL_CHUNK_SIZE = 250
+# How long to keep progress for an enrollment code assignment email job.
+ENROLLMENT_CODE_EMAIL_JOB_TTL_SECONDS = 60 * 60 * 24 * 7
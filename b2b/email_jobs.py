@@ -0,0 +1,109 @@
+"""
+Progress tracking for enrollment code assignment email jobs
+
+Bulk assignments send their invite emails from several Celery tasks in
+parallel. Each task adds its results to a Redis hash for the job, so the manager
+dashboard can poll a single job id for progress.
+"""
+
+import logging
+
+from mitol.common.utils.datetime import now_in_utc
+
+from b2b.constants import ENROLLMENT_CODE_EMAIL_JOB_TTL_SECONDS
+
+log = logging.getLogger(__name__)
+
+_JOB_KEY_PREFIX = "b2b:enrollment_code_email_job"
+
+EMAIL_JOB_STATUS_IN_PROGRESS = "in_progress"
+EMAIL_JOB_STATUS_COMPLETE = "complete"
+
+
+def _get_redis():
+    from django_redis import get_redis_connection  # noqa: PLC0415
+
+    return get_redis_connection("redis")
+
+
+def _job_key(job_id: str) -> str:
+    return f"{_JOB_KEY_PREFIX}:{job_id}"
+
+
+def create_assignment_email_job(job_id: str, contract_id: int, total: int):
+    """
+    Start tracking an enrollment code assignment email job
+
+    Args:
+        job_id(str): The id for the job
+        contract_id(int): The contract the assignments belong to
+        total(int): The number of emails the job will send
+    """
+    key = _job_key(job_id)
+    pipeline = _get_redis().pipeline()
+    pipeline.hset(
+        key,
+        mapping={
+            "contract_id": contract_id,
+            "total": total,
+            "sent": 0,
+            "failed": 0,
+            "created_on": now_in_utc().isoformat(),
+        },
+    )
+    pipeline.expire(key, ENROLLMENT_CODE_EMAIL_JOB_TTL_SECONDS)
+    pipeline.execute()
+
+
+def record_assignment_email_job_progress(job_id: str, *, sent: int, failed: int):
+    """
+    Add the results of a chunk of sends to a job
+
+    Args:
+        job_id(str): The id for the job
+        sent(int): The number of emails that were sent
+        failed(int): The number of emails that couldn't be sent
+    """
+    key = _job_key(job_id)
+    redis_client = _get_redis()
+    if not redis_client.exists(key):
+        log.warning("Enrollment code email job %s is not being tracked", job_id)
+        return
+
+    pipeline = redis_client.pipeline()
+    pipeline.hincrby(key, "sent", sent)
+    pipeline.hincrby(key, "failed", failed)
+    pipeline.execute()
+
+
+def get_assignment_email_job(job_id: str) -> dict | None:
+    """
+    Get the progress of an enrollment code assignment email job
+
+    Args:
+        job_id(str): The id for the job
+
+    Returns:
+        dict or None: the job's contract_id, total, sent, failed, created_on and
+            status, or None if the job doesn't exist (or has expired)
+    """
+    job = {
+        key.decode() if isinstance(key, bytes) else key: (
+            value.decode() if isinstance(value, bytes) else value
+        )
+        for key, value in _get_redis().hgetall(_job_key(job_id)).items()
+    }
+    if not job:
+        return None
+
+    counts = {
+        field: int(job[field]) for field in ("contract_id", "total", "sent", "failed")
+    }
+    return {
+        "job_id": job_id,
+        **counts,
+        "created_on": job["created_on"],
+        "status": EMAIL_JOB_STATUS_COMPLETE
+        if counts["sent"] + counts["failed"] >= counts["total"]
+        else EMAIL_JOB_STATUS_IN_PROGRESS,
+    }
@@ -0,0 +1,49 @@
+"""Tests for enrollment code assignment email job tracking."""
+
+import uuid
+
+import pytest
+
+from b2b import email_jobs
+
+
+@pytest.fixture
+def job_id():
+    """Return a fresh job ID, and clean up its progress afterwards."""
+    job_id = str(uuid.uuid4())
+    yield job_id
+    email_jobs._get_redis().delete(email_jobs._job_key(job_id))  # noqa: SLF001
+
+
+def test_assignment_email_job_progress(job_id):
+    """Chunk results should add up until the job is complete."""
+    email_jobs.create_assignment_email_job(job_id, 12, 5)
+
+    job = email_jobs.get_assignment_email_job(job_id)
+    assert job == {
+        "job_id": job_id,
+        "contract_id": 12,
+        "total": 5,
+        "sent": 0,
+        "failed": 0,
+        "created_on": job["created_on"],
+        "status": email_jobs.EMAIL_JOB_STATUS_IN_PROGRESS,
+    }
+
+    email_jobs.record_assignment_email_job_progress(job_id, sent=2, failed=0)
+    email_jobs.record_assignment_email_job_progress(job_id, sent=2, failed=1)
+
+    job = email_jobs.get_assignment_email_job(job_id)
+    assert (job["sent"], job["failed"]) == (4, 1)
+    assert job["status"] == email_jobs.EMAIL_JOB_STATUS_COMPLETE
+    assert email_jobs._get_redis().ttl(email_jobs._job_key(job_id)) > 0  # noqa: SLF001
+
+
+def test_unknown_assignment_email_job(mocker, job_id):
+    """Unknown jobs have no progress, and recording against them is a no-op."""
+    patched_log = mocker.patch("b2b.email_jobs.log")
+
+    email_jobs.record_assignment_email_job_progress(job_id, sent=1, failed=0)
+
+    assert email_jobs.get_assignment_email_job(job_id) is None
+    patched_log.warning.assert_called_once()
@@ -6,6 +6,7 @@ API, rather than using SCIM or relying on the OIDC payload. At the moment, this
 is mostly the organizations data.
 """
 
+import threading
 from urllib.parse import urljoin
 
 import requests
@@ -21,6 +22,10 @@ from b2b.keycloak_admin_dataclasses import (
 
 KCAM_ORGANIZATIONS = (OrganizationRepresentation, "organizations")
 KCAM_USERS = (UserRepresentation, "users")
+KEYCLOAK_LIST_PAGE_SIZE = 100
+
+_client_cache = {}
+_client_cache_lock = threading.Lock()
 
 
 class KeycloakAdminClient:
@@ -88,6 +93,9 @@ class KeycloakAdminClient:
             token_endpoint=self.openid_configuration["token_endpoint"],
             scope=settings.KEYCLOAK_ADMIN_CLIENT_SCOPES,
             verify=not self.skip_verify,
+            # lets the session fetch a new token by itself when the current one
+            # is about to expire, so long-lived clients keep working
+            grant_type="client_credentials",
         )
         self.token = self.oauth_session.fetch_token(
             self.openid_configuration["token_endpoint"],
@@ -172,7 +180,9 @@ class KeycloakAdminClient:
 
         self._realm = realm_name
 
-    def list(self, endpoint, representation, **kwargs):
+    def list(
+        self, endpoint, representation, *, page_size=KEYCLOAK_LIST_PAGE_SIZE, **kwargs
+    ):
         """
         List objects from the endpoint in the realm.
 
@@ -180,23 +190,44 @@ class KeycloakAdminClient:
         The general ones listed are generally supported, but you should check
         the API docs for the exact list for the endpoint.
 
+        Results are paged through automatically using the first/max params,
+        page_size items at a time. If you pass first or max yourself, only that
+        one page is retrieved.
+
         Args:
         - endpoint: The endpoint to list (e.g., "organizations", "users", etc).
         - representation: The dataclass to use for the representation of each item.
           (e.g. OrganizationRepresentation, etc.)
+        - page_size: The number of items to retrieve per request.
         General Keyword Args:
         - exact: bool; If True, only return exact matches for the search term
         - search: str; A search term to filter organizations by name or description.
         - q: str; Search by attribute values ("key:value key:value").
-        Returns:
-        - A list of "representation" type instances.
+        - first: int; The offset of the first item to return.
+        - max: int; The maximum number of items to return.
+        Yields:
+        - "representation" type instances.
         """
 
-        response = self.realm_request("GET", endpoint, params=kwargs)
-        response.raise_for_status()
-        list_data = response.json()
+        if "first" in kwargs or "max" in kwargs:
+            response = self.realm_request("GET", endpoint, params=kwargs)
+            response.raise_for_status()
+            yield from (representation(**item) for item in response.json())
+            return
+
+        first = 0
+        while True:
+            response = self.realm_request(
+                "GET", endpoint, params={**kwargs, "first": first, "max": page_size}
+            )
+            response.raise_for_status()
+            list_data = response.json()
+
+            yield from (representation(**item) for item in list_data)
 
-        return [representation(**item) for item in list_data]
+            if len(list_data) < page_size:
+                return
+            first += page_size
 
     def retrieve(self, endpoint, representation, **kwargs):
         """
@@ -336,8 +367,8 @@ class KeycloakAdminModel:
         - exact: bool; If True, only return exact matches for the search term
         - search: str; A search term to filter objects by name or description.
         - q: str; Search by attribute values ("key:value key:value").
-        Returns:
-        - A list of representation instances.
+        Yields:
+        - representation instances, paged through automatically.
         """
 
         return self.admin_client.list(
@@ -397,19 +428,63 @@ class KeycloakAdminModel:
         )
 
 
+def _client_cache_key():
+    """Get the settings that a cached KeycloakAdminClient was configured with."""
+
+    return (
+        settings.KEYCLOAK_BASE_URL,
+        settings.KEYCLOAK_REALM_NAME,
+        settings.KEYCLOAK_DISCOVERY_URL,
+        settings.KEYCLOAK_ADMIN_CLIENT_ID,
+        settings.KEYCLOAK_ADMIN_CLIENT_SECRET,
+        settings.KEYCLOAK_ADMIN_CLIENT_SCOPES,
+        settings.KEYCLOAK_ADMIN_CLIENT_NO_VERIFY_SSL,
+    )
+
+
+def clear_client_cache():
+    """Drop the cached KeycloakAdminClient, so the next one is built from scratch."""
+
+    with _client_cache_lock:
+        _client_cache.clear()
+
+
 def bootstrap_client(*, verify_realm=False):
-    """Bootstrap a KeycloakAdminClient instance."""
+    """
+    Bootstrap a KeycloakAdminClient instance.
 
-    client = KeycloakAdminClient()
-    target_realm = settings.KEYCLOAK_REALM_NAME
+    The client is cached for the life of the process, so the OpenID discovery
+    document, the access token and the HTTP session's connection pool are shared
+    by every caller. The session refreshes the token when it's close to expiry.
+    A new client is built if the Keycloak settings change.
 
-    if verify_realm:
-        realms = [realm.realm for realm in client.realms()]
-        if target_realm not in realms:
-            msg = f"Realm '{target_realm}' not found in Keycloak."
-            raise KeycloakAdminImproperlyConfiguredError(msg)
+    Args:
+    - verify_realm: If True, make sure the configured realm exists. This is
+      only checked once per cached client.
+    Returns:
+    - KeycloakAdminClient: the client, set to the configured realm
+    """
 
-    client.set_realm(target_realm)
+    target_realm = settings.KEYCLOAK_REALM_NAME
+    cache_key = _client_cache_key()
+
+    with _client_cache_lock:
+        client, realm_verified = _client_cache.get(cache_key, (None, False))
+        if client is None:
+            _client_cache.clear()
+            client = KeycloakAdminClient()
+            # The realm is part of the cache key, so it only needs setting once,
+            # while no other thread can be using the client
+            client.set_realm(target_realm)
+
+        if verify_realm and not realm_verified:
+            realms = [realm.realm for realm in client.realms()]
+            if target_realm not in realms:
+                msg = f"Realm '{target_realm}' not found in Keycloak."
+                raise KeycloakAdminImproperlyConfiguredError(msg)
+            realm_verified = True
+
+        _client_cache[cache_key] = (client, realm_verified)
 
     return client
 
@@ -14,6 +14,7 @@ from b2b.keycloak_admin_api import (
     KeycloakAdminClient,
     KeycloakAdminModel,
     bootstrap_client,
+    clear_client_cache,
 )
 from b2b.keycloak_admin_dataclasses import RealmRepresentation
 
@@ -21,6 +22,14 @@ pytestmark = [pytest.mark.django_db]
 FAKE = faker.Faker()
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_cache():
+    """Make sure each test starts without a cached client."""
+    clear_client_cache()
+    yield
+    clear_client_cache()
+
+
 def _mocked_admin_client(settings, mocker):
     """
     Return a mocked KeycloakAdminClient instance.
@@ -381,6 +390,7 @@ def test_client_init_oauth_session_configuration(settings, mocker):
         token_endpoint=mocked_openid_config["token_endpoint"],
         scope=settings.KEYCLOAK_ADMIN_CLIENT_SCOPES,
         verify=not client.skip_verify,
+        grant_type="client_credentials",
     )
 
     mock_oauth_session.fetch_token.assert_called_once_with(
@@ -466,12 +476,63 @@ def test_client_list(settings, mocker):
 
     response = client.list("realms", RealmRepresentation)
 
+    assert list(response) == [fake_realm]
     mocked_client_request.assert_called_once_with(
         "GET",
         urljoin(client.base_url, f"{client._realm}/realms"),
-        params={},
+        params={"first": 0, "max": 100},
+    )
+
+
+def test_client_list_pages(settings, mocker):
+    """Test that the list op pages through the results until it gets a short page."""
+
+    fake_realms = RealmRepresentationFactory.create_batch(5)
+
+    client, _, _, _ = _mocked_admin_client(settings, mocker)
+
+    mocked_client_request = mocker.patch(
+        "authlib.integrations.requests_client.OAuth2Session.request",
+        side_effect=[
+            _faked_response([realm.__dict__ for realm in fake_realms[:2]]),
+            _faked_response([realm.__dict__ for realm in fake_realms[2:4]]),
+            _faked_response([realm.__dict__ for realm in fake_realms[4:]]),
+        ],
+    )
+
+    response = client.list("realms", RealmRepresentation, page_size=2, search="x")
+
+    assert list(response) == fake_realms
+    assert mocked_client_request.call_args_list == [
+        mocker.call(
+            "GET",
+            urljoin(client.base_url, f"{client._realm}/realms"),
+            params={"search": "x", "first": first, "max": 2},
+        )
+        for first in [0, 2, 4]
+    ]
+
+
+def test_client_list_single_page(settings, mocker):
+    """Test that the list op only gets the requested page if first/max are passed."""
+
+    fake_realms = RealmRepresentationFactory.create_batch(2)
+
+    client, _, _, _ = _mocked_admin_client(settings, mocker)
+
+    mocked_client_request = mocker.patch(
+        "authlib.integrations.requests_client.OAuth2Session.request",
+        return_value=_faked_response([realm.__dict__ for realm in fake_realms]),
+    )
+
+    response = client.list("realms", RealmRepresentation, first=10, max=2)
+
+    assert list(response) == fake_realms
+    mocked_client_request.assert_called_once_with(
+        "GET",
+        urljoin(client.base_url, f"{client._realm}/realms"),
+        params={"first": 10, "max": 2},
     )
-    assert response == [fake_realm]
 
 
 def test_client_retrieve(settings, mocker):
@@ -643,6 +704,37 @@ def test_bootstrap_client(settings, mocker, verify_realm):
         mocked_client_request.assert_called()
 
 
+def test_bootstrap_client_cached(settings, mocker):
+    """Test that bootstrap_client reuses the client and only verifies the realm once."""
+
+    fake_realm = RealmRepresentationFactory.create()
+
+    _, mocked_requests_get, mocked_token_request, _ = _mocked_admin_client(
+        settings, mocker
+    )
+    mocked_client_request = mocker.patch(
+        "authlib.integrations.requests_client.OAuth2Session.request",
+        return_value=_faked_response([fake_realm.__dict__]),
+    )
+    settings.KEYCLOAK_REALM_NAME = fake_realm.realm
+    mocked_requests_get.reset_mock()
+    mocked_token_request.reset_mock()
+
+    client = bootstrap_client(verify_realm=True)
+    client.set_realm(FAKE.word())
+
+    assert bootstrap_client(verify_realm=True) is client
+    assert client._realm == fake_realm.realm
+    mocked_requests_get.assert_called_once()
+    mocked_token_request.assert_called_once()
+    mocked_client_request.assert_called_once()
+
+    settings.KEYCLOAK_ADMIN_CLIENT_ID = FAKE.word()
+
+    assert bootstrap_client() is not client
+    assert mocked_requests_get.call_count == 2
+
+
 def test_realm_representation_ignores_extra_fields():
     """Test that RealmRepresentation does not fail when given unknown fields.
 
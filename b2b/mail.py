@@ -1,9 +1,10 @@
 import logging
 import uuid
+from itertools import groupby
 
 from django.conf import settings
 from mitol.common.utils.datetime import now_in_utc
-from mitol.mail.api import get_message_sender
+from mitol.mail.api import get_connection, get_message_sender
 from mitol.mail.messages import TemplatedMessage
 
 from b2b.models import ContractPage, DiscountContractAttachmentRedemption
@@ -11,6 +12,7 @@ from b2b.models import ContractPage, DiscountContractAttachmentRedemption
 log = logging.getLogger(__name__)
 
 ENROLLMENT_CODE_ASSINGMENT_TAG = "enrollment-code-assignment"
+MAILGUN_BACKEND = "anymail.backends.mailgun.EmailBackend"
 
 
 class BaseEnrollmentCodeAssignmentMessage(TemplatedMessage):
@@ -49,62 +51,180 @@ def send_email_helper(  # noqa: PLR0913
             # send_message swallows exceptions, so we'll favor direct calls to message.send()
             message.send()
 
-            # The message_id is primarily to be used to tie back to mailgun webhook events unambiguously
-            # In the case of a local SMTP server the message_id will be none so we just generate a UUID
-            if (
-                settings.MITOL_MAIL_CONNECTION_BACKEND
-                == "anymail.backends.mailgun.EmailBackend"
-            ):
-                recipient_status = message.anymail_status.recipients.get(email)
-                # Message ID is in the following format when pulled from anymail
-                # '<20260806133209.67c51081a4f1c478@mitxonline-rc-mail.mitxonline.mit.edu>'
-                # The webhook doesn't have the leading or trailing angle brackets, so we'll remove those
-                message_id = (
-                    recipient_status.message_id.strip("<>")
-                    if recipient_status
-                    else None
-                )
-            else:
-                message_id = str(uuid.uuid4())
-
-            return message_id
+            return _get_message_id(message, email)
     except:  # pylint: disable=bare-except  # noqa: E722
         log.exception("Error sending enrollment code assignment email.")
 
 
+def _get_message_id(message, email):
+    """
+    Return the message ID to store for a recipient of a sent message.
+
+    The message_id is primarily to be used to tie back to mailgun webhook events
+    unambiguously. In the case of a local SMTP server the message_id will be none
+    so we just generate a UUID.
+    """
+    if settings.MITOL_MAIL_CONNECTION_BACKEND != MAILGUN_BACKEND:
+        return str(uuid.uuid4())
+
+    recipient_status = message.anymail_status.recipients.get(email)
+    # Message ID is in the following format when pulled from anymail
+    # '<20260806133209.67c51081a4f1c478@mitxonline-rc-mail.mitxonline.mit.edu>'
+    # The webhook doesn't have the leading or trailing angle brackets, so we'll remove those
+    return recipient_status.message_id.strip("<>") if recipient_status else None
+
+
+def _can_batch_send():
+    """
+    Return whether assignment emails can go out as Mailgun batch sends.
+
+    Batch sends rely on Mailgun filling in recipient variables, so other backends
+    (and the recipient override, which would collapse a batch into a single
+    address) send each email individually instead.
+    """
+    return (
+        settings.MITOL_MAIL_CONNECTION_BACKEND == MAILGUN_BACKEND
+        and not settings.MITOL_MAIL_RECIPIENT_OVERRIDE
+    )
+
+
+def _get_assignment_code_context(assignment):
+    code = assignment.discount.discount_code
+    return {"code": code, "code_url": f"{settings.MIT_LEARN_ATTACH_URL}{code}"}
+
+
+def _split_unique_recipients(assignments):
+    """
+    Split assignments into batches where each email address appears only once.
+
+    Recipient variables are keyed on the email address, so an address assigned
+    more than one code needs to go out in separate batch sends.
+    """
+    batches = []
+    for assignment in assignments:
+        email = assignment.assigned_email.lower()
+        batch = next(
+            (batch for batch in batches if email not in batch),
+            None,
+        )
+        if batch is None:
+            batch = {}
+            batches.append(batch)
+        batch[email] = assignment
+    return [list(batch.values()) for batch in batches]
+
+
+def send_enrollment_code_assignment_batch(contract, assignments):
+    """
+    Send assignment emails for a contract with a single Mailgun batch send.
+
+    The templates are rendered once with Mailgun recipient variable placeholders
+    for the code and code URL, and Mailgun fills them in for each recipient.
+
+    Args:
+        contract (ContractPage): the contract the assignments belong to
+        assignments (list[DiscountContractAttachmentRedemption]): the assignments
+            to send emails for; each email address may only appear once
+
+    Returns:
+        dict: assignment ID to message ID, for the emails that were sent
+    """
+    try:
+        with get_connection() as connection:
+            message = EnrollmentCodeAssignmentMessage.create(
+                connection=connection,
+                to=[assignment.assigned_email for assignment in assignments],
+                template_context={
+                    "code": "%recipient.code%",
+                    "code_url": "%recipient.code_url%",
+                    "organization_name": contract.organization.name,
+                    "contract_name": contract.name,
+                    "user": None,
+                },
+            )
+            message.merge_data = {
+                assignment.assigned_email: _get_assignment_code_context(assignment)
+                for assignment in assignments
+            }
+            message.send()
+    except:  # pylint: disable=bare-except  # noqa: E722
+        log.exception(
+            "Error sending enrollment code assignment emails for contract %s",
+            contract,
+        )
+        return {}
+
+    message_ids = {}
+    for assignment in assignments:
+        message_id = _get_message_id(message, assignment.assigned_email)
+        if message_id:
+            message_ids[assignment.id] = message_id
+    return message_ids
+
+
 def send_enrollment_code_assignment_email(assignment_record_ids):
     """
-    Send an enrollment code assignment invite email.
+    Send enrollment code assignment invite emails.
+
+    With the Mailgun backend, the emails for each contract go out as batch sends;
+    otherwise each email is sent on its own. The message IDs are then saved with
+    a single bulk update.
 
     Args:
         assignment_record_ids list[int]: The IDs for DiscountContractAttachmentRedemption records to send emails for
+
+    Returns:
+        tuple[int, int]: the number of emails that were sent and that failed
     """
 
     assignments = list(
         DiscountContractAttachmentRedemption.objects.filter(
             id__in=assignment_record_ids
-        ).select_related("discount", "contract")
+        )
+        .select_related("discount", "contract__organization")
+        .order_by("contract_id", "id")
     )
 
+    message_ids = {}
+    if _can_batch_send():
+        for _, contract_assignments in groupby(
+            assignments, key=lambda assignment: assignment.contract_id
+        ):
+            contract_assignments = list(contract_assignments)  # noqa: PLW2901
+            for batch in _split_unique_recipients(contract_assignments):
+                message_ids.update(
+                    send_enrollment_code_assignment_batch(
+                        contract_assignments[0].contract, batch
+                    )
+                )
+    else:
+        for assignment in assignments:
+            message_id = send_email_helper(
+                assignment.assigned_email,
+                assignment.discount.discount_code,
+                _get_assignment_code_context(assignment)["code_url"],
+                assignment.contract.organization.name,
+                assignment.contract.name,
+            )
+            if message_id:
+                message_ids[assignment.id] = message_id
+
+    # If we got a message ID from mailgun, we'll treat the message as sent
+    # If anything goes wrong after that, it'll come in as a webhook
+    # Webhook events can race this update, so it happens as soon as the sends are done.
+    sent_on = now_in_utc()
+    sent_assignments = []
     for assignment in assignments:
-        code = assignment.discount.discount_code
-        code_url = f"{settings.MIT_LEARN_ATTACH_URL}{code}"
-        organization_name = assignment.contract.organization.name
-        message_id = send_email_helper(
-            assignment.assigned_email,
-            code,
-            code_url,
-            organization_name,
-            assignment.contract.name,
-        )
-        if message_id:
-            # If we got a message ID from mailgun, we'll treat the message as sent
-            # If anything goes wrong after that, it'll come in as a webhook
-            # We are going to perform these saves as eagerly as possibly as there's technically
-            # a race condition between saving the message ID and webhooks coming in.
-            assignment.email_message_id = message_id
-            assignment.last_reminder_sent_on = now_in_utc()
-            assignment.save(update_fields=["email_message_id", "last_reminder_sent_on"])
+        if assignment.id in message_ids:
+            assignment.email_message_id = message_ids[assignment.id]
+            assignment.last_reminder_sent_on = sent_on
+            sent_assignments.append(assignment)
+
+    DiscountContractAttachmentRedemption.objects.bulk_update(
+        sent_assignments, ["email_message_id", "last_reminder_sent_on"]
+    )
+
+    return len(sent_assignments), len(assignments) - len(sent_assignments)
 
 
 def send_test_enrollment_code_assignment_email(email, contract_record_id):
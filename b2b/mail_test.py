@@ -7,7 +7,14 @@ import pytest
 from anymail.message import AnymailRecipientStatus, AnymailStatus
 from django.test import override_settings
 
-from b2b.mail import EnrollmentCodeAssignmentMessage, send_email_helper
+from b2b.factories import ContractPageFactory
+from b2b.mail import (
+    EnrollmentCodeAssignmentMessage,
+    send_email_helper,
+    send_enrollment_code_assignment_email,
+)
+from b2b.models import DiscountContractAttachmentRedemption
+from ecommerce.factories import DiscountFactory
 
 pytestmark = [pytest.mark.django_db]
 
@@ -124,3 +131,125 @@ def test_send_email_helper_logs_and_returns_none_on_send_error(mocker):
 
     assert message_id is None
     patched_logger.exception.assert_called_once()
+
+
+@pytest.fixture
+def contract_assignments():
+    """Create assignments for a contract, with one email assigned two codes."""
+    contract = ContractPageFactory.create()
+    emails = ["learner1@example.com", "learner2@example.com", "LEARNER1@example.com"]
+    return contract, [
+        DiscountContractAttachmentRedemption.objects.create(
+            discount=DiscountFactory.create(),
+            contract=contract,
+            assigned_email=email,
+        )
+        for email in emails
+    ]
+
+
+def make_fake_batch_messages(mocker, send_side_effect=None):
+    """Patch message creation to return fake batch messages, one per create call."""
+    messages = []
+
+    def _create(**kwargs):
+        message = MagicMock()
+        message.to = kwargs["to"]
+        message.anymail_status = AnymailStatus()
+        message.anymail_status.set_recipient_status(
+            {
+                email: AnymailRecipientStatus(
+                    message_id=f"<batch-{len(messages)}>", status="queued"
+                )
+                for email in kwargs["to"]
+            }
+        )
+        if send_side_effect is not None:
+            message.send.side_effect = send_side_effect
+        messages.append(message)
+        return message
+
+    patched_create = mocker.patch.object(
+        EnrollmentCodeAssignmentMessage, "create", side_effect=_create
+    )
+    return patched_create, messages
+
+
+@override_settings(
+    MITOL_MAIL_CONNECTION_BACKEND=MAILGUN_BACKEND,
+    MITOL_MAIL_RECIPIENT_OVERRIDE=None,
+    MIT_LEARN_ATTACH_URL="https://learn.mit.edu/enrollmentcode/",
+)
+def test_send_enrollment_code_assignment_email_batches(mocker, contract_assignments):
+    """With mailgun, assignments go out as batch sends with recipient variables."""
+    contract, assignments = contract_assignments
+    patched_helper = mocker.patch("b2b.mail.send_email_helper")
+    patched_create, messages = make_fake_batch_messages(mocker)
+
+    assert send_enrollment_code_assignment_email(
+        [assignment.id for assignment in assignments]
+    ) == (3, 0)
+
+    patched_helper.assert_not_called()
+    # The same address can't appear twice in a batch, so it takes two sends
+    assert [message.to for message in messages] == [
+        ["learner1@example.com", "learner2@example.com"],
+        ["LEARNER1@example.com"],
+    ]
+    template_context = patched_create.call_args.kwargs["template_context"]
+    assert template_context["code"] == "%recipient.code%"
+    assert template_context["code_url"] == "%recipient.code_url%"
+    assert template_context["contract_name"] == contract.name
+    code = assignments[1].discount.discount_code
+    assert messages[0].merge_data["learner2@example.com"] == {
+        "code": code,
+        "code_url": f"https://learn.mit.edu/enrollmentcode/{code}",
+    }
+
+    for assignment, message_id in zip(assignments, ["batch-0", "batch-0", "batch-1"]):
+        assignment.refresh_from_db()
+        assert assignment.email_message_id == message_id
+        assert assignment.last_reminder_sent_on is not None
+
+
+@override_settings(
+    MITOL_MAIL_CONNECTION_BACKEND=MAILGUN_BACKEND,
+    MITOL_MAIL_RECIPIENT_OVERRIDE=None,
+)
+def test_send_enrollment_code_assignment_email_batch_error(
+    mocker, contract_assignments
+):
+    """A failed batch send is logged and leaves its assignments unsent."""
+    _, assignments = contract_assignments
+    make_fake_batch_messages(mocker, send_side_effect=ConnectionError("boom"))
+    patched_logger = mocker.patch("b2b.mail.log")
+
+    assert send_enrollment_code_assignment_email(
+        [assignment.id for assignment in assignments]
+    ) == (0, 3)
+
+    assert patched_logger.exception.call_count == 2
+    assert not DiscountContractAttachmentRedemption.objects.exclude(
+        email_message_id=""
+    ).exists()
+
+
+@override_settings(MITOL_MAIL_CONNECTION_BACKEND=SMTP_BACKEND)
+def test_send_enrollment_code_assignment_email_individually(
+    mocker, contract_assignments
+):
+    """Other backends send each assignment email on its own."""
+    _, assignments = contract_assignments
+    patched_helper = mocker.patch(
+        "b2b.mail.send_email_helper", side_effect=["id-1", None, "id-3"]
+    )
+
+    assert send_enrollment_code_assignment_email(
+        [assignment.id for assignment in assignments]
+    ) == (2, 1)
+
+    assert patched_helper.call_count == len(assignments)
+    assert [
+        record.email_message_id
+        for record in DiscountContractAttachmentRedemption.objects.order_by("id")
+    ] == ["id-1", "", "id-3"]
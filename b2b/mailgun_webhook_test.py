@@ -52,6 +52,7 @@ def _build_payload(  # noqa: PLR0913
     signature=None,
     signing_secret=SIGNING_SECRET,
     severity=None,
+    recipient=None,
 ):
     """Build a Mailgun-shaped webhook payload for tests."""
 
@@ -63,6 +64,8 @@ def _build_payload(  # noqa: PLR0913
     }
     if severity is not None:
         event_data["severity"] = severity
+    if recipient is not None:
+        event_data["recipient"] = recipient
 
     return {
         "signature": {
@@ -285,6 +288,31 @@ class TestProcessMailgunWebhookForEnrollmentCodeEmails:
         assert assignment.email_status == EMAIL_STATUS_FAILED
         assert assignment.email_status_event_timestamp is not None
 
+    @override_settings(
+        MAILGUN_WEBHOOK_VALIDATE_SIGNATURE=True,
+        MAILGUN_WEBHOOK_SIGNING_SECRET=SIGNING_SECRET,
+    )
+    def test_matches_batch_send_recipient(self, assignment):
+        """Batch sends share a message ID, so the event's recipient picks the assignment."""
+        other_assignment = DiscountContractAttachmentRedemption.objects.create(
+            discount=DiscountFactory.create(),
+            contract=assignment.contract,
+            assigned_email="other.learner@example.com",
+            email_message_id=assignment.email_message_id,
+        )
+        payload = _build_payload(
+            message_id=assignment.email_message_id,
+            recipient="Other.Learner@example.com",
+        )
+
+        result = process_mailgun_webhook_for_enrollment_code_emails(payload)
+
+        assert result == other_assignment
+        assignment.refresh_from_db()
+        other_assignment.refresh_from_db()
+        assert assignment.email_status == ""
+        assert other_assignment.email_status == EMAIL_STATUS_DELIVERED
+
     @override_settings(
         MAILGUN_WEBHOOK_VALIDATE_SIGNATURE=True,
         MAILGUN_WEBHOOK_SIGNING_SECRET=SIGNING_SECRET,
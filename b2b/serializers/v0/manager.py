@@ -5,6 +5,7 @@ from datetime import datetime
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from b2b.email_jobs import EMAIL_JOB_STATUS_COMPLETE, EMAIL_JOB_STATUS_IN_PROGRESS
 from b2b.models import (
     EMAIL_STATUS_ACCEPTED,
     EMAIL_STATUS_PENDING,
@@ -293,6 +294,25 @@ class BulkAssignResultSerializer(serializers.Serializer):
         child=BulkAssignErrorSerializer(),
         help_text="Records that could not be assigned, with a 'detail' explanation.",
     )
+    email_job_id = serializers.CharField(
+        allow_null=True,
+        help_text="ID of the job sending the invite emails, for polling its progress. Null if no codes were assigned.",
+    )
+
+
+class BulkAssignEmailJobSerializer(serializers.Serializer):
+    """Serializer for the progress of a bulk_assign invite email job."""
+
+    job_id = serializers.CharField()
+    total = serializers.IntegerField(help_text="Number of emails the job will send.")
+    sent = serializers.IntegerField(help_text="Number of emails sent so far.")
+    failed = serializers.IntegerField(
+        help_text="Number of emails that could not be sent."
+    )
+    status = serializers.ChoiceField(
+        choices=[EMAIL_JOB_STATUS_IN_PROGRESS, EMAIL_JOB_STATUS_COMPLETE]
+    )
+    created_on = serializers.DateTimeField()
 
 
 class SendTestEmailSerializer(serializers.Serializer):
@@ -1,14 +1,19 @@
 """Google Sheets integration code for B2B."""
 
 import logging
+from itertools import chain, count, groupby
 
 from django.db.models import Count
 from django.utils.functional import cached_property
+from mitol.common.utils.collections import chunks
 from mitol.google_sheets.api import get_authorized_pygsheets_client
 from mitol.google_sheets.constants import GOOGLE_SHEET_FIRST_ROW
 from mitol.google_sheets.sheet_handler_api import SheetHandler
 
-from b2b.constants import CONTRACT_MEMBERSHIP_AUTOS
+from b2b.constants import (
+    CONTRACT_MEMBERSHIP_AUTOS,
+    ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE,
+)
 from b2b.models import ContractPage
 from ecommerce.constants import REDEMPTION_TYPE_UNLIMITED
 from ecommerce.models import Discount
@@ -140,27 +145,118 @@ class ContractEnrollmentCodesSheetHandler(SheetHandler):
 
         self._write_row(self.row_zero, self.default_columns)
 
+    def _write_rows(self, row: int, rows: list[list]):
+        """
+        Write a block of consecutive rows starting at the specified location.
+
+        This sends the rows as range updates rather than a call per row, so
+        writing out a large contract stays within the Sheets API quota.
+        """
+
+        for offset, chunk in enumerate(
+            chunks(rows, chunk_size=ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE)
+        ):
+            self.worksheet.update_values(
+                crange=f"A{row + offset * ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE}",
+                values=chunk,
+            )
+
+    def _write_scattered_rows(self, rows_by_location: dict[int, list]):
+        """
+        Write rows to arbitrary locations in the sheet.
+
+        Runs of consecutive rows are collapsed into a single range, and the
+        ranges are sent in batched value updates.
+        """
+
+        locations = sorted(rows_by_location)
+        blocks = [
+            [location for _, location in run]
+            for _, run in groupby(
+                enumerate(locations), key=lambda item: item[1] - item[0]
+            )
+        ]
+
+        for block_chunk in chunks(
+            blocks, chunk_size=ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE
+        ):
+            self.worksheet.update_values_batch(
+                [f"A{block[0]}" for block in block_chunk],
+                [
+                    [rows_by_location[location] for location in block]
+                    for block in block_chunk
+                ],
+            )
+
+    def _get_code_locations(self) -> tuple[dict[str, int], list[int], int]:
+        """
+        Read the data rows once and map the codes in them to their rows.
+
+        As with _write_row, a row only counts as blank if all of the default
+        columns are empty, so a row the customer has written notes in isn't
+        reused for a new code.
+
+        Returns a tuple of the mapping, the blank rows within the written data,
+        and the first row past the end of it. New codes should go into the blank
+        rows first, then after the end.
+        """
+
+        data_rows = self.worksheet.get_values(
+            start=(self.row_one, 1),
+            end=(self.worksheet.rows, len(self.default_columns)),
+            include_tailing_empty=False,
+            include_tailing_empty_rows=False,
+        )
+        locations = {}
+        blank_rows = []
+
+        for row, cells in enumerate(data_rows, self.row_one):
+            if not any(cells[: len(self.default_columns)]):
+                blank_rows.append(row)
+                continue
+
+            value = cells[0]
+            if not value:
+                continue
+
+            if value in locations:
+                msg = f"Code {value} seems to be in the sheet more than once: ({locations[value]},1),({row},1)"
+                raise ValueError(msg)
+
+            locations[value] = row
+
+        return locations, blank_rows, self.row_one + len(data_rows)
+
     def _get_discount_cells(self, discount: Discount) -> list:
-        """Format the discount for the sheet"""
+        """
+        Format the discount for the sheet
+
+        This works from the prefetched contract redemptions (see
+        _get_sorted_codes) so it doesn't cost any queries per code.
+        """
+
+        redemptions = list(discount.contract_redemptions.all())
+        last_redemption = (
+            max(redemptions, key=lambda redemption: redemption.pk)
+            if redemptions
+            else None
+        )
 
         redemption_date = ""
         redeemed_by = ""
         redeemed_on = ""
 
-        if (
-            discount.redemption_type != REDEMPTION_TYPE_UNLIMITED
-            and discount.contract_redemptions.count() > 0
-        ):
-            redemption_date = str(discount.contract_redemptions.last().created_on)
+        if last_redemption:
+            redeemed_by = last_redemption.user.email
+            redeemed_on = str(last_redemption.created_on)
 
-        if discount.contract_redemptions.exists():
-            redeemed_by = discount.contract_redemptions.last().user.email
-            redeemed_on = str(discount.contract_redemptions.last().created_on)
+            if discount.redemption_type != REDEMPTION_TYPE_UNLIMITED:
+                redemption_date = redeemed_on
 
         return [
             discount.discount_code,
             discount.redemption_type,
-            discount.contract_redemptions.count(),
+            len(redemptions),
             str(discount.expiration_date)
             if discount.expiration_date
             else redemption_date,
@@ -196,22 +292,18 @@ class ContractEnrollmentCodesSheetHandler(SheetHandler):
 
         self.ensure_header()
 
-        row_idx = self.row_one
-        codes = []
-
-        for code in self._get_sorted_codes():
-            col = self._get_discount_cells(code)
+        codes = list(self._get_sorted_codes())
 
+        for row_idx, code in enumerate(codes, self.row_one):
             code.b2b_sheet_location = row_idx
-            codes.append(code)
-
-            self._write_row(row_idx, col)
 
-            row_idx += 1
+        self._write_rows(
+            self.row_one, [self._get_discount_cells(code) for code in codes]
+        )
 
         Discount.objects.bulk_update(codes, {"b2b_sheet_location"})
 
-        return row_idx - self.row_one
+        return len(codes)
 
     def check_code(self, discount: Discount, *, no_update: bool = False) -> int:
         """Check for the given enrollment code in the sheet."""
@@ -273,19 +365,27 @@ class ContractEnrollmentCodesSheetHandler(SheetHandler):
         probably edit it. So, when we need to refresh the entire sheet, we need
         to take care to not move the codes around so we don't muck up any of the
         data the customer's put into the sheet.
-        """
 
-        row_idx = self.row_one
-        codes = []
+        The data rows are read once to find where each code lives and which
+        rows are blank; codes already in the sheet are rewritten in place and
+        new codes fill the blank rows, then go after the end of the data.
+        """
 
-        for code in self._get_sorted_codes():
-            row = self.update_code(code, no_update=True)
+        code_locations, blank_rows, next_row = self._get_code_locations()
+        free_rows = chain(blank_rows, count(next_row))
+        codes = list(self._get_sorted_codes())
+        rows_by_location = {}
 
-            code.b2b_sheet_location = row
-            codes.append(code)
+        for code in codes:
+            if code.discount_code in code_locations:
+                code.b2b_sheet_location = code_locations[code.discount_code]
+            else:
+                code.b2b_sheet_location = next(free_rows)
+            rows_by_location[code.b2b_sheet_location] = self._get_discount_cells(code)
 
-            row_idx += 1
+        if rows_by_location:
+            self._write_scattered_rows(rows_by_location)
 
         Discount.objects.bulk_update(codes, {"b2b_sheet_location"})
 
-        return row_idx - self.row_one
+        return len(codes)
@@ -275,12 +275,72 @@ def test_write_row(
 def test_write_codes(contract_with_sheet_courseruns_handler_mocks):
     """Test that destructively writing the codes works as expected."""
 
-    _, _, handler = contract_with_sheet_courseruns_handler_mocks
+    contract, _, handler = contract_with_sheet_courseruns_handler_mocks
+    handler.worksheet.update_values = MagicMock()
+
+    assert handler.write_codes() == contract.max_learners
+
+    sorted_codes = handler._get_sorted_codes()
+    handler.worksheet.update_row.assert_not_called()
+    handler.worksheet.update_values.assert_called_once_with(
+        crange=f"A{handler.row_one}",
+        values=[handler._get_discount_cells(code) for code in sorted_codes],
+    )
+
+    code = sorted_codes[4]
+    code.refresh_from_db()
+    assert int(code.b2b_sheet_location) == handler.row_one + 4
+
+
+def test_write_codes_chunked(mocker, contract_with_sheet_courseruns_handler_mocks):
+    """Test that large code sets are written in a few range updates."""
+
+    contract, _, handler = contract_with_sheet_courseruns_handler_mocks
+    mocker.patch("b2b.sheets.ENROLLMENT_CODE_SHEET_WRITE_CHUNK_SIZE", 4)
+    handler.worksheet.update_values = MagicMock()
 
     handler.write_codes()
 
-    test_cells = handler._get_discount_cells(handler._get_sorted_codes()[4])
-    handler.worksheet.update_row.assert_any_call(ANY, test_cells)
+    expected_calls = -(-contract.max_learners // 4)
+    assert handler.worksheet.update_values.call_count == expected_calls
+    assert [
+        call.kwargs["crange"] for call in handler.worksheet.update_values.mock_calls
+    ] == [f"A{handler.row_one + idx * 4}" for idx in range(expected_calls)]
+
+
+def test_discount_cells_use_prefetch(
+    django_assert_num_queries, contract_with_sheet_courseruns
+):
+    """Test that formatting the codes doesn't query per code."""
+
+    contract, _ = contract_with_sheet_courseruns
+    users = UserFactory.create_batch(2)
+    discount = contract.get_discounts().first()
+
+    for user in users:
+        DiscountContractAttachmentRedemption.objects.create(
+            contract=contract,
+            user=user,
+            discount=discount,
+        )
+
+    handler = ContractEnrollmentCodesSheetHandler(contract)
+    sorted_codes = list(handler._get_sorted_codes())
+
+    with django_assert_num_queries(0):
+        cells = [handler._get_discount_cells(code) for code in sorted_codes]
+
+    last_redemption = discount.contract_redemptions.last()
+    assert cells[0] == [
+        discount.discount_code,
+        discount.redemption_type,
+        2,
+        str(discount.expiration_date)
+        if discount.expiration_date
+        else str(last_redemption.created_on),
+        last_redemption.user.email,
+        str(last_redemption.created_on),
+    ]
 
 
 class FakeCell:
@@ -365,17 +425,69 @@ def test_check_codes_expected_loc(contract_with_sheet_courseruns_handler_mocks):
 
 def test_update_sheet(contract_with_sheet_courseruns_handler_mocks):
     """
-    Test that update_sheet works as expected.
+    Test that update_sheet rewrites codes in place and adds missing ones.
 
-    The internals of this get exercised more in earlier tests, so this is pretty
-    simple.
+    The data rows are read once; codes already in the sheet are written back to
+    their rows, and the rest fill the blank rows and then go after the end of
+    the data, with a batched update.
     """
 
     contract, _, handler = contract_with_sheet_courseruns_handler_mocks
+    sorted_codes = list(handler._get_sorted_codes())
+    in_sheet = sorted_codes[:3]
+
+    # Three existing codes with a blank row between the second and third, then
+    # a row with no code but with notes in it, which isn't blank.
+    data_rows = [
+        [in_sheet[0].discount_code, "single-use"],
+        [in_sheet[1].discount_code],
+        [],
+        [in_sheet[2].discount_code],
+        ["", "", "", "", "", "customer notes"],
+    ]
+
+    handler.worksheet.get_values = MagicMock(return_value=data_rows)
+    handler.worksheet.update_values = MagicMock()
+    handler.worksheet.update_values_batch = MagicMock()
+    handler.worksheet.find = MagicMock()
+
+    assert handler.update_sheet() == contract.max_learners
+
+    handler.worksheet.get_values.assert_called_once()
+    handler.worksheet.get_row.assert_not_called()
+    handler.worksheet.find.assert_not_called()
+    handler.worksheet.update_row.assert_not_called()
+    handler.worksheet.update_values.assert_not_called()
+
+    tail_row = handler.row_one + len(data_rows)
+    handler.worksheet.update_values_batch.assert_called_once_with(
+        [f"A{handler.row_one}", f"A{tail_row}"],
+        [
+            [
+                handler._get_discount_cells(in_sheet[0]),
+                handler._get_discount_cells(in_sheet[1]),
+                handler._get_discount_cells(sorted_codes[3]),
+                handler._get_discount_cells(in_sheet[2]),
+            ],
+            [handler._get_discount_cells(code) for code in sorted_codes[4:]],
+        ],
+    )
+
+    sorted_codes[3].refresh_from_db()
+    assert int(sorted_codes[3].b2b_sheet_location) == handler.row_one + 2
+    sorted_codes[4].refresh_from_db()
+    assert int(sorted_codes[4].b2b_sheet_location) == tail_row
+
+
+def test_update_sheet_duplicate_code(contract_with_sheet_courseruns_handler_mocks):
+    """Test that update_sheet refuses to write when a code appears twice."""
+
+    _, _, handler = contract_with_sheet_courseruns_handler_mocks
+    code = handler._get_sorted_codes()[0]
 
-    handler.update_code = MagicMock(
-        side_effect=list(range(1, contract.max_learners + 1))
+    handler.worksheet.get_values = MagicMock(
+        return_value=[[code.discount_code], [code.discount_code]]
     )
 
-    handler.update_sheet()
-    assert handler.update_code.call_count == contract.max_learners
+    with pytest.raises(ValueError, match="more than once"):
+        handler.update_sheet()
@@ -3,9 +3,13 @@
 
 import logging
 
+import celery
 from django.core.cache import cache
 from django.db.models import Q
+from mitol.common.utils.collections import chunks
 
+from b2b.constants import ENROLLMENT_CODE_EMAIL_CHUNK_SIZE
+from b2b.email_jobs import record_assignment_email_job_progress
 from b2b.mail import (
     send_enrollment_code_assignment_email,
     send_test_enrollment_code_assignment_email,
@@ -211,8 +215,42 @@ def queue_update_all_contract_enrollment_sheets():
 
 
 @app.task()
-def queue_send_enrollment_code_assignment_email(assignment_record_ids: list[int]):
-    send_enrollment_code_assignment_email(assignment_record_ids)
+def send_enrollment_code_assignment_email_chunk(
+    assignment_record_ids: list[int], job_id: str | None = None
+):
+    """Send the assignment emails for a chunk of records and record the job progress."""
+    # If sending fails outright, count the whole chunk as failed so the job
+    # still finishes
+    sent, failed = 0, len(assignment_record_ids)
+    try:
+        sent, failed = send_enrollment_code_assignment_email(assignment_record_ids)
+    finally:
+        if job_id:
+            record_assignment_email_job_progress(job_id, sent=sent, failed=failed)
+
+
+@app.task(bind=True)
+def queue_send_enrollment_code_assignment_email(
+    self, assignment_record_ids: list[int], job_id: str | None = None
+):
+    """
+    Send enrollment code assignment emails, splitting large sets into parallel chunks.
+
+    Args:
+        assignment_record_ids (list[int]): DiscountContractAttachmentRedemption IDs to send emails for
+        job_id (str or None): The email job to record progress against, if any
+    """
+    if len(assignment_record_ids) <= ENROLLMENT_CODE_EMAIL_CHUNK_SIZE:
+        send_enrollment_code_assignment_email_chunk(assignment_record_ids, job_id)
+        return
+
+    chunked_tasks = [
+        send_enrollment_code_assignment_email_chunk.s(chunk, job_id)
+        for chunk in chunks(
+            assignment_record_ids, chunk_size=ENROLLMENT_CODE_EMAIL_CHUNK_SIZE
+        )
+    ]
+    raise self.replace(celery.group(chunked_tasks))
 
 
 @app.task()
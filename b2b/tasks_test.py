@@ -6,6 +6,8 @@ from b2b.api import create_contract_run_key
 from b2b.factories import ContractPageFactory, OrganizationPageFactory
 from b2b.tasks import (
     create_program_contract_runs,
+    queue_send_enrollment_code_assignment_email,
+    send_enrollment_code_assignment_email_chunk,
 )
 from courses.factories import CourseFactory, CourseRunFactory, ProgramFactory
 from courses.models import ProgramRequirement, ProgramRequirementNodeType
@@ -353,3 +355,57 @@ def test_create_program_contract_runs_logging_output(mocker):
     assert final_call[0][3] == 1
     assert final_call[0][4] == 0
     assert final_call[0][5] == 0
+
+
+def test_queue_send_enrollment_code_assignment_email_single_chunk(mocker):
+    """Small assignment sets are sent in the task itself."""
+    mock_send = mocker.patch(
+        "b2b.tasks.send_enrollment_code_assignment_email", return_value=(2, 1)
+    )
+    mock_progress = mocker.patch("b2b.tasks.record_assignment_email_job_progress")
+    mock_replace = mocker.patch("celery.app.task.Task.replace", autospec=True)
+
+    queue_send_enrollment_code_assignment_email.delay([1, 2, 3], job_id="job")
+
+    mock_send.assert_called_once_with([1, 2, 3])
+    mock_progress.assert_called_once_with("job", sent=2, failed=1)
+    mock_replace.assert_not_called()
+
+
+def test_send_enrollment_code_assignment_email_chunk_failure(mocker):
+    """A chunk that fails outright should be recorded as failed against the job."""
+    mocker.patch(
+        "b2b.tasks.send_enrollment_code_assignment_email",
+        side_effect=ConnectionError,
+    )
+    mock_progress = mocker.patch("b2b.tasks.record_assignment_email_job_progress")
+
+    with pytest.raises(ConnectionError):
+        send_enrollment_code_assignment_email_chunk([1, 2, 3], job_id="job")
+
+    mock_progress.assert_called_once_with("job", sent=0, failed=3)
+
+
+def test_queue_send_enrollment_code_assignment_email_chunks(mocker):
+    """Large assignment sets are split into parallel chunk tasks."""
+    mocker.patch("b2b.tasks.ENROLLMENT_CODE_EMAIL_CHUNK_SIZE", 2)
+    mock_send = mocker.patch("b2b.tasks.send_enrollment_code_assignment_email")
+    mock_replace = mocker.patch(
+        "celery.app.task.Task.replace", autospec=True, side_effect=TabError
+    )
+    mock_group = mocker.patch("celery.group", autospec=True)
+    mock_chunk_task = mocker.patch(
+        "b2b.tasks.send_enrollment_code_assignment_email_chunk.s"
+    )
+
+    with pytest.raises(TabError):
+        queue_send_enrollment_code_assignment_email.delay([1, 2, 3, 4, 5], job_id="job")
+
+    assert mock_chunk_task.call_args_list == [
+        mocker.call([1, 2], "job"),
+        mocker.call([3, 4], "job"),
+        mocker.call([5], "job"),
+    ]
+    mock_group.assert_called_once_with([mock_chunk_task.return_value] * 3)
+    mock_replace.assert_called_once()
+    mock_send.assert_not_called()
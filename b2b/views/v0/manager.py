@@ -25,6 +25,7 @@ from rest_framework_extensions.mixins import NestedViewSetMixin
 
 from b2b.api import _create_discount_with_product, is_potentially_valid_mailgun_webhook
 from b2b.constants import CONTRACT_MEMBERSHIP_AUTOS
+from b2b.email_jobs import create_assignment_email_job, get_assignment_email_job
 from b2b.models import (
     EMAIL_STATUS_FAILED,
     EMAIL_STATUS_PENDING,
@@ -42,6 +43,7 @@ from b2b.serializers.v0 import (
 )
 from b2b.serializers.v0.manager import (
     AssignRevokeCodeRequestSerializer,
+    BulkAssignEmailJobSerializer,
     BulkAssignRequestSerializer,
     BulkAssignResultSerializer,
     DetailErrorSerializer,
@@ -86,8 +88,14 @@ def clear_assignment_email_deliverability_fields(assignment):
 
 
 def assign_codes_and_send_emails(
-    assignments: list[CodeAssignment], assigning_user
+    assignments: list[CodeAssignment], assigning_user, email_job_id=None
 ) -> bool:
+    """
+    Create the assignment records and queue the invite emails for them.
+
+    If email_job_id is set, the emails are tracked as a job under that ID so the
+    manager dashboard can poll their progress.
+    """
     # If we're passed an empty list, short circuit and return true
     # This can happen in bulk_assign if all users in the payload have already
     # been assigned or redeemed a code for the contract
@@ -122,8 +130,18 @@ def assign_codes_and_send_emails(
         log.exception("Error creating code assignments")
         return False
 
+    if email_job_id:
+        try:
+            create_assignment_email_job(
+                email_job_id, assignments[0].contract.id, len(assignment_records)
+            )
+        except Exception:
+            # The codes are already assigned, so the emails still need to go out
+            # even if their progress can't be tracked
+            log.exception("Error creating enrollment code email job %s", email_job_id)
+
     queue_send_enrollment_code_assignment_email.delay(
-        [record.id for record in assignment_records]
+        [record.id for record in assignment_records], job_id=email_job_id
     )
 
     return True
@@ -788,7 +806,10 @@ class ManagerContractViewSet(NestedViewSetMixin, viewsets.ReadOnlyModelViewSet):
                     {"email": email, "name": name, "detail": "No available code."}
                 )
 
-        success = assign_codes_and_send_emails(assignments, request.user)
+        email_job_id = str(uuid.uuid4()) if assignments else None
+        success = assign_codes_and_send_emails(
+            assignments, request.user, email_job_id=email_job_id
+        )
         if not success:
             return Response(
                 {"detail": "Error assigning codes."},
@@ -801,10 +822,52 @@ class ManagerContractViewSet(NestedViewSetMixin, viewsets.ReadOnlyModelViewSet):
                     [a.discount for a in assignments], many=True
                 ).data,
                 "errors": errors,
+                "email_job_id": email_job_id,
             },
             status=http_status.HTTP_200_OK,
         )
 
+    @extend_schema(
+        description="Get the progress of the invite emails for a bulk assignment.",
+        responses={
+            200: BulkAssignEmailJobSerializer,
+            404: DetailErrorSerializer,
+        },
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                type=str,
+                location=OpenApiParameter.PATH,
+                description="The email_job_id returned by bulk_assign.",
+                required=True,
+            ),
+        ],
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="codes/bulk_assign/jobs/(?P<job_id>[^/.]+)",
+    )
+    def bulk_assign_email_job(self, request, **kwargs):  # noqa: ARG002
+        """
+        Get the progress of a bulk assignment's invite emails.
+
+        GET /api/v0/b2b/orgs/{org_id}/manager/contracts/{contract_id}/codes/bulk_assign/jobs/{job_id}/
+        """
+        contract = self.get_object()
+
+        job = get_assignment_email_job(kwargs.get("job_id"))
+        if not job or job["contract_id"] != contract.id:
+            return Response(
+                {"detail": "Email job not found for this contract."},
+                status=http_status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            BulkAssignEmailJobSerializer(job).data,
+            status=http_status.HTTP_200_OK,
+        )
+
     @extend_schema(
         description="Reassign the assignment for a specific enrollment code",
         request=AssignRevokeCodeRequestSerializer,
@@ -11,6 +11,7 @@ from rest_framework.test import APIClient
 
 from b2b.api import ensure_enrollment_codes_exist
 from b2b.constants import CONTRACT_MEMBERSHIP_CODE
+from b2b.email_jobs import EMAIL_JOB_STATUS_IN_PROGRESS, create_assignment_email_job
 from b2b.factories import ContractPageFactory
 from b2b.models import (
     EMAIL_STATUS_DELIVERED,
@@ -870,7 +871,7 @@ def test_assign_code(org_setup, manager_drf_client, mocker):
         discount=discount, assigned_email="learner@example.com"
     )
     assert redemption.assigned_name == "Test Learner"
-    mock_task.delay.assert_called_once_with([redemption.id])
+    mock_task.delay.assert_called_once_with([redemption.id], job_id=None)
 
     resp_data = resp.json()
     assert resp_data["code"] == code
@@ -1402,6 +1403,24 @@ def test_bulk_assign(org_setup, manager_drf_client, mocker):
     assert len(resp_data["assigned"]) == 3
     assert len(resp_data["errors"]) == 0
     mock_task.delay.assert_called_once()
+    assert resp_data["email_job_id"]
+    assert mock_task.delay.call_args.kwargs["job_id"] == resp_data["email_job_id"]
+
+    job_url = reverse(
+        "b2b:b2b-manager-org-contract-bulk-assign-email-job",
+        kwargs={
+            "parent_lookup_organization": contract_1.organization.id,
+            "pk": contract_1.id,
+            "job_id": resp_data["email_job_id"],
+        },
+    )
+    job_resp = manager_drf_client.get(job_url)
+
+    assert job_resp.status_code == status.HTTP_200_OK
+    job_data = job_resp.json()
+    assert job_data["job_id"] == resp_data["email_job_id"]
+    assert (job_data["total"], job_data["sent"], job_data["failed"]) == (3, 0, 0)
+    assert job_data["status"] == EMAIL_JOB_STATUS_IN_PROGRESS
 
     assigned_emails = {code["assigned_to"] for code in resp_data["assigned"]}
     assert assigned_emails == {
@@ -1423,6 +1442,54 @@ def test_bulk_assign(org_setup, manager_drf_client, mocker):
     )
 
 
+def test_bulk_assign_email_job_redis_failure(org_setup, manager_drf_client, mocker):
+    """If the email job can't be created, the codes are still assigned and emailed."""
+    mock_task = mocker.patch(
+        "b2b.views.v0.manager.queue_send_enrollment_code_assignment_email"
+    )
+    mocker.patch(
+        "b2b.views.v0.manager.create_assignment_email_job",
+        side_effect=ConnectionError,
+    )
+    _, _, (contract_1, *_), *_ = org_setup
+
+    resp = manager_drf_client.post(
+        reverse(
+            "b2b:b2b-manager-org-contract-bulk-assign",
+            kwargs={
+                "parent_lookup_organization": contract_1.organization.id,
+                "pk": contract_1.id,
+            },
+        ),
+        data=[{"email": "learner1@example.com", "name": "Learner One"}],
+        format="json",
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.json()["assigned"]) == 1
+    mock_task.delay.assert_called_once()
+
+
+def test_bulk_assign_email_job_not_found(org_setup, manager_drf_client):
+    """The email job endpoint 404s for unknown jobs and jobs from other contracts."""
+    _, _, (contract_1, *_), (contract_2, *_), *_ = org_setup
+    job_id = str(uuid.uuid4())
+    create_assignment_email_job(job_id, contract_2.id, 1)
+
+    for missing_job_id in [job_id, str(uuid.uuid4())]:
+        job_url = reverse(
+            "b2b:b2b-manager-org-contract-bulk-assign-email-job",
+            kwargs={
+                "parent_lookup_organization": contract_1.organization.id,
+                "pk": contract_1.id,
+                "job_id": missing_job_id,
+            },
+        )
+        resp = manager_drf_client.get(job_url)
+
+        assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_bulk_assign_insufficient_codes(org_setup, manager_drf_client, mocker):
     """bulk_assign reports errors for records that exceed the number of available codes."""
     mocker.patch("b2b.views.v0.manager.queue_send_enrollment_code_assignment_email")
@@ -2279,7 +2346,7 @@ def test_assign_codes_and_send_emails_queues_email_with_record_ids(
             assigned_email__in=["learner0@example.com", "learner1@example.com"],
         ).values_list("id", flat=True)
     )
-    mock_email_task.delay.assert_called_once_with(created_ids)
+    mock_email_task.delay.assert_called_once_with(created_ids, job_id=None)
 
 
 def test_assign_codes_and_send_emails_sets_prefetched_redemptions(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import random
+from collections import defaultdict
 from datetime import timedelta
 from typing import Tuple, Union  # noqa: UP035
 from urllib.parse import urlencode, urljoin
@@ -14,7 +15,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.files.base import ContentFile
-from django.db.models import Case, IntegerField, When
+from django.db.models import Case, IntegerField, Prefetch, Q, When
+from django.templatetags.static import static
 from django.utils.text import slugify
 from mitol.common.utils import now_in_utc
 from wagtail.blocks import StreamValue
@@ -26,14 +28,26 @@ from cms import models as cms_models
 from cms import utils as cms_utils
 from cms.constants import (
     CERTIFICATE_INDEX_SLUG,
+    FEATURED_ITEMS_CACHE_VERSION,
+    FEATURED_ITEMS_LOCK_KEY,
+    FEATURED_ITEMS_LOCK_TIMEOUT,
     INSTRUCTOR_INDEX_SLUG,
 )
 from cms.exceptions import WagtailSpecificPageError
 from cms.models import Page
-from courses.models import Course, Program
+from courses.constants import DEFAULT_COURSE_IMG_PATH
+from courses.models import (
+    Course,
+    CourseRun,
+    Program,
+    ProgramRequirement,
+    ProgramRequirementNodeType,
+    RelatedProgram,
+)
 from courses.utils import (
     get_enrollable_courseruns_qs,
 )
+from main.utils import get_learn_product_url
 
 log = logging.getLogger(__name__)
 DEFAULT_HOMEPAGE_PROPS = dict(  # noqa: C408
@@ -547,11 +561,21 @@ def create_featured_items():
         output_field=IntegerField(),
     )
 
-    # Store only course IDs to avoid pickling issues and ensure fresh data on retrieval
+    # Store the rendered card data rather than model instances, to avoid pickling
+    # issues and so a home page hit needs nothing but the cache read.
     # Use timeout=None so the cache never auto-expires; stale data is better than no data.
-    redis_cache.set(
-        cms_utils.get_featured_items_cache_key(), all_course_ids, timeout=None
-    )
+    # The cards are built under the lock too, so a refresh_featured_item that
+    # started earlier can't leave an older card in the new items.
+    with _featured_items_lock():
+        redis_cache.set(
+            cms_utils.get_featured_items_cache_key(),
+            {
+                "version": FEATURED_ITEMS_CACHE_VERSION,
+                "course_ids": all_course_ids,
+                "items": _build_featured_items(all_course_ids),
+            },
+            timeout=None,
+        )
 
     return list(
         Course.objects.filter(id__in=all_course_ids)
@@ -559,3 +583,479 @@ def create_featured_items():
         .prefetch_related("courseruns")
         .order_by(ordering)
     )
+
+
+def _featured_items_lock():
+    """
+    Returns the lock held while the cached featured items are written, so that
+    create_featured_items and refresh_featured_item don't overwrite each other.
+    """
+    return caches["redis"].lock(
+        FEATURED_ITEMS_LOCK_KEY, timeout=FEATURED_ITEMS_LOCK_TIMEOUT
+    )
+
+
+def _build_featured_items(course_ids) -> dict:
+    """
+    Builds the cached home page data for the given courses.
+
+    Args:
+        course_ids (iterable of int): The ids of the courses to build data for
+
+    Returns:
+        dict: Course id to a dict of card (the data the featured product card is
+            rendered from) and enrollment_windows (the enrollment start and end of
+            each live run, to check at read time whether the course is still open
+            for enrollment). Courses that aren't live or have no live page are left out.
+    """
+    courses = (
+        Course.objects.filter(id__in=course_ids, live=True, page__live=True)
+        .select_related("page__feature_image")
+        .prefetch_related(
+            Prefetch(
+                "courseruns",
+                queryset=CourseRun.objects.filter(live=True),
+                to_attr="live_courseruns",
+            )
+        )
+    )
+
+    items = {}
+    for course in courses:
+        page = course.page
+        run = course.first_unexpired_run
+        items[course.id] = {
+            "card": {
+                "title": page.title,
+                "description": page.description,
+                "feature_image_src": (
+                    get_wagtail_img_src(page.feature_image)
+                    if page.feature_image
+                    else static(DEFAULT_COURSE_IMG_PATH)
+                ),
+                "start_date": run.start_date if run is not None else None,
+                "url_path": get_learn_product_url("courses", course.readable_id),
+                "is_program": False,
+                "is_self_paced": run.is_self_paced if run is not None else None,
+                "program_type": None,
+            },
+            "enrollment_windows": [
+                (courserun.enrollment_start, courserun.enrollment_end)
+                for courserun in course.live_courseruns
+            ],
+        }
+    return items
+
+
+def _get_featured_items_payload() -> dict | None:
+    """
+    Returns the cached featured items, or None if there are none.
+
+    Featured items cached by an older release (a list of course ids, or a
+    payload of another version) are rebuilt and stored in the current format
+    under the featured items lock.
+    """
+    payload = caches["redis"].get(cms_utils.get_featured_items_cache_key())
+    if not payload:
+        return None
+    if _is_current_featured_items_payload(payload):
+        return payload
+
+    with _featured_items_lock():
+        return _get_locked_featured_items_payload()
+
+
+def _is_current_featured_items_payload(payload) -> bool:
+    """Returns True if the cached featured items are in the current format"""
+    return (
+        isinstance(payload, dict)
+        and payload.get("version") == FEATURED_ITEMS_CACHE_VERSION
+    )
+
+
+def _get_locked_featured_items_payload() -> dict | None:
+    """
+    Returns the cached featured items like _get_featured_items_payload, for a
+    caller that already holds the featured items lock. The cache is read again
+    under the lock, so a payload written meanwhile isn't overwritten.
+    """
+    redis_cache = caches["redis"]
+    cache_key = cms_utils.get_featured_items_cache_key()
+    payload = redis_cache.get(cache_key)
+    if not payload:
+        return None
+    if _is_current_featured_items_payload(payload):
+        return payload
+
+    course_ids = payload["course_ids"] if isinstance(payload, dict) else payload
+    payload = {
+        "version": FEATURED_ITEMS_CACHE_VERSION,
+        "course_ids": course_ids,
+        "items": _build_featured_items(course_ids),
+    }
+    redis_cache.set(cache_key, payload, timeout=None)
+    return payload
+
+
+def get_featured_product_cards() -> list[dict]:
+    """
+    Returns the cards for the featured products on the home page, from the items
+    cached by create_featured_items, leaving out the courses that are no longer
+    open for enrollment.
+
+    Returns:
+        list of dict: The data to render each featured product card from
+    """
+    payload = _get_featured_items_payload()
+    if payload is None:
+        return []
+
+    now = now_in_utc()
+    cards = []
+    for course_id in payload["course_ids"]:
+        item = payload["items"].get(course_id)
+        if item is not None and any(
+            enrollment_start is not None
+            and enrollment_start <= now
+            and (enrollment_end is None or enrollment_end >= now)
+            for enrollment_start, enrollment_end in item["enrollment_windows"]
+        ):
+            cards.append(item["card"])
+    return cards
+
+
+def refresh_featured_item(course_id: int):
+    """
+    Rebuilds the cached home page data for a featured course after the course,
+    one of its runs or its page changed. A course that can no longer be featured
+    is dropped until it can be again, or until the next create_featured_items.
+
+    Args:
+        course_id (int): The id of the course that changed
+    """
+    with _featured_items_lock():
+        payload = _get_locked_featured_items_payload()
+        if payload is None or course_id not in payload["course_ids"]:
+            return
+
+        items = _build_featured_items([course_id])
+        if course_id in items:
+            payload["items"][course_id] = items[course_id]
+        else:
+            payload["items"].pop(course_id, None)
+        caches["redis"].set(
+            cms_utils.get_featured_items_cache_key(), payload, timeout=None
+        )
+
+
+def is_featured_course(course_id: int) -> bool:
+    """
+    Returns True if the course is one of the cached featured items on the home page
+    """
+    payload = caches["redis"].get(cms_utils.get_featured_items_cache_key())
+    if isinstance(payload, dict):
+        return course_id in payload["course_ids"]
+    return bool(payload) and course_id in payload
+
+
+def get_product_page_data(pages) -> dict:
+    """
+    Loads the financial assistance form URL of each of the given course and
+    program pages, and the current price of each course page, with a fixed
+    number of queries rather than the page serializers' queries per page.
+
+    Args:
+        pages (iterable of CoursePage or ProgramPage): The pages, with their
+            course or program loaded
+
+    Returns:
+        dict: Page id to a dict of financial_assistance_form_url, and
+            current_price for course pages
+    """
+    pages = list(pages)
+    course_pages = [page for page in pages if isinstance(page, cms_models.CoursePage)]
+    program_pages = [page for page in pages if isinstance(page, cms_models.ProgramPage)]
+
+    page_data = {}
+    if course_pages:
+        form_urls = _get_course_page_form_urls(course_pages)
+        current_prices = _get_course_current_prices(
+            [page.course_id for page in course_pages]
+        )
+        for page in course_pages:
+            page_data[page.id] = {
+                "financial_assistance_form_url": form_urls[page.id],
+                "current_price": current_prices.get(page.course_id),
+            }
+    if program_pages:
+        form_urls = _get_program_page_form_urls(program_pages)
+        for page in program_pages:
+            page_data[page.id] = {"financial_assistance_form_url": form_urls[page.id]}
+    return page_data
+
+
+def _get_financial_assistance_url(page, form) -> str:
+    """Returns the URL of a financial assistance form shown under the given page"""
+    return f"{page.get_url()}{form.slug}/" if page and form and form.slug else ""
+
+
+def _get_live_child_forms(pages) -> dict:
+    """
+    Returns the first live financial assistance form directly under each of the
+    given pages, keyed by page id.
+    """
+    pages_by_path = {page.path: page for page in pages}
+    if not pages_by_path:
+        return {}
+
+    children = Q()
+    for page in pages_by_path.values():
+        children |= Q(path__startswith=page.path, depth=page.depth + 1)
+    forms = {}
+    for form in (
+        cms_models.FlexiblePricingRequestForm.objects.live()
+        .filter(children)
+        .order_by("path")
+    ):
+        forms.setdefault(pages_by_path[form.path[: -Page.steplen]].id, form)
+    return forms
+
+
+def _get_live_forms_for_programs(program_ids) -> list:
+    """Returns the live financial assistance forms for the given programs, in page tree order"""
+    return list(
+        cms_models.FlexiblePricingRequestForm.objects.filter(
+            selected_program_id__in=program_ids
+        )
+        .live()
+        .order_by("path")
+    )
+
+
+def _get_related_program_ids(program_ids) -> dict:
+    """Returns the ids of the programs related to each of the given programs"""
+    related_program_ids = defaultdict(set)
+    for first_program_id, second_program_id in RelatedProgram.objects.filter(
+        Q(first_program_id__in=program_ids) | Q(second_program_id__in=program_ids)
+    ).values_list("first_program_id", "second_program_id"):
+        related_program_ids[first_program_id].add(second_program_id)
+        related_program_ids[second_program_id].add(first_program_id)
+    return related_program_ids
+
+
+def _get_program_pages(program_ids) -> dict:
+    """Returns the page of each of the given programs that has one, keyed by program id"""
+    return {
+        page.program_id: page
+        for page in cms_models.ProgramPage.objects.filter(
+            program_id__in=program_ids
+        ).select_related("program")
+    }
+
+
+def _get_course_page_form_urls(course_pages) -> dict:
+    """
+    Returns the financial assistance form URL of each of the given course pages,
+    keyed by page id, as CoursePageSerializer finds it: through the course's
+    programs first, then a form for the course, then a form under the page.
+    """
+    course_ids = [page.course_id for page in course_pages]
+    program_ids_by_course = defaultdict(list)
+    for course_id, program_id in (
+        ProgramRequirement.objects.filter(
+            node_type=ProgramRequirementNodeType.COURSE, course_id__in=course_ids
+        )
+        .values_list("course_id", "program_id")
+        .distinct()
+        .order_by("course_id", "program_id")
+    ):
+        program_ids_by_course[course_id].append(program_id)
+
+    related_program_ids = _get_related_program_ids(
+        {
+            program_id
+            for program_ids in program_ids_by_course.values()
+            for program_id in program_ids
+        }
+    )
+    all_program_ids_by_course = {
+        course_id: set(program_ids).union(
+            *(related_program_ids[program_id] for program_id in program_ids)
+        )
+        for course_id, program_ids in program_ids_by_course.items()
+    }
+    all_program_ids = set().union(*all_program_ids_by_course.values())
+    program_pages = _get_program_pages(all_program_ids)
+    program_forms = _get_live_forms_for_programs(all_program_ids)
+
+    first_program_pages = {}
+    for course_id, program_ids in program_ids_by_course.items():
+        pages = [
+            program_pages[program_id]
+            for program_id in program_ids
+            if program_id in program_pages
+        ]
+        if pages:
+            first_program_pages[course_id] = min(pages, key=lambda page: page.path)
+    child_forms = _get_live_child_forms([*course_pages, *first_program_pages.values()])
+    course_forms = {}
+    for form in (
+        cms_models.FlexiblePricingRequestForm.objects.filter(
+            selected_course_id__in=course_ids
+        )
+        .live()
+        .order_by("path")
+    ):
+        course_forms.setdefault(form.selected_course_id, form)
+
+    form_urls = {}
+    for page in course_pages:
+        form_url = ""
+        program_ids = program_ids_by_course.get(page.course_id)
+        program_page = first_program_pages.get(page.course_id)
+        if program_page is not None and program_page.id in child_forms:
+            form_url = _get_financial_assistance_url(
+                program_page, child_forms[program_page.id]
+            )
+        elif program_ids:
+            all_program_ids = all_program_ids_by_course[page.course_id]
+            form = next(
+                (
+                    form
+                    for form in program_forms
+                    if form.selected_program_id in all_program_ids
+                ),
+                None,
+            )
+            if form is not None:
+                form_url = _get_financial_assistance_url(
+                    page
+                    if form.selected_program_id in program_ids
+                    else program_pages.get(form.selected_program_id),
+                    form,
+                )
+
+        form_urls[page.id] = form_url or _get_financial_assistance_url(
+            page, course_forms.get(page.course_id) or child_forms.get(page.id)
+        )
+    return form_urls
+
+
+def _get_parent_pages(pages) -> dict:
+    """Returns the specific parent page of each of the given pages, keyed by path"""
+    parent_paths = {page.path[: -Page.steplen] for page in pages}
+    if not parent_paths:
+        return {}
+
+    parents = {
+        page.path: page
+        for page in cms_models.CoursePage.objects.filter(
+            path__in=parent_paths
+        ).select_related("course")
+    }
+    parents.update(
+        {
+            page.path: page
+            for page in cms_models.ProgramPage.objects.filter(
+                path__in=parent_paths
+            ).select_related("program")
+        }
+    )
+    other_paths = parent_paths - parents.keys()
+    if other_paths:
+        parents.update(
+            {
+                page.path: page
+                for page in Page.objects.filter(path__in=other_paths).specific()
+            }
+        )
+    return parents
+
+
+def _get_program_page_form_urls(program_pages) -> dict:
+    """
+    Returns the financial assistance form URL of each of the given program
+    pages, keyed by page id, as ProgramPageSerializer finds it: a form for the
+    program, then a form under the page, then a form for a related program.
+    """
+    program_forms = {}
+    for form in _get_live_forms_for_programs(
+        [page.program_id for page in program_pages]
+    ):
+        program_forms.setdefault(form.selected_program_id, form)
+    parent_pages = _get_parent_pages(program_forms.values())
+    child_forms = _get_live_child_forms(
+        page for page in program_pages if page.program_id not in program_forms
+    )
+    unmatched_program_ids = [
+        page.program_id
+        for page in program_pages
+        if page.program_id not in program_forms and page.id not in child_forms
+    ]
+    related_program_ids = _get_related_program_ids(unmatched_program_ids)
+    related_forms = _get_live_forms_for_programs(
+        set().union(*related_program_ids.values())
+    )
+    related_program_pages = _get_program_pages(
+        {form.selected_program_id for form in related_forms}
+    )
+
+    form_urls = {}
+    for page in program_pages:
+        form = program_forms.get(page.program_id)
+        if form is not None:
+            form_url = _get_financial_assistance_url(
+                parent_pages.get(form.path[: -Page.steplen], page), form
+            )
+        elif page.id in child_forms:
+            form_url = _get_financial_assistance_url(page, child_forms[page.id])
+        else:
+            form = next(
+                (
+                    form
+                    for form in related_forms
+                    if form.selected_program_id in related_program_ids[page.program_id]
+                ),
+                None,
+            )
+            form_url = (
+                _get_financial_assistance_url(
+                    related_program_pages.get(form.selected_program_id), form
+                )
+                if form is not None
+                else ""
+            )
+        form_urls[page.id] = form_url
+    return form_urls
+
+
+def _get_course_current_prices(course_ids) -> dict:
+    """
+    Returns the highest active product price of each course's first unexpired
+    run, chosen as Course.first_unexpired_run does, keyed by course id. Courses
+    without such a run are left out.
+    """
+    now = now_in_utc()
+    current_runs = {}
+    for run in (
+        CourseRun.all_objects.filter(
+            course_id__in=course_ids, b2b_contract__isnull=True
+        )
+        .enrollable()
+        .filter(Q(is_primary_language=True) | Q(language__in=["", "en"]))
+        .order_by("course_id", "start_date", "-is_primary_language")
+        .prefetch_related(Prefetch("products", to_attr="prefetched_products"))
+    ):
+        unexpired = run.end_date is None or run.end_date > now
+        if run.course_id not in current_runs or (
+            unexpired and not current_runs[run.course_id][1]
+        ):
+            current_runs[run.course_id] = (run, unexpired)
+
+    return {
+        course_id: max(
+            (product.price for product in run.prefetched_products if product.is_active),
+            default=None,
+        )
+        for course_id, (run, _) in current_runs.items()
+    }
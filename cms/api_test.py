@@ -10,6 +10,7 @@ from mitol.common.utils.datetime import now_in_utc
 from wagtail.models import Page
 from wagtail_factories import PageFactory
 
+from cms import api as cms_api
 from cms import utils as cms_utils
 from cms.api import (
     RESOURCE_PAGE_TITLES,
@@ -19,11 +20,20 @@ from cms.api import (
     ensure_product_index,
     ensure_program_product_index,
     ensure_resource_pages,
+    get_featured_product_cards,
     get_home_page,
+    get_product_page_data,
     get_wagtail_img_src,
+    refresh_featured_item,
 )
+from cms.constants import FEATURED_ITEMS_LOCK_KEY
 from cms.exceptions import WagtailSpecificPageError
-from cms.factories import CoursePageFactory, HomePageFactory, ProgramPageFactory
+from cms.factories import (
+    CoursePageFactory,
+    FlexiblePricingFormFactory,
+    HomePageFactory,
+    ProgramPageFactory,
+)
 from cms.models import (
     CourseIndexPage,
     CoursePage,
@@ -33,7 +43,10 @@ from cms.models import (
     ProgramPage,
     ResourcePage,
 )
+from cms.serializers import CoursePageSerializer, ProgramPageSerializer
 from courses.factories import CourseFactory, CourseRunFactory, ProgramFactory
+from courses.models import Course
+from ecommerce.factories import ProductFactory
 from main.utils import get_learn_product_url
 
 
@@ -361,7 +374,9 @@ def test_create_featured_items():
     )
 
     create_featured_items()
-    cache_value = redis_cache.get(cms_utils.get_featured_items_cache_key())
+    cache_value = redis_cache.get(cms_utils.get_featured_items_cache_key())[
+        "course_ids"
+    ]
 
     assert len(cache_value) == 4
     assert set(cache_value) == {
@@ -518,7 +533,7 @@ def test_create_featured_items_course_run_at_exact_time():
 
     assert len(result) == 1
     assert result[0] == exact_time_course
-    assert exact_time_course.id in cache_value
+    assert exact_time_course.id in cache_value["course_ids"]
 
 
 @pytest.mark.django_db
@@ -601,7 +616,7 @@ def test_create_featured_items_cache_no_expiry():
     # Verify cache is still set and correct
     cache_value = redis_cache.get(cms_utils.get_featured_items_cache_key())
     assert cache_value is not None
-    assert len(cache_value) == 1
+    assert len(cache_value["course_ids"]) == 1
 
     redis_client = redis_cache.client.get_client()
     # redis returns -1 for a key being present with no expiry
@@ -615,3 +630,189 @@ def test_create_featured_items_cache_no_expiry():
         if ttl == -2
         else f"Unexpected ttl value `{ttl}` for `{cms_utils.get_featured_items_cache_key()}`"
     )
+
+
+@pytest.mark.django_db
+def test_get_featured_product_cards():
+    """The cached cards are returned in order, leaving out courses no longer open for enrollment"""
+    redis_cache = caches["redis"]
+    redis_cache.delete(cms_utils.get_featured_items_cache_key())
+    now = now_in_utc()
+
+    courses = CourseFactory.create_batch(2, page=None, live=True)
+    course_pages = [
+        CoursePageFactory.create(course=course, live=True) for course in courses
+    ]
+    runs = [
+        CourseRunFactory.create(
+            course=course,
+            live=True,
+            start_date=now + timedelta(days=1),
+            enrollment_start=now - timedelta(days=1),
+            enrollment_end=now + timedelta(days=2),
+            end_date=now + timedelta(days=3),
+        )
+        for course in courses
+    ]
+    create_featured_items()
+    course_ids = redis_cache.get(cms_utils.get_featured_items_cache_key())["course_ids"]
+
+    cards = get_featured_product_cards()
+    assert [card["title"] for card in cards] == [
+        course_pages[courses.index(course)].title
+        for course in sorted(courses, key=lambda course: course_ids.index(course.id))
+    ]
+    assert cards[0]["url_path"] == get_learn_product_url(
+        "courses", Course.objects.get(id=course_ids[0]).readable_id
+    )
+
+    # Closing enrollment after the cache was built hides the card without a rebuild
+    closed_run = runs[courses.index(Course.objects.get(id=course_ids[0]))]
+    payload = redis_cache.get(cms_utils.get_featured_items_cache_key())
+    payload["items"][closed_run.course_id]["enrollment_windows"] = [
+        (now - timedelta(days=2), now - timedelta(days=1))
+    ]
+    redis_cache.set(cms_utils.get_featured_items_cache_key(), payload)
+    assert len(get_featured_product_cards()) == 1
+
+
+@pytest.mark.django_db
+def test_get_featured_product_cards_upgrades_course_id_cache(mocker):
+    """Featured items cached as a list of course ids are rebuilt into cards under the lock"""
+    redis_cache = caches["redis"]
+    now = now_in_utc()
+    course = CourseFactory.create(page=None, live=True)
+    course_page = CoursePageFactory.create(course=course, live=True)
+    CourseRunFactory.create(
+        course=course,
+        live=True,
+        enrollment_start=now - timedelta(days=1),
+        enrollment_end=now + timedelta(days=1),
+    )
+    redis_cache.set(cms_utils.get_featured_items_cache_key(), [course.id])
+    lock_spy = mocker.spy(cms_api, "_featured_items_lock")
+
+    cards = get_featured_product_cards()
+
+    assert [card["title"] for card in cards] == [course_page.title]
+    lock_spy.assert_called_once()
+    assert get_featured_product_cards() == cards
+    lock_spy.assert_called_once()
+    assert redis_cache.get(cms_utils.get_featured_items_cache_key())["course_ids"] == [
+        course.id
+    ]
+
+
+@pytest.mark.django_db
+def test_refresh_featured_item():
+    """Refreshing a featured course rebuilds its card, or drops it if it can't be featured"""
+    redis_cache = caches["redis"]
+    redis_cache.delete(cms_utils.get_featured_items_cache_key())
+    now = now_in_utc()
+    course = CourseFactory.create(page=None, live=True)
+    course_page = CoursePageFactory.create(course=course, live=True)
+    CourseRunFactory.create(
+        course=course,
+        live=True,
+        enrollment_start=now - timedelta(days=1),
+        enrollment_end=now + timedelta(days=1),
+    )
+    create_featured_items()
+
+    CoursePage.objects.filter(id=course_page.id).update(title="New title")
+    refresh_featured_item(course.id)
+    assert [card["title"] for card in get_featured_product_cards()] == ["New title"]
+
+    Course.objects.filter(id=course.id).update(live=False)
+    refresh_featured_item(course.id)
+    assert get_featured_product_cards() == []
+
+
+@pytest.mark.django_db
+def test_featured_items_writes_hold_lock(mocker):
+    """Creating the featured items and refreshing a card both write under the same lock"""
+    redis_cache = caches["redis"]
+    redis_cache.delete(cms_utils.get_featured_items_cache_key())
+    now = now_in_utc()
+    course = CourseFactory.create(page=None, live=True)
+    CoursePageFactory.create(course=course, live=True)
+    CourseRunFactory.create(
+        course=course,
+        live=True,
+        enrollment_start=now - timedelta(days=1),
+        enrollment_end=now + timedelta(days=1),
+    )
+    lock_spy = mocker.spy(cms_api, "_featured_items_lock")
+
+    create_featured_items()
+    refresh_featured_item(course.id)
+
+    assert lock_spy.call_count == 2
+    assert not redis_cache.has_key(FEATURED_ITEMS_LOCK_KEY)
+
+
+@pytest.mark.django_db
+def test_get_product_page_data(fully_configured_wagtail):
+    """
+    get_product_page_data loads the same form URLs and current prices for many
+    pages as the page serializers find for each page
+    """
+    # A course with its own form and a product for its current run
+    course_page = CoursePageFactory.create()
+    course_form = FlexiblePricingFormFactory.create(
+        selected_course_id=course_page.course_id, parent=course_page
+    )
+    product = ProductFactory.create(
+        purchasable_object=CourseRunFactory.create(course=course_page.course)
+    )
+    # A course in a program with a form under the program page
+    program_page = ProgramPageFactory.create(program=ProgramFactory.create(page=None))
+    FlexiblePricingFormFactory.create(parent=program_page)
+    program_course_page = CoursePageFactory.create()
+    program_page.program.add_requirement(program_course_page.course)
+    # A program with a form only for a related program
+    related_program_page = ProgramPageFactory.create(
+        program=ProgramFactory.create(page=None)
+    )
+    FlexiblePricingFormFactory.create(
+        selected_program_id=related_program_page.program_id,
+        parent=related_program_page,
+    )
+    other_program_page = ProgramPageFactory.create(
+        program=ProgramFactory.create(page=None)
+    )
+    other_program_page.program.add_related_program(related_program_page.program)
+    # A course without any form
+    plain_course_page = CoursePageFactory.create()
+
+    course_pages = list(
+        CoursePage.objects.filter(
+            id__in=[course_page.id, program_course_page.id, plain_course_page.id]
+        ).select_related("course")
+    )
+    program_pages = list(
+        ProgramPage.objects.filter(
+            id__in=[program_page.id, related_program_page.id, other_program_page.id]
+        ).select_related("program")
+    )
+
+    page_data = get_product_page_data([*course_pages, *program_pages])
+
+    for page in course_pages:
+        data = CoursePageSerializer(instance=page).data
+        assert page_data[page.id] == {
+            "financial_assistance_form_url": data["financial_assistance_form_url"],
+            "current_price": data["current_price"],
+        }
+    for page in program_pages:
+        data = ProgramPageSerializer(instance=page).data
+        assert page_data[page.id] == {
+            "financial_assistance_form_url": data["financial_assistance_form_url"]
+        }
+    assert page_data[course_page.id] == {
+        "financial_assistance_form_url": f"{course_page.get_url()}{course_form.slug}/",
+        "current_price": product.price,
+    }
+    assert page_data[program_course_page.id]["financial_assistance_form_url"]
+    assert page_data[other_program_page.id]["financial_assistance_form_url"]
+    assert page_data[plain_course_page.id]["financial_assistance_form_url"] == ""
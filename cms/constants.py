@@ -12,6 +12,12 @@ INSTRUCTOR_INDEX_SLUG = "instructors"
 ONE_MINUTE = 60
 
 FEATURED_ITEMS_CACHE_KEY = "CMS_homepage_featured_courses"
+# Bumped whenever the format of the cached featured items changes
+FEATURED_ITEMS_CACHE_VERSION = 2
+# Held while the cached featured items are written, so a card refresh can't
+# overwrite a newer set of featured items or another card's refresh
+FEATURED_ITEMS_LOCK_KEY = "CMS_homepage_featured_courses_lock"
+FEATURED_ITEMS_LOCK_TIMEOUT = 5 * ONE_MINUTE
 
 HYL_CHOICE_REALWORLD_LEARNING = {
     "icon": "IconConnectedPeople",
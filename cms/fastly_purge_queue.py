@@ -0,0 +1,128 @@
+"""
+Deduplicated queue of pending Fastly surrogate key purges
+
+Saving courses, runs, programs and products, and publishing their CMS pages,
+each request a purge of the surrogate keys tagging the cached responses that
+depend on them. A bulk course run sync or CMS import requests the same handful
+of keys hundreds of times, so rather than each request sending its own purge,
+the keys are added to a Redis set per Fastly service.
+cms.tasks.flush_pending_fastly_purges periodically drains the sets and purges
+each service's keys with Fastly's multi-key purge.
+"""
+
+_PENDING_KEY = "cms:pending_fastly_purges"
+_STATS_KEY = f"{_PENDING_KEY}:stats"
+
+# Service IDs and surrogate keys contain no spaces (Fastly uses spaces to
+# separate keys), so a space can separate them in a set member
+_MEMBER_SEPARATOR = " "
+
+
+def _get_redis():
+    from django_redis import get_redis_connection  # noqa: PLC0415
+
+    return get_redis_connection("redis")
+
+
+def queue_fastly_purges(service_id: str, surrogate_keys) -> int:
+    """
+    Add surrogate keys to the pending purge set
+
+    Args:
+        service_id(str): The Fastly service ID whose cache should be purged
+        surrogate_keys(iterable of str): The surrogate keys to purge
+
+    Returns:
+        int: The number of keys that weren't already pending
+    """
+    members = [
+        f"{service_id}{_MEMBER_SEPARATOR}{surrogate_key}"
+        for surrogate_key in surrogate_keys
+    ]
+    if not members:
+        return 0
+    pipeline = _get_redis().pipeline()
+    pipeline.sadd(_PENDING_KEY, *members)
+    pipeline.hincrby(_STATS_KEY, "requested", len(members))
+    added, _ = pipeline.execute()
+    if added:
+        _get_redis().hincrby(_STATS_KEY, "queued", added)
+    return added
+
+
+def requeue_fastly_purges(service_id: str, surrogate_keys):
+    """
+    Put back surrogate keys whose purge failed, without counting them as
+    newly requested
+
+    Args:
+        service_id(str): The Fastly service ID whose cache should be purged
+        surrogate_keys(iterable of str): The surrogate keys to purge
+    """
+    members = [
+        f"{service_id}{_MEMBER_SEPARATOR}{surrogate_key}"
+        for surrogate_key in surrogate_keys
+    ]
+    if members:
+        _get_redis().sadd(_PENDING_KEY, *members)
+
+
+def drain_fastly_purges() -> dict[str, list[str]]:
+    """
+    Atomically remove and return every pending purge
+
+    Returns:
+        dict: Fastly service ID to the sorted surrogate keys to purge from it
+    """
+    redis_client = _get_redis()
+    count = redis_client.scard(_PENDING_KEY)
+    if not count:
+        return {}
+    purges = {}
+    for member in sorted(
+        member.decode() for member in redis_client.spop(_PENDING_KEY, count)
+    ):
+        service_id, surrogate_key = member.split(_MEMBER_SEPARATOR, 1)
+        purges.setdefault(service_id, []).append(surrogate_key)
+    return purges
+
+
+def record_fastly_purges_sent(key_count: int, request_count: int):
+    """
+    Count the surrogate keys purged and the purge requests that were sent for them
+
+    Args:
+        key_count(int): The number of surrogate keys purged
+        request_count(int): The number of purge requests sent
+    """
+    pipeline = _get_redis().pipeline()
+    pipeline.hincrby(_STATS_KEY, "sent", key_count)
+    pipeline.hincrby(_STATS_KEY, "requests", request_count)
+    pipeline.execute()
+
+
+def get_fastly_purge_metrics() -> dict:
+    """
+    Queue depth and deduplication counters for the pending purges
+
+    Returns:
+        dict: depth (pending keys), requested (purges requested), queued
+            (requests that added a new pending key), sent (keys purged),
+            requests (purge requests sent to Fastly) and dedupe_ratio (share
+            of requested purges collapsed into an already-pending key)
+    """
+    redis_client = _get_redis()
+    stats = {
+        key.decode() if isinstance(key, bytes) else key: int(value)
+        for key, value in redis_client.hgetall(_STATS_KEY).items()
+    }
+    requested = stats.get("requested", 0)
+    queued = stats.get("queued", 0)
+    return {
+        "depth": redis_client.scard(_PENDING_KEY),
+        "requested": requested,
+        "queued": queued,
+        "sent": stats.get("sent", 0),
+        "requests": stats.get("requests", 0),
+        "dedupe_ratio": 1 - queued / requested if requested else 0.0,
+    }
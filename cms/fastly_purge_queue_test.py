@@ -0,0 +1,64 @@
+"""Tests for cms.fastly_purge_queue"""
+
+import pytest
+
+from cms import fastly_purge_queue
+
+
+@pytest.fixture(autouse=True)
+def clear_queue():
+    """Start each test with an empty queue and no stats"""
+    redis_client = fastly_purge_queue._get_redis()  # noqa: SLF001
+    keys = [
+        fastly_purge_queue._PENDING_KEY,  # noqa: SLF001
+        fastly_purge_queue._STATS_KEY,  # noqa: SLF001
+    ]
+    redis_client.delete(*keys)
+    yield
+    redis_client.delete(*keys)
+
+
+def test_queue_deduplicates_keys_per_service():
+    """Repeated purges of the same key for the same service should leave a single pending entry"""
+    assert (
+        fastly_purge_queue.queue_fastly_purges(
+            "learn", ["mitxonline:course:a", "mitxonline:course:b"]
+        )
+        == 2
+    )
+    assert fastly_purge_queue.queue_fastly_purges("learn", ["mitxonline:course:a"]) == 0
+    assert (
+        fastly_purge_queue.queue_fastly_purges(
+            "mitxonline", ["mitxonline:course:a", "mitxonline:courses"]
+        )
+        == 2
+    )
+    assert fastly_purge_queue.queue_fastly_purges("learn", []) == 0
+
+    assert fastly_purge_queue.get_fastly_purge_metrics() == {
+        "depth": 4,
+        "requested": 5,
+        "queued": 4,
+        "sent": 0,
+        "requests": 0,
+        "dedupe_ratio": pytest.approx(0.2),
+    }
+    assert fastly_purge_queue.drain_fastly_purges() == {
+        "learn": ["mitxonline:course:a", "mitxonline:course:b"],
+        "mitxonline": ["mitxonline:course:a", "mitxonline:courses"],
+    }
+    assert fastly_purge_queue.drain_fastly_purges() == {}
+
+
+def test_requeue_and_record_sent():
+    """Requeued keys aren't counted as requested again, and sent purges are counted"""
+    fastly_purge_queue.queue_fastly_purges("learn", ["mitxonline:course:a"])
+    fastly_purge_queue.drain_fastly_purges()
+    fastly_purge_queue.requeue_fastly_purges("learn", ["mitxonline:course:a"])
+    fastly_purge_queue.record_fastly_purges_sent(3, 1)
+
+    metrics = fastly_purge_queue.get_fastly_purge_metrics()
+    assert metrics["depth"] == 1
+    assert metrics["requested"] == 1
+    assert metrics["sent"] == 3
+    assert metrics["requests"] == 1
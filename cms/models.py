@@ -11,7 +11,6 @@ from urllib.parse import quote_plus
 import pycountry
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -49,7 +48,6 @@ from wagtail.search import index
 from wagtail.snippets.models import register_snippet
 from wagtailmetadata.models import MetadataPageMixin
 
-from cms import utils as cms_utils
 from cms.blocks import (
     CourseRunCertificateOverrides,
     PriceBlock,
@@ -70,7 +68,6 @@ from cms.wagtail_api.serializers import ImageSerializer, ProductChildPageSeriali
 from courses.api import get_relevant_course_run_qset
 from courses.models import (
     Course,
-    CourseRun,
     CourseRunCertificate,
     Program,
     ProgramCertificate,
@@ -808,74 +805,12 @@ class HomePage(VideoPlayerConfigMixin):
     @property
     def get_cached_featured_products(self):
         """
-        Retrieves teh featured products that were generated using cms/api/create_featured_items either from the
+        Retrieves the featured products that were generated using cms/api/create_featured_items either from the
         management command or the daily cron job. This is used to display the featured products on the home page.
         """
-        now = now_in_utc()
-        redis_cache = caches["redis"]
-        cached_featured_course_ids = redis_cache.get(
-            cms_utils.get_featured_items_cache_key()
-        )
-        if cached_featured_course_ids and len(cached_featured_course_ids) > 0:
-            # Load fresh course data from database using cached IDs
-            relevant_run_course_ids = (
-                CourseRun.objects.filter(live=True)
-                .filter(
-                    models.Q(course__id__in=cached_featured_course_ids)
-                    & models.Q(enrollment_start__lte=now)
-                    & (
-                        models.Q(enrollment_end__gte=now)
-                        | models.Q(enrollment_end__isnull=True)
-                    )
-                )
-                .values_list("course__id", flat=True)
-            )
-
-            # Create ordering to maintain the sequence from the cache
-            ordering = models.Case(
-                *[
-                    models.When(id=cid, then=pos)
-                    for pos, cid in enumerate(cached_featured_course_ids)
-                ],
-                output_field=models.IntegerField(),
-            )
-
-            valid_course_ids = set(cached_featured_course_ids) & set(
-                relevant_run_course_ids
-            )
-
-            featured_courses = (
-                Course.objects.filter(id__in=valid_course_ids, page__live=True)
-                .select_related("page")
-                .order_by(ordering)
-            )
+        from cms.api import get_featured_product_cards  # noqa: PLC0415
 
-            featured_products = []
-            for course in featured_courses:
-                course_page = course.course_page
-                if course_page is not None:
-                    featured_products.append(course_page)
-            featured_product_pages = []
-            for page in featured_products:
-                run = page.product.first_unexpired_run
-                run_data = {
-                    "title": page.title,
-                    "description": page.description,
-                    "feature_image": page.feature_image,
-                    "start_date": run.start_date if run is not None else None,
-                    "url_path": get_learn_product_url(
-                        "programs" if page.is_program_page else "courses",
-                        page.product.readable_id,
-                    ),
-                    "is_program": page.is_program_page,
-                    "is_self_paced": run.is_self_paced if run is not None else None,
-                    "program_type": (
-                        page.product.program_type if page.is_program_page else None
-                    ),
-                }
-                featured_product_pages.append(run_data)
-            return featured_product_pages
-        return []
+        return get_featured_product_cards()
 
     @property
     def products(self):
@@ -42,6 +42,7 @@ from cms.models import (
     ProgramPage,
     SignatoryPage,
 )
+from cms.templatetags.feature_img_src import feature_img_src
 from courses.factories import (
     CourseFactory,
     CourseRunEnrollmentFactory,
@@ -739,13 +740,18 @@ def test_homepage_featured_products(settings, mocker):
         end_date=furthest_future_date,
     )
     create_featured_items()
-    assert len(redis_cache.get(cms_utils.get_featured_items_cache_key())) == 1
+    assert (
+        len(redis_cache.get(cms_utils.get_featured_items_cache_key())["course_ids"])
+        == 1
+    )
     hf = HomePageFactory.create()
     assert hf.get_cached_featured_products == [
         {
             "title": enrollable_future_course_page.title,
             "description": enrollable_future_course_page.description,
-            "feature_image": enrollable_future_course_page.feature_image,
+            "feature_image_src": feature_img_src(
+                enrollable_future_course_page.feature_image
+            ),
             "start_date": enrollable_future_courserun.start_date,
             "url_path": get_learn_product_url(
                 "courses", enrollable_future_course.readable_id
@@ -774,13 +780,18 @@ def test_homepage_featured_products(settings, mocker):
         end_date=furthest_future_date,
     )
     create_featured_items()
-    assert len(redis_cache.get(cms_utils.get_featured_items_cache_key())) == 1
+    assert (
+        len(redis_cache.get(cms_utils.get_featured_items_cache_key())["course_ids"])
+        == 1
+    )
     hf = HomePageFactory.create()
     assert hf.get_cached_featured_products == [
         {
             "title": enrollable_future_course_with_no_enrollment_end_page.title,
             "description": enrollable_future_course_with_no_enrollment_end_page.description,
-            "feature_image": enrollable_future_course_with_no_enrollment_end_page.feature_image,
+            "feature_image_src": feature_img_src(
+                enrollable_future_course_with_no_enrollment_end_page.feature_image
+            ),
             "start_date": enrollable_future_courserun_with_no_enrollment_end.start_date,
             "url_path": get_learn_product_url(
                 "courses", enrollable_future_course_with_no_enrollment_end.readable_id
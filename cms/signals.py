@@ -1,10 +1,14 @@
 import logging
 
-from django.conf import settings
 from django.db import transaction
-from wagtail.signals import page_published
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from wagtail.signals import page_published, page_unpublished
 
+from cms.api import is_featured_course
 from cms.models import CoursePage, FlexiblePricingRequestForm, ProgramPage
+from courses.models import CourseRun
+from courses.utils import queue_course_cache_purge, queue_program_cache_purge
 from flexiblepricing.utils import ensure_flexprice_form_fields
 
 logger = logging.getLogger("cms.signalreceiver")
@@ -43,26 +47,61 @@ def purge_fastly_cache_on_publish(sender, **kwargs):  # noqa: ARG001
         CoursePage   -> mitxonline:course:<readable_id>
         ProgramPage  -> mitxonline:program:<readable_id>
     """
-    from cms.tasks import queue_fastly_surrogate_key_purge  # noqa: PLC0415
-
     instance = kwargs["instance"]
 
     if isinstance(instance, CoursePage):
-        surrogate_key = f"mitxonline:course:{instance.course.readable_id}"
+        readable_id = instance.course.readable_id
+        queue_cache_purge = queue_course_cache_purge
     elif isinstance(instance, ProgramPage):
-        surrogate_key = f"mitxonline:program:{instance.program.readable_id}"
+        readable_id = instance.program.readable_id
+        queue_cache_purge = queue_program_cache_purge
     else:
         return
 
     logger.info(
-        "Scheduling Fastly surrogate key purge on page publish: %s", surrogate_key
-    )
-    transaction.on_commit(
-        lambda: queue_fastly_surrogate_key_purge.delay(
-            surrogate_key, settings.MIT_LEARN_FASTLY_SERVICE_ID
-        )
+        "Scheduling Fastly surrogate key purge on page publish: %s", readable_id
     )
+    queue_cache_purge(readable_id)
+
+
+def _queue_featured_item_refresh(course_id):
+    """
+    Refresh the cached home page card of a featured course once the current
+    transaction commits. The task checks again, since the featured items may be
+    replaced before it runs.
+    """
+    from cms.tasks import refresh_featured_homepage_item  # noqa: PLC0415
+
+    if is_featured_course(course_id):
+        transaction.on_commit(lambda: refresh_featured_homepage_item.delay(course_id))
+
+
+def refresh_featured_item_on_page_change(sender, **kwargs):  # noqa: ARG001
+    """
+    Receives the Wagtail page_published and page_unpublished signals and, if the
+    page is for a featured course, refreshes its cached home page card.
+    """
+    instance = kwargs["instance"]
+
+    if isinstance(instance, CoursePage):
+        _queue_featured_item_refresh(instance.course_id)
+
+
+@receiver(post_save, sender=CourseRun, dispatch_uid="courserun_post_save_featured_item")
+def refresh_featured_item_on_course_run_save(
+    sender,  # noqa: ARG001
+    instance,
+    created,  # noqa: ARG001
+    **kwargs,  # noqa: ARG001
+):
+    """
+    Refreshes the cached home page card of a featured course when one of its
+    runs is saved (e.g. new dates or pacing from edX).
+    """
+    _queue_featured_item_refresh(instance.course_id)
 
 
 page_published.connect(flex_pricing_field_check)
 page_published.connect(purge_fastly_cache_on_publish)
+page_published.connect(refresh_featured_item_on_page_change)
+page_unpublished.connect(refresh_featured_item_on_page_change)
@@ -7,6 +7,7 @@ import pytest
 from django.db.models.signals import post_save
 
 from cms.factories import CoursePageFactory, ProgramPageFactory, ResourcePageFactory
+from courses.factories import CourseRunFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -20,14 +21,14 @@ def learn_service_id(settings):
     return settings.MIT_LEARN_FASTLY_SERVICE_ID
 
 
-@patch("cms.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("courses.utils.queue_fastly_purges")
 def test_purge_fastly_cache_on_publish_course_page(
-    mock_purge_delay, mock_on_commit, learn_service_id
+    mock_queue_purges, mock_on_commit, learn_service_id
 ):
     """Publishing a CoursePage purges the key for its course."""
     course_page = CoursePageFactory.create()
-    mock_purge_delay.reset_mock()
+    mock_queue_purges.reset_mock()
 
     # Publishing saves the Course as well, which purges the same key via its own
     # post_save receiver; mute post_save so only the publish path is counted.
@@ -36,40 +37,72 @@ def test_purge_fastly_cache_on_publish_course_page(
     with factory.django.mute_signals(post_save):
         course_page.save_revision().publish()
 
-    mock_purge_delay.assert_called_once_with(
-        f"mitxonline:course:{course_page.course.readable_id}", learn_service_id
+    mock_queue_purges.assert_called_once_with(
+        learn_service_id, [f"mitxonline:course:{course_page.course.readable_id}"]
     )
 
 
-@patch("cms.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("courses.utils.queue_fastly_purges")
 def test_purge_fastly_cache_on_publish_program_page(
-    mock_purge_delay, mock_on_commit, learn_service_id
+    mock_queue_purges, mock_on_commit, learn_service_id
 ):
     """Publishing a ProgramPage purges the key for its program."""
     program_page = ProgramPageFactory.create()
-    mock_purge_delay.reset_mock()
+    mock_queue_purges.reset_mock()
 
     with factory.django.mute_signals(post_save):
         program_page.save_revision().publish()
 
-    mock_purge_delay.assert_called_once_with(
-        f"mitxonline:program:{program_page.program.readable_id}", learn_service_id
+    mock_queue_purges.assert_called_once_with(
+        learn_service_id, [f"mitxonline:program:{program_page.program.readable_id}"]
     )
 
 
-@patch("cms.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("courses.utils.queue_fastly_purges")
 def test_purge_fastly_cache_on_publish_ignores_other_pages(
-    mock_purge_delay, mock_on_commit
+    mock_queue_purges, mock_on_commit
 ):
     """Publishing a page that is not a product page purges nothing."""
     resource_page = ResourcePageFactory.create()
-    mock_purge_delay.reset_mock()
+    mock_queue_purges.reset_mock()
 
     # A ResourcePage has no Course or Program, so there is no post_save purge to
     # suppress here; muted only to keep the three tests the same shape.
     with factory.django.mute_signals(post_save):
         resource_page.save_revision().publish()
 
-    mock_purge_delay.assert_not_called()
+    mock_queue_purges.assert_not_called()
+
+
+@pytest.mark.parametrize("is_featured", [True, False])
+@patch("cms.signals.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("cms.tasks.refresh_featured_homepage_item.delay")
+def test_refresh_featured_item_on_course_run_save(
+    mock_refresh_delay, mock_on_commit, mocker, is_featured
+):
+    """Saving a run of a featured course queues a refresh of its home page card."""
+    mocker.patch("cms.signals.is_featured_course", return_value=is_featured)
+
+    course_run = CourseRunFactory.create()
+
+    if is_featured:
+        mock_refresh_delay.assert_called_with(course_run.course_id)
+    else:
+        mock_refresh_delay.assert_not_called()
+
+
+@patch("cms.signals.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("cms.tasks.refresh_featured_homepage_item.delay")
+def test_refresh_featured_item_on_page_unpublish(
+    mock_refresh_delay, mock_on_commit, mocker
+):
+    """Unpublishing the page of a featured course queues a refresh of its home page card."""
+    mocker.patch("cms.signals.is_featured_course", return_value=True)
+    course_page = CoursePageFactory.create()
+    mock_refresh_delay.reset_mock()
+
+    course_page.unpublish()
+
+    mock_refresh_delay.assert_called_once_with(course_page.course_id)
@@ -1,14 +1,41 @@
+import functools
 import logging
 from urllib.parse import urljoin, urlparse
 
 import requests
 from django.conf import settings
 from mitol.common.decorators import single_task
-
-from cms.api import create_featured_items
+from mitol.common.utils.collections import chunks
+from requests.adapters import HTTPAdapter
+
+from cms.api import (
+    create_featured_items,
+    is_featured_course,
+    refresh_featured_item,
+)
+from cms.fastly_purge_queue import (
+    drain_fastly_purges,
+    get_fastly_purge_metrics,
+    record_fastly_purges_sent,
+    requeue_fastly_purges,
+)
 from cms.models import Page
 from main.celery import app
 
+# Fastly accepts at most this many surrogate keys in one multi-key purge
+FASTLY_MAX_KEYS_PER_PURGE = 256
+
+
+@functools.cache
+def get_fastly_session():
+    """
+    Returns the requests session used for Fastly API calls, one per process,
+    so purges reuse pooled connections instead of opening one each.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+    return session
+
 
 def call_fastly_purge_api(relative_url):
     """
@@ -37,7 +64,9 @@ def call_fastly_purge_api(relative_url):
 
     api_url = urljoin(settings.FASTLY_URL, relative_url)
 
-    resp = requests.request("PURGE", api_url, headers=headers)  # noqa: S113
+    resp = get_fastly_session().request(
+        "PURGE", api_url, headers=headers, timeout=settings.FASTLY_REQUEST_TIMEOUT
+    )
 
     if resp.status_code >= 400:  # noqa: PLR2004
         logger.error(f"Fastly API Purge call failed: {resp.status_code} {resp.reason}")  # noqa: G004
@@ -111,6 +140,10 @@ def queue_fastly_surrogate_key_purge(surrogate_key, service_id=None):
 
     Key format: mitxonline:course:<readable_id> or mitxonline:program:<readable_id>
 
+    This purges a single key right away. Model and page publish signals queue
+    their purges in cms.fastly_purge_queue instead, which
+    flush_pending_fastly_purges sends in batches.
+
     Args:
         surrogate_key (str): The surrogate key to purge, e.g.
             "mitxonline:course:course-v1:MITx+6.00.1x"
@@ -154,7 +187,9 @@ def queue_fastly_surrogate_key_purge(surrogate_key, service_id=None):
         "fastly-soft-purge": "1",
     }
 
-    resp = requests.post(api_url, headers=headers, timeout=10)
+    resp = get_fastly_session().post(
+        api_url, headers=headers, timeout=settings.FASTLY_REQUEST_TIMEOUT
+    )
 
     if resp.status_code >= 400:  # noqa: PLR2004
         logger.error(
@@ -170,6 +205,101 @@ def queue_fastly_surrogate_key_purge(surrogate_key, service_id=None):
     return True
 
 
+def call_fastly_multi_key_purge_api(service_id, surrogate_keys):
+    """
+    Purges all Fastly cached responses tagged with any of the given surrogate
+    keys, in one request.
+
+    Uses the Fastly multi-key purge API:
+    POST /service/{service_id}/purge with a Surrogate-Key header listing the keys
+
+    Args:
+        service_id (str): The Fastly service ID whose cache should be purged
+        surrogate_keys (list of str): The surrogate keys to purge, at most
+            FASTLY_MAX_KEYS_PER_PURGE
+    Returns:
+        bool: True if Fastly accepted the purge
+    """
+    logger = logging.getLogger("fastly_purge")
+
+    api_url = urljoin(settings.FASTLY_URL, f"/service/{service_id}/purge")
+    headers = {
+        "Fastly-Key": settings.FASTLY_AUTH_TOKEN,
+        "fastly-soft-purge": "1",
+        "Surrogate-Key": " ".join(surrogate_keys),
+    }
+
+    try:
+        resp = get_fastly_session().post(
+            api_url, headers=headers, timeout=settings.FASTLY_REQUEST_TIMEOUT
+        )
+    except requests.exceptions.RequestException:
+        logger.exception(
+            "Fastly multi-key purge of %d key(s) from service %s failed",
+            len(surrogate_keys),
+            service_id,
+        )
+        return False
+
+    if resp.status_code >= 400:  # noqa: PLR2004
+        logger.error(
+            "Fastly multi-key purge of %d key(s) from service %s failed: %s %s",
+            len(surrogate_keys),
+            service_id,
+            resp.status_code,
+            resp.reason,
+        )
+        logger.error("Fastly returned: %s", resp.text)
+        return False
+
+    return True
+
+
+@app.task
+@single_task(30, raise_block=False)
+def flush_pending_fastly_purges():
+    """
+    Purge the queued Fastly surrogate keys (see cms.fastly_purge_queue),
+    batching each service's keys into multi-key purges.
+
+    Keys whose purge fails are queued again for the next flush.
+
+    Returns:
+        dict: The purge metrics after the flush
+    """
+    logger = logging.getLogger("fastly_purge")
+
+    pending_purges = drain_fastly_purges()
+    if pending_purges and not settings.FASTLY_AUTH_TOKEN:
+        logger.error(
+            "FASTLY_AUTH_TOKEN is not set; dropping %d queued surrogate key purge(s)",
+            sum(len(keys) for keys in pending_purges.values()),
+        )
+        return get_fastly_purge_metrics()
+
+    sent_keys = 0
+    sent_requests = 0
+    for service_id, surrogate_keys in pending_purges.items():
+        for keys in chunks(surrogate_keys, chunk_size=FASTLY_MAX_KEYS_PER_PURGE):
+            if call_fastly_multi_key_purge_api(service_id, keys):
+                sent_keys += len(keys)
+                sent_requests += 1
+            else:
+                requeue_fastly_purges(service_id, keys)
+    if sent_requests:
+        record_fastly_purges_sent(sent_keys, sent_requests)
+
+    metrics = get_fastly_purge_metrics()
+    if pending_purges:
+        logger.info(
+            "Purged %d Fastly surrogate key(s) in %d request(s): %s",
+            sent_keys,
+            sent_requests,
+            metrics,
+        )
+    return metrics
+
+
 @app.task
 @single_task(30)
 def refresh_featured_homepage_items():
@@ -180,3 +310,12 @@ def refresh_featured_homepage_items():
     logger.info("Refreshing featured homepage items...")
     create_featured_items()
     logger.info("Featured items refreshed")
+
+
+@app.task
+def refresh_featured_homepage_item(course_id):
+    """
+    Refresh the cached home page card of a course that changed, if it's featured.
+    """
+    if is_featured_course(course_id):
+        refresh_featured_item(course_id)
@@ -5,6 +5,7 @@ import logging
 import pytest
 import responses
 
+from cms import tasks
 from cms.tasks import call_fastly_purge_api, queue_fastly_surrogate_key_purge
 
 # Deliberately not the production default (https://api.fastly.com), so that
@@ -132,3 +133,74 @@ def test_call_fastly_purge_api_targets_mitxonline_by_host(fastly_settings):
     sent_headers = responses.calls[0].request.headers
     assert sent_headers["host"] == "mitxonline.test"
     assert sent_headers["fastly-key"] == FASTLY_AUTH_TOKEN
+
+
+@responses.activate
+def test_flush_pending_fastly_purges(fastly_settings, mocker):
+    """
+    Queued keys are purged with one multi-key request per service and chunk,
+    and the keys of a failed request are queued again.
+    """
+    mocker.patch("cms.tasks.FASTLY_MAX_KEYS_PER_PURGE", 2)
+    mocker.patch(
+        "cms.tasks.drain_fastly_purges",
+        return_value={
+            LEARN_SERVICE_ID: ["key-a", "key-b", "key-c"],
+            "failing-service-id": ["key-d"],
+        },
+    )
+    mock_requeue = mocker.patch("cms.tasks.requeue_fastly_purges")
+    mock_record_sent = mocker.patch("cms.tasks.record_fastly_purges_sent")
+    mocker.patch("cms.tasks.get_fastly_purge_metrics", return_value={})
+    learn_purge = responses.add(
+        responses.POST,
+        f"{FASTLY_URL}/service/{LEARN_SERVICE_ID}/purge",
+        json={},
+        status=200,
+    )
+    responses.add(
+        responses.POST, f"{FASTLY_URL}/service/failing-service-id/purge", status=503
+    )
+
+    tasks.flush_pending_fastly_purges()
+
+    assert learn_purge.call_count == 2
+    assert [
+        call.request.headers["Surrogate-Key"]
+        for call in responses.calls
+        if call.request.url == learn_purge.url
+    ] == ["key-a key-b", "key-c"]
+    assert responses.calls[0].request.headers["Fastly-Key"] == FASTLY_AUTH_TOKEN
+    mock_requeue.assert_called_once_with("failing-service-id", ["key-d"])
+    mock_record_sent.assert_called_once_with(3, 2)
+
+
+@responses.activate
+def test_flush_pending_fastly_purges_skips_without_auth_token(
+    fastly_settings, mocker, caplog
+):
+    """A missing auth token drops the queued purges rather than sending them unauthenticated."""
+    fastly_settings.FASTLY_AUTH_TOKEN = None
+    mocker.patch(
+        "cms.tasks.drain_fastly_purges", return_value={LEARN_SERVICE_ID: ["key-a"]}
+    )
+    mocker.patch("cms.tasks.get_fastly_purge_metrics", return_value={})
+
+    tasks.flush_pending_fastly_purges()
+
+    assert not responses.calls
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+
+
+@pytest.mark.parametrize("is_featured", [True, False])
+def test_refresh_featured_homepage_item(mocker, is_featured):
+    """Only a featured course has its cached home page card refreshed."""
+    mocker.patch("cms.tasks.is_featured_course", return_value=is_featured)
+    mock_refresh = mocker.patch("cms.tasks.refresh_featured_item")
+
+    tasks.refresh_featured_homepage_item(123)
+
+    if is_featured:
+        mock_refresh.assert_called_once_with(123)
+    else:
+        mock_refresh.assert_not_called()
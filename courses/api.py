@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import logging
 import re
-from collections import Counter, namedtuple
+import time
+from collections import Counter, defaultdict, namedtuple
 from datetime import datetime, timedelta
 from decimal import Decimal
-from traceback import format_exc
+from traceback import format_exc, format_stack
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -17,10 +18,11 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, transaction
-from django.db.models import Exists, OuterRef, Prefetch, Q
+from django.db.models import Exists, F, Func, OuterRef, Prefetch, Q
 from django_countries import countries
 from mitol.common.utils import now_in_utc
 from mitol.common.utils.collections import (
+    chunks,
     first_or_none,
     has_equal_properties,
 )
@@ -35,6 +37,7 @@ from cms.api import create_default_courseware_page
 from courses import mail_api
 from courses.constants import (
     COURSE_KEY_PATTERN,
+    COURSE_RUN_GRADE_CHUNK_SIZE,
     ENROLL_CHANGE_STATUS_DEFERRED,
     ENROLL_CHANGE_STATUS_UNENROLLED,
     PROGRAM_TEXT_ID_PREFIX,
@@ -46,6 +49,7 @@ from courses.models import (
     CourseRunCertificate,
     CourseRunEnrollment,
     CourseRunGrade,
+    CourseRunGradeAudit,
     Department,
     EnrollmentMode,
     PaidCourseRun,
@@ -54,6 +58,7 @@ from courses.models import (
     ProgramCertificate,
     ProgramEnrollment,
     ProgramRequirement,
+    ProgramRequirementNodeType,
     VerifiableCredential,
 )
 from courses.serializers.base import get_thumbnail_url
@@ -107,6 +112,9 @@ UserEnrollments = namedtuple(  # noqa: PYI024
         "past_non_program_runs",
     ],
 )
+ProgramRequirementTrees = namedtuple(  # noqa: PYI024
+    "ProgramRequirementTrees", ["roots", "children", "paid_program_ids"]
+)
 
 
 class InvalidCertificateError(Exception):
@@ -652,6 +660,146 @@ def ensure_course_run_grade(user, course_run, edx_grade, should_update=False):
     return run_grade, created, updated
 
 
+def _ensure_course_run_grades_chunk(course_run, edx_grade_users):
+    """
+    Creates/updates the CourseRunGrade records for a single chunk of edX grades in
+    one transaction. See ensure_course_run_grades.
+    """
+    users = [user for _, user in edx_grade_users]
+    existing_grades = {
+        grade.user_id: grade
+        for grade in CourseRunGrade.objects.select_for_update().filter(
+            course_run=course_run, user__in=users
+        )
+    }
+    now = now_in_utc()
+    call_stack = "".join(format_stack()[-6:-2])
+    results = []
+    new_grades = []
+    changed_grades = []
+    audits = []
+    for edx_grade, user in edx_grade_users:
+        grade_properties = {
+            "grade": edx_grade.percent,
+            "passed": edx_grade.passed,
+            "letter_grade": edx_grade.letter_grade,
+        }
+        run_grade = existing_grades.get(user.id)
+        if run_grade is None:
+            run_grade = CourseRunGrade(
+                course_run=course_run, user=user, **grade_properties
+            )
+            created, updated = True, False
+        else:
+            # avoids lazy loading both when the certificate is processed later
+            run_grade.user = user
+            run_grade.course_run = course_run
+            if run_grade.set_by_admin or has_equal_properties(
+                run_grade, grade_properties
+            ):
+                results.append((run_grade, user, False, False))
+                continue
+            data_before = run_grade.to_dict()
+            for field, value in grade_properties.items():
+                setattr(run_grade, field, value)
+            run_grade.updated_on = now
+            created, updated = False, True
+
+        try:
+            # FK and uniqueness checks are skipped since they would each cost a
+            # query per grade, and both are already guaranteed here
+            run_grade.full_clean(
+                exclude=["user", "course_run"],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        except ValidationError:
+            log.exception(
+                "Can't save grade %s for %s in %s, skipping certificate generation",
+                edx_grade,
+                user,
+                course_run,
+            )
+            continue
+
+        if created:
+            new_grades.append(run_grade)
+        else:
+            changed_grades.append(run_grade)
+            audits.append(
+                CourseRunGradeAudit(
+                    course_run_grade=run_grade,
+                    acting_user=None,
+                    call_stack=call_stack,
+                    data_before=data_before,
+                    data_after=run_grade.to_dict(),
+                )
+            )
+        results.append((run_grade, user, created, updated))
+
+    CourseRunGrade.objects.bulk_create(new_grades)
+    CourseRunGrade.objects.bulk_update(
+        changed_grades, ["grade", "passed", "letter_grade", "updated_on"]
+    )
+    CourseRunGradeAudit.objects.bulk_create(audits)
+    return results
+
+
+def ensure_course_run_grades(course_run, edx_grade_users, stats=None):
+    """
+    Bulk version of ensure_course_run_grade(..., should_update=True) for all of the
+    grades in a course run.
+
+    The incoming edX grades are diffed in memory against the existing CourseRunGrade
+    records for the run, and only new or changed grades are written (along with the
+    audit records for changed grades) via bulk queries, one transaction per chunk.
+    Grades set by an admin are never overwritten.
+
+    Args:
+        course_run (courses.models.CourseRun): The course run for which the grades are created
+        edx_grade_users (iterable of (UserCurrentGrade, User)): The edX grades and the users they belong to
+        stats (Counter): If provided, incremented with the time spent writing grades (in ms)
+
+    Yields:
+        Tuple[ CourseRunGrade, User, bool, bool ]: The run grade, the user it belongs to,
+            a bool representing if the run grade was created and a bool representing if
+            the run grade was updated
+    """
+    stats = stats if stats is not None else Counter()
+    for chunk in chunks(edx_grade_users, chunk_size=COURSE_RUN_GRADE_CHUNK_SIZE):
+        write_start = time.monotonic()
+        try:
+            with transaction.atomic():
+                results = _ensure_course_run_grades_chunk(course_run, chunk)
+        except IntegrityError:
+            # A grade in this chunk was created concurrently (e.g. by the grades
+            # webhook), so fall back to the row-by-row upsert for this chunk
+            log.warning(
+                "Conflict bulk-saving grades for %s, retrying chunk one grade at a time",
+                course_run,
+            )
+            results = []
+            for edx_grade, user in chunk:
+                try:
+                    run_grade, created, updated = ensure_course_run_grade(
+                        user=user,
+                        course_run=course_run,
+                        edx_grade=edx_grade,
+                        should_update=True,
+                    )
+                except ValidationError:
+                    log.exception(
+                        "Can't save grade %s for %s in %s, skipping certificate generation",
+                        edx_grade,
+                        user,
+                        course_run,
+                    )
+                    continue
+                results.append((run_grade, user, created, updated))
+        stats["grade_write_ms"] += int((time.monotonic() - write_start) * 1000)
+        yield from results
+
+
 def _filter_valid_course_keys(runs):
     """Filter runs to get valid course keys and create lookup dict."""
     runs_by_course_id = {}
@@ -1053,7 +1201,7 @@ def generate_course_run_certificates(  # noqa: C901
     - If user is provided, only that user's grade/certificate is processed.
     - If force is True, certificate date/eligibility checks are bypassed.
 
-    When called without arguments (periodic task path), it fetches all eligible course runs and
+    When called without arguments, it fetches all eligible course runs and
     processes grades/certificates for all users in each run.
 
     Args:
@@ -1062,9 +1210,10 @@ def generate_course_run_certificates(  # noqa: C901
         force (bool): If True, bypass certificate_available_date and eligibility checks.
 
     Returns:
-        None
+        Counter: The grade/certificate stats, summed over all of the processed course runs
     """
     now = now_in_utc()
+    totals = Counter()
 
     if course_run:
         course_runs = [course_run]
@@ -1073,29 +1222,23 @@ def generate_course_run_certificates(  # noqa: C901
 
         if course_runs is None or course_runs.count() == 0:
             log.info("No course runs matched the certificates generation criteria")
-            return
+            return totals
 
     for run in course_runs:
+        stats = Counter()
+        run_start = time.monotonic()
         edx_grade_user_iter = exception_logging_generator(
-            get_edx_grades_with_users(run, user=user)
+            get_edx_grades_with_users(run, user=user, stats=stats)
         )
-        stats = Counter()
-        for edx_grade, run_user in edx_grade_user_iter:
-            try:
-                course_run_grade, created, updated = ensure_course_run_grade(
-                    user=run_user,
-                    course_run=run,
-                    edx_grade=edx_grade,
-                    should_update=True,
-                )
-            except ValidationError:
-                msg = f"Can't save grade {edx_grade} for {run_user} in {run}, skipping certificate generation"
-                log.exception(msg)
-                continue
-
-            if created:
+        for (
+            course_run_grade,
+            run_user,
+            grade_created,
+            grade_updated,
+        ) in ensure_course_run_grades(run, edx_grade_user_iter, stats=stats):
+            if grade_created:
                 stats["created_grades"] += 1
-            elif updated:
+            elif grade_updated:
                 stats["updated_grades"] += 1
 
             # Check certificate generation eligibility
@@ -1141,9 +1284,13 @@ def generate_course_run_certificates(  # noqa: C901
                     )
                     stats["generated_certificates"] += 1
 
+        run_ms = int((time.monotonic() - run_start) * 1000)
         log.info(
-            f"Finished processing course run {run}: created grades for {stats['created_grades']} users, updated grades for {stats['updated_grades']} users, generated certificates for {stats['generated_certificates']} users, failed certificates for {stats['failed_certificates']} users"  # noqa: G004
+            f"Finished processing course run {run}: created grades for {stats['created_grades']} users, updated grades for {stats['updated_grades']} users, generated certificates for {stats['generated_certificates']} users, failed certificates for {stats['failed_certificates']} users, fetched {stats['grade_pages']} grade pages with {stats['unmatched_usernames']} unmatched usernames in {stats['user_lookup_ms']}ms of user lookups, spent {stats['grade_write_ms']}ms writing grades, took {run_ms}ms"  # noqa: G004
         )
+        totals.update(stats)
+
+    return totals
 
 
 def manage_course_run_certificate_access(user, courseware_id, revoke_state):
@@ -1217,90 +1364,203 @@ def override_user_grade(
     return course_run_grade
 
 
-def _has_earned_program_cert(user, program):
+def _load_program_requirement_trees(program_ids):
     """
-    Checks if a user has earned all the course certificates required
-    for a given program.
+    Loads the requirement trees for a set of programs, along with the trees of any
+    programs they require, with one query per level of program nesting.
 
     Args:
-        user (User): a Django user.
-        program (programs.models.Program): program where the user is enrolled.
+        program_ids (iterable of int): ids of the programs to load the trees for
 
     Returns:
-        bool: True if a user has earned all the course certificates required
-              for a given program else False
+        ProgramRequirementTrees: the root node for each program, the child nodes for
+            each node path, and the ids of the required programs that have a paid
+            enrollment mode
+    """
+    roots = {}
+    children = defaultdict(list)
+    required_program_ids = set()
+    program_ids = set(program_ids)
+    loaded_ids = set()
+    while program_ids:
+        loaded_ids |= program_ids
+        for node in ProgramRequirement.objects.filter(
+            program_id__in=program_ids
+        ).order_by("path"):
+            if node.is_root:
+                roots[node.program_id] = node
+            else:
+                children[node.path[: -ProgramRequirement.steplen]].append(node)
+            if node.is_program:
+                required_program_ids.add(node.required_program_id)
+        program_ids = required_program_ids - loaded_ids
+
+    paid_program_ids = set(
+        Program.objects.filter(
+            id__in=required_program_ids, enrollment_modes__requires_payment=True
+        ).values_list("id", flat=True)
+    )
+    return ProgramRequirementTrees(roots, children, paid_program_ids)
+
+
+def _get_passed_course_ids(user_ids, course_ids):
     """
+    Gets the courses that each user has passed, out of the given courses.
 
-    user_courseruns = (
-        CourseRun.objects.filter(
-            enrollments__user=user,
+    A course counts as passed if the user has an active enrollment in a
+    non-variant run of it, and either a non-revoked certificate for that run or a
+    passing grade in it (if the run doesn't offer a verified mode).
+
+    Returns:
+        dict: user id -> set of passed course ids
+    """
+    enrolled_runs = (
+        CourseRun.objects.nonvariant()
+        .filter(
+            course_id__in=course_ids,
+            enrollments__user_id__in=user_ids,
             enrollments__active=True,
             enrollments__change_status__isnull=True,
         )
-        .nonvariant()
-        .filter(course__in=program.courses_qset)
+        .values_list("enrollments__user_id", "id", "course_id")
     )
+    passed_runs = {
+        *CourseRunCertificate.all_objects.filter(
+            user_id__in=user_ids,
+            course_run__course_id__in=course_ids,
+            is_revoked=False,
+        ).values_list("user_id", "course_run_id"),
+        *CourseRunGrade.objects.filter(
+            user_id__in=user_ids,
+            course_run__course_id__in=course_ids,
+            passed=True,
+        )
+        .exclude(course_run__enrollment_modes__mode_slug=EDX_ENROLLMENT_VERIFIED_MODE)
+        .values_list("user_id", "course_run_id"),
+    }
+    passed_course_ids = defaultdict(set)
+    for user_id, run_id, course_id in enrolled_runs:
+        if (user_id, run_id) in passed_runs:
+            passed_course_ids[user_id].add(course_id)
+    return passed_course_ids
 
-    cert_courses = Course.objects.filter(
-        courseruns__in=user_courseruns,
-        courseruns__courseruncertificates__user=user,
-        courseruns__courseruncertificates__is_revoked=False,
-    )
-    grade_courses = Course.objects.filter(
-        courseruns__in=user_courseruns.exclude(
-            enrollment_modes__mode_slug=EDX_ENROLLMENT_VERIFIED_MODE
-        ),
-        courseruns__grades__user=user,
-        courseruns__grades__passed=True,
-    )
-    root = ProgramRequirement.get_root_nodes().get(program=program)
 
-    def _has_earned(node):
-        if node.is_root or node.is_all_of_operator:
-            # has passed all of the child requirements
-            log.debug("node is root or all of, stepping through children")
-            return all(_has_earned(child) for child in node.get_children())
-        elif node.is_min_number_of_operator:
-            # has passed a minimum of the child requirements
-            log.debug(
-                "node is min num, checking children for %s passes", node.operator_value
-            )
-            return len(list(filter(_has_earned, node.get_children()))) >= int(
-                node.operator_value
-            )
-        elif node.is_course:
-            # has passed the referenced course
-            log.debug(
-                "node is course, checking for cert/pass for %s", node.course.readable_id
-            )
-            return node.course in [*cert_courses, *grade_courses]
-        elif node.is_program:
-            # If the program has a verified mode (requires_payment=True), then
-            # check for a certificate. If not, then recurse; if the learner would
-            # have earned a certificate, we should count that.
-            if node.required_program.enrollment_modes.filter(
-                requires_payment=True
-            ).exists():
-                log.debug(
-                    "node is program w/ verified enrollment, checking for cert for %s",
-                    node.required_program.readable_id,
-                )
-                return ProgramCertificate.all_objects.filter(
-                    user=user, program=node.required_program, is_revoked=False
-                ).exists()
+def _has_earned_requirement(node, trees, passed_course_ids, program_cert_ids, memo):
+    """
+    Evaluates a program requirement node against a user's passed courses and
+    program certificates, entirely in memory.
 
-            log.debug(
-                "node is audit-only program, checking for pass for %s",
-                node.required_program.readable_id,
+    Args:
+        node (ProgramRequirement): the node to evaluate
+        trees (ProgramRequirementTrees): the loaded requirement trees
+        passed_course_ids (set of int): ids of the courses the user has passed
+        program_cert_ids (set of int): ids of the programs the user holds a certificate for
+        memo (dict): program id -> whether the user has earned it, for required programs
+
+    Returns:
+        bool: True if the user has met the requirement
+    """
+
+    def _has_earned(child):
+        return _has_earned_requirement(
+            child, trees, passed_course_ids, program_cert_ids, memo
+        )
+
+    node_children = trees.children[node.path]
+    if node.is_root or node.is_all_of_operator:
+        # has passed all of the child requirements
+        return all(_has_earned(child) for child in node_children)
+    elif node.is_min_number_of_operator:
+        # has passed a minimum of the child requirements
+        return len(list(filter(_has_earned, node_children))) >= int(node.operator_value)
+    elif node.is_course:
+        # has passed the referenced course
+        return node.course_id in passed_course_ids
+    elif node.is_program:
+        # If the program has a verified mode (requires_payment=True), then
+        # check for a certificate. If not, then recurse; if the learner would
+        # have earned a certificate, we should count that.
+        required_program_id = node.required_program_id
+        if required_program_id in trees.paid_program_ids:
+            return required_program_id in program_cert_ids
+        if required_program_id not in memo:
+            # guards against requirement cycles while the program is evaluated
+            memo[required_program_id] = False
+            required_root = trees.roots.get(required_program_id)
+            memo[required_program_id] = required_root is not None and _has_earned(
+                required_root
             )
+        return memo[required_program_id]
 
-            return _has_earned_program_cert(user, node.required_program)
+    return False
 
-        log.debug("node is weird, returning false")
 
-        return False
+def get_earned_program_certificates(user_programs):
+    """
+    Evaluates the program requirements for many (user, program) pairs with a fixed
+    number of queries.
 
-    return _has_earned(root)
+    The requirement trees, the users' passed courses and their program certificates
+    are each loaded once for the whole set, and the trees are then evaluated in
+    memory.
+
+    Args:
+        user_programs (iterable of (User, Program)): the pairs to evaluate
+
+    Returns:
+        set of (int, int): the (user id, program id) pairs where the user has earned
+            the program's requirements
+    """
+    user_programs = list(user_programs)
+    if not user_programs:
+        return set()
+
+    user_ids = {user.id for user, _ in user_programs}
+    trees = _load_program_requirement_trees(
+        {program.id for _, program in user_programs}
+    )
+    course_ids = {
+        node.course_id
+        for nodes in trees.children.values()
+        for node in nodes
+        if node.is_course
+    }
+    passed_course_ids = _get_passed_course_ids(user_ids, course_ids)
+    program_cert_ids = defaultdict(set)
+    for user_id, program_id in ProgramCertificate.all_objects.filter(
+        user_id__in=user_ids, program_id__in=trees.paid_program_ids, is_revoked=False
+    ).values_list("user_id", "program_id"):
+        program_cert_ids[user_id].add(program_id)
+
+    earned = set()
+    memos = defaultdict(dict)
+    for user, program in user_programs:
+        root = trees.roots.get(program.id)
+        if root is not None and _has_earned_requirement(
+            root,
+            trees,
+            passed_course_ids[user.id],
+            program_cert_ids[user.id],
+            memos[user.id],
+        ):
+            earned.add((user.id, program.id))
+    return earned
+
+
+def _has_earned_program_cert(user, program):
+    """
+    Checks if a user has earned all the course certificates required
+    for a given program.
+
+    Args:
+        user (User): a Django user.
+        program (programs.models.Program): program where the user is enrolled.
+
+    Returns:
+        bool: True if a user has earned all the course certificates required
+              for a given program else False
+    """
+    return (user.id, program.id) in get_earned_program_certificates([(user, program)])
 
 
 def generate_program_certificate(user, program, force_create=False):  # noqa: FBT002
@@ -1377,31 +1637,6 @@ def generate_program_certificate(user, program, force_create=False):  # noqa: FB
     return program_cert, created
 
 
-def generate_multiple_programs_certificate(user, programs):
-    """
-    Create a program certificate if the user has a course certificate
-    for each course in the program. Also, It will create the
-    program enrollment if it does not exist for the user.
-
-    Args:
-        user (User): a Django user.
-        programs (list of objects of programs.models.Program): programs where the user is enrolled.
-
-    Returns:
-        list of [(ProgramCertificate or None, bool), (ProgramCertificate or None, bool)]: the return
-        result is ordered as the order of programs list
-
-    (ProgramCertificate or None, bool): A tuple containing a
-    ProgramCertificate (or None if one was not found or created) paired
-    with a boolean indicating whether the certificate was newly created.
-    """
-    results = []
-    for program in programs:
-        result = generate_program_certificate(user, program)
-        results.append(result)
-    return results
-
-
 def get_eligible_program_certificate_candidates():
     """
     Return a queryset of ProgramEnrollment rows that are eligible for a program
@@ -1414,7 +1649,9 @@ def get_eligible_program_certificate_candidates():
     - No existing ProgramCertificate (including revoked) for the same user+program pair
 
     The queryset is ordered by primary key for stable pk-windowed batching and
-    annotated with `has_program_cert` for transparency.
+    annotated with `has_program_cert` for transparency, and with
+    `passed_required_courses`, the number of the program's own required courses
+    that the user has passed or has a certificate for.
 
     Returns:
         QuerySet[ProgramEnrollment]
@@ -1423,6 +1660,35 @@ def get_eligible_program_certificate_candidates():
         user_id=OuterRef("user_id"),
         program_id=OuterRef("program_id"),
     )
+    run_cert = CourseRunCertificate.all_objects.filter(
+        user_id=OuterRef(OuterRef("user_id")),
+        course_run_id=OuterRef("id"),
+        is_revoked=False,
+    )
+    run_passed_grade = CourseRunGrade.objects.filter(
+        user_id=OuterRef(OuterRef("user_id")),
+        course_run_id=OuterRef("id"),
+        passed=True,
+    ).exclude(course_run__enrollment_modes__mode_slug=EDX_ENROLLMENT_VERIFIED_MODE)
+    passed_required_courses = (
+        CourseRun.objects.nonvariant()
+        .filter(
+            course__in_programs__program_id=OuterRef("program_id"),
+            course__in_programs__node_type=ProgramRequirementNodeType.COURSE,
+            enrollments__user_id=OuterRef("user_id"),
+            enrollments__active=True,
+            enrollments__change_status__isnull=True,
+        )
+        .filter(Exists(run_cert) | Exists(run_passed_grade))
+        .annotate(
+            count=Func(
+                F("course_id"),
+                function="COUNT",
+                template="%(function)s(DISTINCT %(expressions)s)",
+            )
+        )
+        .values("count")
+    )
 
     return (
         ProgramEnrollment.objects.filter(
@@ -1431,6 +1697,7 @@ def get_eligible_program_certificate_candidates():
         )
         .annotate(has_program_cert=Exists(existing_cert))
         .filter(has_program_cert=False)
+        .annotate(passed_required_courses=passed_required_courses)
         .select_related("user", "program")
         .prefetch_related(
             Prefetch(
@@ -1444,6 +1711,128 @@ def get_eligible_program_certificate_candidates():
     )
 
 
+def get_min_required_course_count(requirements):
+    """
+    Computes the fewest of a program's own required courses that a learner has to
+    pass to earn the program, from its requirement nodes.
+
+    This is a lower bound used to rule out learners cheaply: required programs
+    count as zero, since they can be satisfied without passing any of this
+    program's courses.
+
+    Args:
+        requirements (iterable of ProgramRequirement): all of the program's requirement nodes
+
+    Returns:
+        int: the minimum number of required courses
+    """
+    root = None
+    children = defaultdict(list)
+    course_ids = []
+    for node in requirements:
+        if node.is_root:
+            root = node
+        else:
+            children[node.path[: -ProgramRequirement.steplen]].append(node)
+        if node.is_course:
+            course_ids.append(node.course_id)
+
+    if root is None or len(course_ids) != len(set(course_ids)):
+        # A course listed more than once could satisfy several branches of the
+        # tree at the same time, so the per-branch counts can't be summed.
+        return 0
+
+    def _min_count(node):
+        if node.is_course:
+            return 1
+        elif node.is_root or node.is_all_of_operator:
+            return sum(_min_count(child) for child in children[node.path])
+        elif node.is_min_number_of_operator:
+            child_counts = sorted(_min_count(child) for child in children[node.path])
+            return sum(child_counts[: int(node.operator_value)])
+        return 0
+
+    return _min_count(root)
+
+
+def _prune_program_certificate_candidates(enrollments, min_required_courses):
+    """
+    Leaves out the enrollments whose learner hasn't passed as many of the
+    program's required courses as it needs at minimum.
+
+    Args:
+        enrollments (list of ProgramEnrollment): candidates annotated with passed_required_courses
+        min_required_courses (dict): program id to its minimum required course count,
+            filled in for programs that aren't in it yet
+
+    Returns:
+        list of ProgramEnrollment: the enrollments that could have earned the program
+    """
+    plausible = []
+    for enrollment in enrollments:
+        if enrollment.program_id not in min_required_courses:
+            min_required_courses[enrollment.program_id] = get_min_required_course_count(
+                enrollment.program.all_requirements.all()
+            )
+        if (enrollment.passed_required_courses or 0) >= min_required_courses[
+            enrollment.program_id
+        ]:
+            plausible.append(enrollment)
+    return plausible
+
+
+def _evaluate_program_certificate(user, program):
+    """
+    Evaluates the requirements of a single user and program.
+
+    Returns:
+        set of (int, int) or None: the earned (user id, program id) pair, if any,
+            or None if the requirements couldn't be evaluated
+    """
+    try:
+        return get_earned_program_certificates([(user, program)])
+    except Exception:
+        log.exception(
+            "Error evaluating program requirements for user=%s program=%s",
+            user.id,
+            program.id,
+        )
+        return None
+
+
+def evaluate_program_certificates(user_programs):
+    """
+    Evaluates the program requirements for many users and programs together with
+    get_earned_program_certificates. If that fails, the pairs are evaluated one
+    at a time instead, so a single bad record only fails its own pair.
+
+    Args:
+        user_programs (list of (User, Program)): the users and programs to evaluate
+
+    Returns:
+        tuple of (set, set): the (user id, program id) pairs that earned a
+            certificate, and the pairs that couldn't be evaluated
+    """
+    try:
+        return get_earned_program_certificates(user_programs), set()
+    except Exception:
+        log.exception(
+            "Error evaluating program requirements for %d users and programs "
+            "together, evaluating them one at a time",
+            len(user_programs),
+        )
+
+    earned = set()
+    failed = set()
+    for user, program in user_programs:
+        result = _evaluate_program_certificate(user, program)
+        if result is None:
+            failed.add((user.id, program.id))
+        else:
+            earned |= result
+    return earned, failed
+
+
 def generate_missing_program_certificates(
     batch_size=500,
 ):
@@ -1452,7 +1841,11 @@ def generate_missing_program_certificates(
     live-program enrollment that is missing one and has earned it.
 
     Processes candidates in pk-windowed batches so the full result set is never
-    materialised in memory at once.  Each enrollment is handled independently so
+    materialised in memory at once.  Candidates that haven't passed as many of the
+    program's required courses as it needs at minimum are pruned up front, and
+    the program requirements for the rest of each batch are evaluated together
+    with get_earned_program_certificates.  If that fails, the batch's enrollments are
+    evaluated one at a time instead.  Each enrollment is handled independently so
     a single bad record does not abort the entire run.
 
     Args:
@@ -1462,10 +1855,13 @@ def generate_missing_program_certificates(
         dict: Summary counters:
             - processed (int): total enrollments evaluated
             - created (int): certificates actually written
-            - ineligible (int): enrollments that did not pass _has_earned_program_cert
+            - ineligible (int): enrollments that have not earned the program requirements
+            - pruned (int): ineligible enrollments that were ruled out by the
+                required course count alone
             - failed (int): enrollments skipped due to an unexpected exception
     """
     stats = Counter()
+    min_required_courses = {}
     candidate_qs = get_eligible_program_certificate_candidates()
     last_id = 0
     while True:
@@ -1474,15 +1870,36 @@ def generate_missing_program_certificates(
             break
 
         batch_stats = Counter()
+        plausible = _prune_program_certificate_candidates(batch, min_required_courses)
+        stats["pruned"] += len(batch) - len(plausible)
+        batch_stats["pruned"] += len(batch) - len(plausible)
+
+        earned, failed = evaluate_program_certificates(
+            [(enrollment.user, enrollment.program) for enrollment in plausible]
+        )
+
         for enrollment in batch:
             last_id = enrollment.id
             stats["processed"] += 1
 
+            if (enrollment.user_id, enrollment.program_id) in failed:
+                stats["failed"] += 1
+                batch_stats["failed"] += 1
+                continue
+
+            if (enrollment.user_id, enrollment.program_id) not in earned:
+                stats["ineligible"] += 1
+                batch_stats["ineligible"] += 1
+                continue
+
             try:
+                # The candidates already have a verified enrollment and no
+                # certificate, and the batch evaluation above has checked the
+                # requirements, so there's nothing left to re-check per enrollment.
                 _, created = generate_program_certificate(
                     user=enrollment.user,
                     program=enrollment.program,
-                    force_create=False,
+                    force_create=True,
                 )
                 if created:
                     stats["created"] += 1
@@ -1502,20 +1919,22 @@ def generate_missing_program_certificates(
 
         log.info(
             "generate_missing_program_certificates batch finished: "
-            "last_id=%d batch_size=%d created=%d ineligible=%d failed=%d",
+            "last_id=%d batch_size=%d created=%d ineligible=%d pruned=%d failed=%d",
             last_id,
             len(batch),
             batch_stats["created"],
             batch_stats["ineligible"],
+            batch_stats["pruned"],
             batch_stats["failed"],
         )
 
     log.info(
         "generate_missing_program_certificates complete: processed=%d "
-        "created=%d ineligible=%d failed=%d",
+        "created=%d ineligible=%d pruned=%d failed=%d",
         stats["processed"],
         stats["created"],
         stats["ineligible"],
+        stats["pruned"],
         stats["failed"],
     )
 
@@ -42,12 +42,15 @@ from courses.api import (
     create_run_enrollments,
     deactivate_run_enrollment,
     defer_enrollment,
+    ensure_course_run_grades,
     generate_course_run_certificates,
     generate_missing_program_certificates,
     generate_openedx_course_url,
     generate_program_certificate,
     get_certificate_grade_eligible_runs,
+    get_earned_program_certificates,
     get_eligible_program_certificate_candidates,
+    get_min_required_course_count,
     get_verifiable_credentials_payload,
     import_courserun_from_edx,
     manage_course_run_certificate_access,
@@ -91,6 +94,8 @@ from courses.models import (
     CourseRunCertificate,
     CourseRunEnrollment,
     CourseRunEnrollmentAudit,
+    CourseRunGrade,
+    CourseRunGradeAudit,
     EnrollmentMode,
     PaidCourseRun,
     ProgramCertificate,
@@ -1240,15 +1245,16 @@ def test_sync_course_runs(settings, mocker, mocked_api_response, expect_success)
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.queue_fastly_purges")
 def test_sync_course_runs_skips_unchanged(
-    mock_purge_delay, mock_on_commit, settings, mocker
+    mock_queue_purges, mock_on_commit, settings, mocker
 ):
     """
     A run whose edX values match what's already stored is not re-saved, so it
     triggers no additional full-column UPDATE and no additional Fastly purge.
     """
     settings.OPENEDX_SERVICE_WORKER_API_TOKEN = "mock_api_token"  # noqa: S105
+    settings.MIT_LEARN_FASTLY_SERVICE_ID = "test-learn-service-id"
 
     course_run = CourseRunFactory.create(courseware_id="course-v1:MITx+6.00.1x+3T2015")
     course_detail = CourseDetail(
@@ -1268,18 +1274,18 @@ def test_sync_course_runs_skips_unchanged(
 
     # Ignore any purges enqueued by the factory setup above so we only measure
     # purges caused by the sync calls themselves.
-    mock_purge_delay.reset_mock()
+    mock_queue_purges.reset_mock()
 
     # First pass writes the edX values and enqueues exactly one purge.
     success_count, failure_count = sync_course_runs([course_run])
     assert (success_count, failure_count) == (1, 0)
-    assert mock_purge_delay.call_count == 1
+    assert mock_queue_purges.call_count == 1
 
     # Second pass with identical edX data is a no-op: no save, no new purge.
-    mock_purge_delay.reset_mock()
+    mock_queue_purges.reset_mock()
     success_count, failure_count = sync_course_runs([course_run])
     assert (success_count, failure_count) == (0, 0)
-    assert mock_purge_delay.call_count == 0
+    assert mock_queue_purges.call_count == 0
 
 
 @pytest.mark.parametrize(
@@ -1505,8 +1511,8 @@ def test_generate_course_certificates_self_paced_course(
         "hubspot_sync.api.upsert_custom_properties",
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(passed_grade_with_enrollment, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(passed_grade_with_enrollment, user, True, False)],
     )
     mocker.patch(
         "courses.api.exception_logging_generator",
@@ -1557,8 +1563,8 @@ def test_course_certificates_with_course_end_date_self_paced_combination(  # noq
     )
 
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(passed_grade_with_enrollment, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(passed_grade_with_enrollment, user, True, False)],
     )
 
     generate_course_run_certificates()
@@ -1596,8 +1602,8 @@ def test_generate_course_certificates_with_course_end_date(  # noqa: PLR0913
         "hubspot_sync.api.upsert_custom_properties",
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(passed_grade_with_enrollment, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(passed_grade_with_enrollment, user, True, False)],
     )
     mocker.patch(
         "courses.api.exception_logging_generator",
@@ -1637,10 +1643,10 @@ def test_generate_course_certificates_failure_isolation(
         return_value=[(grade_1, run_user_1), (grade_2, run_user_2)],
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        side_effect=[
-            (grade_1, True, False),
-            (grade_2, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[
+            (grade_1, run_user_1, True, False),
+            (grade_2, run_user_2, True, False),
         ],
     )
     mock_process = mocker.patch(
@@ -1687,8 +1693,8 @@ def test_webhook_certificate_status(  # noqa: PLR0913
         return_value=iter([(grade_obj, user)]),
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(grade_obj, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(grade_obj, user, True, False)],
     )
 
     generate_course_run_certificates(user=user, course_run=course_run, force=True)
@@ -1717,8 +1723,8 @@ def test_webhook_certificate_already_exists(
         return_value=iter([(passed_grade_with_enrollment, user)]),
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(passed_grade_with_enrollment, False, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(passed_grade_with_enrollment, user, False, False)],
     )
 
     # First call creates the certificate
@@ -1764,8 +1770,8 @@ def test_webhook_certificate_bypasses_certificate_available_date(
         return_value=iter([(passed_grade_with_enrollment, user)]),
     )
     mocker.patch(
-        "courses.api.ensure_course_run_grade",
-        return_value=(passed_grade_with_enrollment, True, False),
+        "courses.api.ensure_course_run_grades",
+        return_value=[(passed_grade_with_enrollment, user, True, False)],
     )
 
     generate_course_run_certificates(user=user, course_run=course_run, force=True)
@@ -1794,6 +1800,83 @@ def test_webhook_no_grade_from_edx(
     ).exists()
 
 
+def test_ensure_course_run_grades(django_assert_max_num_queries):
+    """
+    Tests that ensure_course_run_grades creates new grades, updates changed grades with
+    an audit record and leaves unchanged and admin-set grades alone, in bulk
+    """
+    course_run = CourseRunFactory.create()
+    new_user, changed_user, unchanged_user, admin_user = UserFactory.create_batch(4)
+    changed_grade = CourseRunGradeFactory.create(
+        course_run=course_run,
+        user=changed_user,
+        grade=0.4,
+        passed=False,
+        set_by_admin=False,
+    )
+    unchanged_grade = CourseRunGradeFactory.create(
+        course_run=course_run,
+        user=unchanged_user,
+        grade=0.9,
+        passed=True,
+        letter_grade="A",
+        set_by_admin=False,
+    )
+    admin_grade = CourseRunGradeFactory.create(
+        course_run=course_run, user=admin_user, grade=0.7, set_by_admin=True
+    )
+
+    def _edx_grade(percent, passed, letter_grade):
+        return SimpleNamespace(
+            percent=percent, passed=passed, letter_grade=letter_grade
+        )
+
+    edx_grade_users = [
+        (_edx_grade(0.8, passed=True, letter_grade="B"), new_user),
+        (_edx_grade(0.6, passed=True, letter_grade="C"), changed_user),
+        (_edx_grade(0.9, passed=True, letter_grade="A"), unchanged_user),
+        (_edx_grade(0.1, passed=False, letter_grade="F"), admin_user),
+    ]
+
+    # select existing + insert + update + audit insert, plus the savepoint
+    with django_assert_max_num_queries(6):
+        results = list(ensure_course_run_grades(course_run, edx_grade_users))
+
+    assert [
+        (run_grade.user, created, updated) for run_grade, _, created, updated in results
+    ] == [
+        (new_user, True, False),
+        (changed_user, False, True),
+        (unchanged_user, False, False),
+        (admin_user, False, False),
+    ]
+    new_grade = CourseRunGrade.objects.get(course_run=course_run, user=new_user)
+    assert (new_grade.grade, new_grade.passed, new_grade.letter_grade) == (
+        0.8,
+        True,
+        "B",
+    )
+    changed_grade.refresh_from_db()
+    assert (changed_grade.grade, changed_grade.passed) == (0.6, True)
+    audit = CourseRunGradeAudit.objects.get(course_run_grade=changed_grade)
+    assert audit.data_before["grade"] == 0.4
+    assert audit.data_after["grade"] == 0.6
+    assert not CourseRunGradeAudit.objects.filter(
+        course_run_grade__in=[unchanged_grade, admin_grade]
+    ).exists()
+    admin_grade.refresh_from_db()
+    assert admin_grade.grade == 0.7
+
+
+def test_ensure_course_run_grades_invalid_grade(user):
+    """Tests that ensure_course_run_grades skips grades that fail validation"""
+    course_run = CourseRunFactory.create()
+    edx_grade = SimpleNamespace(percent=5.0, passed=True, letter_grade="A")
+
+    assert list(ensure_course_run_grades(course_run, [(edx_grade, user)])) == []
+    assert not CourseRunGrade.objects.filter(course_run=course_run).exists()
+
+
 @patch("courses.signals.upsert_custom_properties")
 def test_course_run_certificates_access(mock_upsert_custom_properties, mocker):
     """Tests that the revoke and unrevoke for a course run certificates sets the states properly"""
@@ -4204,6 +4287,13 @@ def test_generate_missing_program_certificates_failure_isolation(mock_upsert, mo
             raise RuntimeError(msg)
         return None, False
 
+    mocker.patch(
+        "courses.api.get_earned_program_certificates",
+        return_value={
+            (enrollment.user_id, enrollment.program_id)
+            for enrollment in ProgramEnrollment.objects.all()
+        },
+    )
     mock_generate = mocker.patch(
         "courses.api.generate_program_certificate", side_effect=_side_effect
     )
@@ -4215,6 +4305,237 @@ def test_generate_missing_program_certificates_failure_isolation(mock_upsert, mo
     assert mock_generate.call_count == 2
 
 
+@patch("courses.signals.upsert_custom_properties")
+def test_generate_missing_program_certificates_batch_evaluation_failure(
+    mock_upsert, mocker
+):
+    """
+    If evaluating a batch's requirements fails, its enrollments should be
+    evaluated one at a time so only the bad one is counted as failed
+    """
+    enrollments = [
+        ProgramEnrollmentFactory.create(
+            enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE,
+            active=True,
+            program=ProgramFactory.create(live=True),
+        )
+        for _ in range(2)
+    ]
+    good_pair = (enrollments[1].user_id, enrollments[1].program_id)
+
+    def _get_earned(user_programs):
+        user_programs = list(user_programs)
+        if len(user_programs) > 1 or user_programs[0][1] == enrollments[0].program:
+            msg = "bad requirement tree"
+            raise ValueError(msg)
+        return {good_pair}
+
+    mocker.patch("courses.api.get_earned_program_certificates", side_effect=_get_earned)
+    mock_generate = mocker.patch(
+        "courses.api.generate_program_certificate", return_value=(None, True)
+    )
+
+    stats = generate_missing_program_certificates()
+
+    assert stats["processed"] == 2
+    assert stats["failed"] == 1
+    assert stats["created"] == 1
+    mock_generate.assert_called_once_with(
+        user=enrollments[1].user, program=enrollments[1].program, force_create=True
+    )
+
+
+def test_generate_missing_program_certificates_ineligible(mocker, user):
+    """
+    Enrollments that haven't earned the program requirements are counted as
+    ineligible without trying to generate a certificate.
+    """
+    program = ProgramFactory.create(live=True)
+    program.add_requirement(CourseFactory.create())
+    ProgramEnrollment.objects.create(
+        user=user, program=program, enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE
+    )
+    mock_generate = mocker.patch("courses.api.generate_program_certificate")
+    mock_get_earned = mocker.patch(
+        "courses.api.get_earned_program_certificates", return_value=set()
+    )
+
+    stats = generate_missing_program_certificates()
+
+    assert stats["processed"] == 1
+    assert stats["ineligible"] == 1
+    assert stats["pruned"] == 1
+    mock_generate.assert_not_called()
+    assert list(mock_get_earned.call_args[0][0]) == []
+
+
+def test_eligible_program_certificate_candidates_passed_required_courses(
+    user, default_mode_records
+):
+    """
+    Candidates should be annotated with the number of the program's required
+    courses that the user has passed
+    """
+    program = ProgramFactory.create(live=True)
+    courses = CourseFactory.create_batch(3)
+    for course in courses:
+        program.add_requirement(course)
+    ProgramEnrollment.objects.create(
+        user=user, program=program, enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE
+    )
+    _pass_course(user, courses[0], default_mode_records)
+    # a second passed run of the same course is only counted once
+    _pass_course(user, courses[0], default_mode_records)
+    # a passing grade counts if the run doesn't have a verified mode
+    audit_run = CourseRunFactory.create(course=courses[1])
+    audit_run.enrollment_modes.set(
+        [EnrollmentModeFactory(mode_slug=EDX_ENROLLMENT_AUDIT_MODE)]
+    )
+    CourseRunEnrollmentFactory.create(run=audit_run, user=user)
+    CourseRunGradeFactory.create(
+        course_run=audit_run, user=user, passed=True, set_by_admin=False
+    )
+    # a revoked certificate doesn't count
+    revoked_run = CourseRunFactory.create(course=courses[2])
+    CourseRunEnrollmentFactory.create(run=revoked_run, user=user)
+    CourseRunCertificateFactory.create(
+        user=user, course_run=revoked_run, is_revoked=True
+    )
+
+    candidate = get_eligible_program_certificate_candidates().get()
+
+    assert candidate.passed_required_courses == 2
+
+
+@pytest.mark.parametrize(
+    ("min_electives", "expected"),
+    [(0, 2), (1, 2), (2, 3), (3, 4)],
+)
+def test_get_min_required_course_count(min_electives, expected):
+    """
+    get_min_required_course_count should return the fewest of the program's own
+    courses needed to earn it, counting required programs as zero
+    """
+    program = ProgramFactory.create()
+    for course in CourseFactory.create_batch(2):
+        program.add_requirement(course)
+    electives = program.requirements_root.add_child(
+        node_type=ProgramRequirementNodeType.OPERATOR,
+        operator=ProgramRequirement.Operator.MIN_NUMBER_OF,
+        operator_value=min_electives,
+        title="Electives",
+    )
+    electives.add_child(
+        node_type=ProgramRequirementNodeType.PROGRAM,
+        required_program=ProgramFactory.create(),
+    )
+    for course in CourseFactory.create_batch(2):
+        electives.add_child(node_type=ProgramRequirementNodeType.COURSE, course=course)
+
+    assert get_min_required_course_count(program.all_requirements.all()) == expected
+
+
+def test_get_min_required_course_count_repeated_course():
+    """
+    A course that's listed more than once disables the minimum, since one pass
+    could count for several requirements
+    """
+    program = ProgramFactory.create()
+    course = CourseFactory.create()
+    program.add_requirement(course)
+    program.add_elective(course)
+
+    assert get_min_required_course_count(program.all_requirements.all()) == 0
+
+
+def _pass_course(user, course, mode_records):
+    """Enrolls the user in a run of the course and gives them a certificate for it"""
+    course_run = CourseRunFactory.create(course=course)
+    course_run.enrollment_modes.set(mode_records)
+    CourseRunEnrollmentFactory.create(
+        run=course_run, user=user, enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE
+    )
+    CourseRunCertificateFactory.create(user=user, course_run=course_run)
+
+
+def test_get_earned_program_certificates(
+    django_assert_num_queries, default_mode_records
+):
+    """
+    get_earned_program_certificates should evaluate nested requirements for many
+    users and programs with a fixed number of queries
+    """
+    users = UserFactory.create_batch(3)
+    courses = CourseFactory.create_batch(3)
+
+    sub_program = ProgramFactory.create(
+        enrollment_modes=[EnrollmentModeFactory(mode_slug=EDX_ENROLLMENT_AUDIT_MODE)]
+    )
+    sub_program.add_requirement(courses[0])
+    paid_sub_program = ProgramFactory.create()
+    paid_sub_program.add_requirement(courses[0])
+
+    elective_program = ProgramFactory.create()
+    elective_program.add_program_requirement(sub_program)
+    electives = elective_program.requirements_root.add_child(
+        node_type=ProgramRequirementNodeType.OPERATOR,
+        operator=ProgramRequirement.Operator.MIN_NUMBER_OF,
+        operator_value=1,
+        title="Electives",
+    )
+    for course in courses[1:]:
+        electives.add_child(
+            node_type=ProgramRequirementNodeType.COURSE,
+            course=course,
+        )
+    paid_program = ProgramFactory.create()
+    paid_program.add_program_requirement(paid_sub_program)
+    empty_program = ProgramFactory.create()
+    empty_program.get_requirements_root().delete()
+
+    # users[0] passed everything, users[1] is missing an elective and users[2]
+    # only holds the paid sub-program certificate
+    for course in courses:
+        _pass_course(users[0], course, default_mode_records)
+    _pass_course(users[1], courses[0], default_mode_records)
+    ProgramCertificateFactory.create(user=users[0], program=paid_sub_program)
+    ProgramCertificateFactory.create(user=users[2], program=paid_sub_program)
+
+    user_programs = [
+        (user, program)
+        for user in users
+        for program in [elective_program, paid_program, empty_program]
+    ]
+    # two levels of requirement trees, paid programs, enrolled runs, course
+    # certificates, passing grades and program certificates
+    with django_assert_num_queries(7):
+        earned = get_earned_program_certificates(user_programs)
+
+    assert earned == {
+        (users[0].id, elective_program.id),
+        (users[0].id, paid_program.id),
+        (users[2].id, paid_program.id),
+    }
+    assert get_earned_program_certificates([]) == set()
+
+
+def test_get_earned_program_certificates_required_programs_without_trees(user):
+    """
+    Required programs without a requirement tree should only be looked up once,
+    however deep they're nested
+    """
+    program, required_program, empty_program, nested_empty_program = (
+        ProgramFactory.create_batch(4)
+    )
+    program.add_program_requirement(required_program)
+    program.add_program_requirement(empty_program)
+    required_program.add_program_requirement(nested_empty_program)
+    empty_program.get_requirements_root().delete()
+    nested_empty_program.get_requirements_root().delete()
+
+    assert get_earned_program_certificates([(user, program)]) == set()
+
+
 def test_partner_schools_for_program_unfiltered_when_flag_off(settings):
     """With the flag off every active school is returned, preserving old behavior."""
     settings.FEATURES[features.ENABLE_PROGRAM_SPECIFIC_PATHWAY_SCHOOLS] = False
@@ -33,6 +33,14 @@ ENROLL_CHANGE_STATUS_CHOICES = list(
     zip(ALL_ENROLL_CHANGE_STATUSES, ALL_ENROLL_CHANGE_STATUSES)
 )
 
+# Fastly surrogate keys for catalog data. MIT Learn tags its product pages with
+# the per-course and per-program keys; the catalog API also tags its list
+# responses with the list keys, since any course or program change can affect them.
+COURSE_SURROGATE_KEY_TEMPLATE = "mitxonline:course:{readable_id}"
+PROGRAM_SURROGATE_KEY_TEMPLATE = "mitxonline:program:{readable_id}"
+COURSES_SURROGATE_KEY = "mitxonline:courses"
+PROGRAMS_SURROGATE_KEY = "mitxonline:programs"
+
 SYNCED_COURSE_RUN_FIELD_MSG = "This value is synced automatically with edX studio."
 
 AVAILABILITY_ANYTIME = "anytime"
@@ -41,6 +49,8 @@ AVAILABILITY_TYPES = [AVAILABILITY_ANYTIME, AVAILABILITY_DATED]
 AVAILABILITY_CHOICES = list(zip(AVAILABILITY_TYPES, AVAILABILITY_TYPES))
 
 COURSE_KEY_PATTERN = r"^course-v1:[^+]+\+[^+]+\+[^+]+$"
+# Number of edX grades written per transaction when syncing a course run's grades
+COURSE_RUN_GRADE_CHUNK_SIZE = 500
 # Courseware URL generation pattern
 # The courseware URL for a course run follows this pattern:
 # <edX base URL>/learn/course/<readable id>/home
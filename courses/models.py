@@ -270,7 +270,9 @@ class Program(TimestampedModel, ValidateOnSaveMixin):
 
         program_list = []
 
-        for related_program in self.related_programs_qs.all().iterator():
+        for related_program in self.related_programs_qs.select_related(
+            "first_program", "second_program"
+        ).iterator():
             if related_program.first_program == self:
                 program_list.append(related_program.second_program)
             else:
@@ -0,0 +1,60 @@
+"""
+Deduplicated queue of pending program certificate evaluations
+
+Creating a course run certificate may make the learner eligible for a
+certificate in each program the course belongs to. Rather than evaluating
+those programs inline, courses.signals adds the (user, program) pairs to a
+Redis set, so repeated triggers for the same pair collapse into one pending
+entry. courses.tasks.evaluate_pending_program_certificates periodically drains
+the set into batched evaluation tasks.
+"""
+
+_PENDING_KEY = "courses:pending_program_certificate_evaluations"
+
+
+def _get_redis():
+    from django_redis import get_redis_connection  # noqa: PLC0415
+
+    return get_redis_connection("redis")
+
+
+def queue_program_certificate_evaluations(user_id: int, program_ids) -> int:
+    """
+    Add (user, program) pairs to the pending evaluation set
+
+    Args:
+        user_id(int): The id of the user who may have earned the certificates
+        program_ids(iterable of int): The ids of the programs to evaluate
+
+    Returns:
+        int: The number of pairs that weren't already pending
+    """
+    members = [f"{user_id}:{program_id}" for program_id in program_ids]
+    if not members:
+        return 0
+    return _get_redis().sadd(_PENDING_KEY, *members)
+
+
+def drain_program_certificate_evaluations() -> list[tuple[int, int]]:
+    """
+    Atomically remove and return every pending (user, program) pair
+
+    Returns:
+        list of (int, int): The pending (user id, program id) pairs, sorted
+    """
+    redis_client = _get_redis()
+    count = redis_client.scard(_PENDING_KEY)
+    if not count:
+        return []
+    return sorted(
+        tuple(int(part) for part in member.decode().split(":"))
+        for member in redis_client.spop(_PENDING_KEY, count)
+    )
+
+
+def get_pending_program_certificate_evaluation_count() -> int:
+    """
+    Returns:
+        int: The number of (user, program) pairs waiting to be evaluated
+    """
+    return _get_redis().scard(_PENDING_KEY)
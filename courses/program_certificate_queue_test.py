@@ -0,0 +1,40 @@
+"""Tests for courses.program_certificate_queue"""
+
+import pytest
+
+from courses import program_certificate_queue
+
+
+@pytest.fixture(autouse=True)
+def clear_queue():
+    """Start each test with an empty queue"""
+    redis_client = program_certificate_queue._get_redis()  # noqa: SLF001
+    redis_client.delete(program_certificate_queue._PENDING_KEY)  # noqa: SLF001
+    yield
+    redis_client.delete(program_certificate_queue._PENDING_KEY)  # noqa: SLF001
+
+
+def test_queue_deduplicates_pairs():
+    """Repeated triggers for the same user and program should leave a single pending entry"""
+    assert (
+        program_certificate_queue.queue_program_certificate_evaluations(1, [10, 11])
+        == 2
+    )
+    assert program_certificate_queue.queue_program_certificate_evaluations(1, [10]) == 0
+    assert program_certificate_queue.queue_program_certificate_evaluations(2, [10]) == 1
+    assert program_certificate_queue.queue_program_certificate_evaluations(2, []) == 0
+    assert (
+        program_certificate_queue.get_pending_program_certificate_evaluation_count()
+        == 3
+    )
+
+    assert program_certificate_queue.drain_program_certificate_evaluations() == [
+        (1, 10),
+        (1, 11),
+        (2, 10),
+    ]
+    assert program_certificate_queue.drain_program_certificate_evaluations() == []
+    assert (
+        program_certificate_queue.get_pending_program_certificate_evaluation_count()
+        == 0
+    )
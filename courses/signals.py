@@ -2,20 +2,28 @@
 Signals for mitxonline course certificates
 """
 
-from django.conf import settings
 from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from courses.api import generate_multiple_programs_certificate
+from courses.constants import COURSES_SURROGATE_KEY, PROGRAMS_SURROGATE_KEY
 from courses.models import (
     Course,
     CourseRun,
     CourseRunCertificate,
+    Department,
     Program,
     ProgramCertificate,
+    ProgramCollection,
+    ProgramCollectionItem,
 )
-from hubspot_sync import tasks as hubspot_tasks
+from courses.program_certificate_queue import queue_program_certificate_evaluations
+from courses.utils import (
+    queue_catalog_list_cache_purge,
+    queue_course_cache_purge,
+    queue_program_cache_purge,
+)
+from hubspot_sync import task_helpers as hubspot_task_helpers
 from hubspot_sync.api import (
     upsert_custom_properties as _upsert_custom_properties,
 )
@@ -38,25 +46,25 @@ def handle_create_course_run_certificate(
     **kwargs,  # pylint: disable=unused-argument  # noqa: ARG001
 ):
     """
-    When a CourseRunCertificate model is created.
+    When a CourseRunCertificate model is created, queue the evaluation of the
+    certificates for the live programs the course belongs to.
     """
     if created:
-        user = instance.user
-        course = instance.course_run.course
-        programs = list(
+        user_id = instance.user_id
+        program_ids = list(
             Program.objects.filter(
-                all_requirements__course=course, live=True
-            ).distinct()
+                all_requirements__course_id=instance.course_run.course_id, live=True
+            )
+            .values_list("id", flat=True)
+            .distinct()
         )
-        if programs:
+        if program_ids:
             transaction.on_commit(
-                lambda: generate_multiple_programs_certificate(user, programs)
+                lambda: queue_program_certificate_evaluations(user_id, program_ids)
             )
 
     transaction.on_commit(
-        lambda: hubspot_tasks.sync_course_run_certificate_with_hubspot.delay(
-            instance.id
-        )
+        lambda: hubspot_task_helpers.sync_hubspot_course_run_certificate(instance.id)
     )
 
 
@@ -74,7 +82,7 @@ def handle_create_program_certificate(
     """When a ProgramCertificate model is created."""
     _ = created
     transaction.on_commit(
-        lambda: hubspot_tasks.sync_program_certificate_with_hubspot.delay(instance.id)
+        lambda: hubspot_task_helpers.sync_hubspot_program_certificate(instance.id)
     )
 
 
@@ -86,16 +94,10 @@ def purge_fastly_cache_on_course_save(
 ):
     """
     Purges the Fastly surrogate key for a Course when it is saved,
-    so that MIT Learn product pages reflecting this course are invalidated.
+    so that MIT Learn product pages and cached catalog API responses
+    reflecting this course are invalidated.
     """
-    from cms.tasks import queue_fastly_surrogate_key_purge  # noqa: PLC0415
-
-    surrogate_key = f"mitxonline:course:{instance.readable_id}"
-    transaction.on_commit(
-        lambda: queue_fastly_surrogate_key_purge.delay(
-            surrogate_key, settings.MIT_LEARN_FASTLY_SERVICE_ID
-        )
-    )
+    queue_course_cache_purge(instance.readable_id)
 
 
 @receiver(post_save, sender=CourseRun, dispatch_uid="courserun_post_save_fastly_purge")
@@ -107,16 +109,9 @@ def purge_fastly_cache_on_course_run_save(
     """
     Purges the Fastly surrogate key for the parent Course when a CourseRun is
     saved (e.g. enrollment mode changes), so that MIT Learn
-    product pages are invalidated.
+    product pages and cached catalog API responses are invalidated.
     """
-    from cms.tasks import queue_fastly_surrogate_key_purge  # noqa: PLC0415
-
-    surrogate_key = f"mitxonline:course:{instance.course.readable_id}"
-    transaction.on_commit(
-        lambda: queue_fastly_surrogate_key_purge.delay(
-            surrogate_key, settings.MIT_LEARN_FASTLY_SERVICE_ID
-        )
-    )
+    queue_course_cache_purge(instance.course.readable_id)
 
 
 @receiver(post_save, sender=Program, dispatch_uid="program_post_save_fastly_purge")
@@ -128,13 +123,79 @@ def purge_fastly_cache_on_program_save(
     """
     Purges the Fastly surrogate key for a Program when it is
     saved (e.g. program requirements, enrollment modes),
-    so that MIT Learn product pages are invalidated.
+    so that MIT Learn product pages and cached catalog API responses
+    are invalidated.
     """
-    from cms.tasks import queue_fastly_surrogate_key_purge  # noqa: PLC0415
+    queue_program_cache_purge(instance.readable_id)
 
-    surrogate_key = f"mitxonline:program:{instance.readable_id}"
-    transaction.on_commit(
-        lambda: queue_fastly_surrogate_key_purge.delay(
-            surrogate_key, settings.MIT_LEARN_FASTLY_SERVICE_ID
-        )
-    )
+
+@receiver(
+    post_save, sender=Department, dispatch_uid="department_post_save_fastly_purge"
+)
+@receiver(
+    post_delete, sender=Department, dispatch_uid="department_post_delete_fastly_purge"
+)
+def purge_fastly_cache_on_department_change(
+    sender,  # noqa: ARG001
+    **kwargs,  # noqa: ARG001
+):
+    """
+    Purges the cached catalog list responses when a Department is saved or
+    deleted, so that the publicly cached departments list is invalidated.
+    """
+    queue_catalog_list_cache_purge(COURSES_SURROGATE_KEY, PROGRAMS_SURROGATE_KEY)
+
+
+@receiver(
+    m2m_changed,
+    sender=Course.departments.through,
+    dispatch_uid="course_departments_m2m_changed_fastly_purge",
+)
+@receiver(
+    m2m_changed,
+    sender=Program.departments.through,
+    dispatch_uid="program_departments_m2m_changed_fastly_purge",
+)
+def purge_fastly_cache_on_department_membership_change(
+    sender,  # noqa: ARG001
+    action,
+    **kwargs,  # noqa: ARG001
+):
+    """
+    Purges the cached catalog list responses when courses or programs are added
+    to or removed from a Department, since the departments list counts them.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        queue_catalog_list_cache_purge(COURSES_SURROGATE_KEY, PROGRAMS_SURROGATE_KEY)
+
+
+@receiver(
+    post_save,
+    sender=ProgramCollection,
+    dispatch_uid="program_collection_post_save_fastly_purge",
+)
+@receiver(
+    post_delete,
+    sender=ProgramCollection,
+    dispatch_uid="program_collection_post_delete_fastly_purge",
+)
+@receiver(
+    post_save,
+    sender=ProgramCollectionItem,
+    dispatch_uid="program_collection_item_post_save_fastly_purge",
+)
+@receiver(
+    post_delete,
+    sender=ProgramCollectionItem,
+    dispatch_uid="program_collection_item_post_delete_fastly_purge",
+)
+def purge_fastly_cache_on_program_collection_change(
+    sender,  # noqa: ARG001
+    **kwargs,  # noqa: ARG001
+):
+    """
+    Purges the cached program list responses when a ProgramCollection or one of
+    its items is saved or deleted, so that the publicly cached program
+    collections list is invalidated.
+    """
+    queue_catalog_list_cache_purge(PROGRAMS_SURROGATE_KEY)
@@ -10,10 +10,13 @@ from courses.factories import (
     CourseFactory,
     CourseRunCertificateFactory,
     CourseRunFactory,
+    DepartmentFactory,
     ProgramCertificateFactory,
+    ProgramCollectionFactory,
     ProgramFactory,
     UserFactory,
 )
+from courses.models import ProgramCollectionItem
 
 pytestmark = pytest.mark.django_db
 
@@ -23,20 +26,20 @@ def mock_certificate_hubspot_sync_tasks(mocker):
     """Mock certificate HubSpot sync tasks to avoid external API calls in signal tests."""
     return {
         "course_run": mocker.patch(
-            "courses.signals.hubspot_tasks.sync_course_run_certificate_with_hubspot.delay"
+            "hubspot_sync.tasks.sync_course_run_certificate_with_hubspot.delay"
         ),
         "program": mocker.patch(
-            "courses.signals.hubspot_tasks.sync_program_certificate_with_hubspot.delay"
+            "hubspot_sync.tasks.sync_program_certificate_with_hubspot.delay"
         ),
     }
 
 
 # pylint: disable=unused-argument
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("courses.signals.generate_multiple_programs_certificate", autospec=True)
-def test_create_course_certificate(generate_program_cert_mock, mock_on_commit, mocker):
+@patch("courses.signals.queue_program_certificate_evaluations", autospec=True)
+def test_create_course_certificate(queue_evaluations_mock, mock_on_commit, mocker):
     """
-    Test that generate_multiple_programs_certificate is called when a course
+    Test that the program certificate evaluations are queued when a course
     certificate is created
     """
     user = UserFactory.create()
@@ -44,37 +47,37 @@ def test_create_course_certificate(generate_program_cert_mock, mock_on_commit, m
     program = ProgramFactory.create()
     program.add_requirement(course_run.course)
     cert = CourseRunCertificateFactory.create(user=user, course_run=course_run)
-    generate_program_cert_mock.assert_called_once_with(user, [program])
+    queue_evaluations_mock.assert_called_once_with(user.id, [program.id])
     cert.save()
-    generate_program_cert_mock.assert_called_once_with(user, [program])
+    queue_evaluations_mock.assert_called_once_with(user.id, [program.id])
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("courses.signals.generate_multiple_programs_certificate", autospec=True)
+@patch("courses.signals.queue_program_certificate_evaluations", autospec=True)
 def test_generate_program_certificate_if_not_live(
-    generate_program_cert_mock, mock_on_commit, mocker
+    queue_evaluations_mock, mock_on_commit, mocker
 ):
     """
-    Test that generate_multiple_programs_certificate is not called when a program is not live
+    Test that no program certificate evaluation is queued when a program is not live
     """
     user = UserFactory.create()
     course_run = CourseRunFactory.create()
     program = ProgramFactory.create(live=False)
     program.add_requirement(course_run.course)
     cert = CourseRunCertificateFactory.create(user=user, course_run=course_run)
-    generate_program_cert_mock.assert_not_called()
+    queue_evaluations_mock.assert_not_called()
     cert.save()
-    generate_program_cert_mock.assert_not_called()
+    queue_evaluations_mock.assert_not_called()
 
 
 # pylint: disable=unused-argument
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("courses.signals.generate_multiple_programs_certificate", autospec=True)
+@patch("courses.signals.queue_program_certificate_evaluations", autospec=True)
 def test_generate_program_certificate_not_called(
-    generate_program_cert_mock, mock_on_commit, mocker
+    queue_evaluations_mock, mock_on_commit, mocker
 ):
     """
-    Test that generate_multiple_programs_certificate is not called when a course
+    Test that no program certificate evaluation is queued when a course
     is not associated with program.
     """
     user = UserFactory.create()
@@ -82,7 +85,7 @@ def test_generate_program_certificate_not_called(
     course_run = CourseRunFactory.create(course=course)
     cert = CourseRunCertificateFactory.create(user=user, course_run=course_run)
     cert.save()
-    generate_program_cert_mock.assert_not_called()
+    queue_evaluations_mock.assert_not_called()
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
@@ -127,9 +130,9 @@ LEARN_SERVICE_ID = "test-learn-service-id"
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.queue_fastly_purges")
 def test_purge_fastly_cache_on_course_save_update(
-    mock_purge_delay, mock_on_commit, settings
+    mock_queue_purges, mock_on_commit, settings
 ):
     """
     Updating (re-saving) a Course enqueues a fresh purge each time.
@@ -137,22 +140,22 @@ def test_purge_fastly_cache_on_course_save_update(
     settings.MIT_LEARN_FASTLY_SERVICE_ID = LEARN_SERVICE_ID
 
     course = CourseFactory.create()
-    mock_purge_delay.assert_called_with(
-        f"mitxonline:course:{course.readable_id}", LEARN_SERVICE_ID
+    mock_queue_purges.assert_called_with(
+        LEARN_SERVICE_ID, [f"mitxonline:course:{course.readable_id}"]
     )
 
     course.title = "Updated Title"
     course.save()
 
-    mock_purge_delay.assert_called_with(
-        f"mitxonline:course:{course.readable_id}", LEARN_SERVICE_ID
+    mock_queue_purges.assert_called_with(
+        LEARN_SERVICE_ID, [f"mitxonline:course:{course.readable_id}"]
     )
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
+@patch("courses.utils.queue_fastly_purges")
 def test_purge_fastly_cache_on_course_run_save(
-    mock_purge_delay, mock_on_commit, settings
+    mock_queue_purges, mock_on_commit, settings
 ):
     """
     Saving a CourseRun enqueues a Fastly surrogate-key purge for the parent
@@ -161,14 +164,16 @@ def test_purge_fastly_cache_on_course_run_save(
     settings.MIT_LEARN_FASTLY_SERVICE_ID = LEARN_SERVICE_ID
 
     course_run = CourseRunFactory.create()
-    mock_purge_delay.assert_called_with(
-        f"mitxonline:course:{course_run.course.readable_id}", LEARN_SERVICE_ID
+    mock_queue_purges.assert_called_with(
+        LEARN_SERVICE_ID, [f"mitxonline:course:{course_run.course.readable_id}"]
     )
 
 
 @patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
-@patch("cms.tasks.queue_fastly_surrogate_key_purge.delay")
-def test_purge_fastly_cache_on_program_save(mock_purge_delay, mock_on_commit, settings):
+@patch("courses.utils.queue_fastly_purges")
+def test_purge_fastly_cache_on_program_save(
+    mock_queue_purges, mock_on_commit, settings
+):
     """
     Saving a Program enqueues a Fastly surrogate-key purge for
     mitxonline:program:<readable_id>.
@@ -176,6 +181,62 @@ def test_purge_fastly_cache_on_program_save(mock_purge_delay, mock_on_commit, se
     settings.MIT_LEARN_FASTLY_SERVICE_ID = LEARN_SERVICE_ID
 
     program = ProgramFactory.create()
-    mock_purge_delay.assert_called_with(
-        f"mitxonline:program:{program.readable_id}", LEARN_SERVICE_ID
+    mock_queue_purges.assert_called_with(
+        LEARN_SERVICE_ID, [f"mitxonline:program:{program.readable_id}"]
     )
+
+
+OWN_SERVICE_ID = "test-own-service-id"
+
+
+@pytest.fixture
+def catalog_public_cache(settings):
+    """Enable public caching of the catalog API on MITx Online's own Fastly service"""
+    settings.MIT_LEARN_FASTLY_SERVICE_ID = LEARN_SERVICE_ID
+    settings.CATALOG_API_PUBLIC_CACHE_ENABLED = True
+    settings.FASTLY_SERVICE_ID = OWN_SERVICE_ID
+
+
+@pytest.mark.usefixtures("catalog_public_cache")
+@patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("courses.utils.queue_fastly_purges")
+def test_purge_fastly_cache_on_department_change(mock_queue_purges, mock_on_commit):
+    """
+    Saving or deleting a Department, or changing its courses, purges the
+    catalog list keys from MITx Online's own service only.
+    """
+    list_purge = (OWN_SERVICE_ID, ["mitxonline:courses", "mitxonline:programs"])
+    department = DepartmentFactory.create()
+    mock_queue_purges.assert_called_once_with(*list_purge)
+
+    course = CourseFactory.create()
+    mock_queue_purges.reset_mock()
+    course.departments.add(department)
+    mock_queue_purges.assert_called_once_with(*list_purge)
+
+    mock_queue_purges.reset_mock()
+    department.delete()
+    mock_queue_purges.assert_called_with(*list_purge)
+
+
+@pytest.mark.usefixtures("catalog_public_cache")
+@patch("courses.signals.transaction.on_commit", side_effect=lambda callback: callback())
+@patch("courses.utils.queue_fastly_purges")
+def test_purge_fastly_cache_on_program_collection_change(
+    mock_queue_purges, mock_on_commit
+):
+    """
+    Saving a ProgramCollection or changing its programs purges the program
+    list key from MITx Online's own service only.
+    """
+    collection = ProgramCollectionFactory.create()
+    mock_queue_purges.assert_called_with(OWN_SERVICE_ID, ["mitxonline:programs"])
+
+    program = ProgramFactory.create()
+    mock_queue_purges.reset_mock()
+    item = ProgramCollectionItem.objects.create(collection=collection, program=program)
+    mock_queue_purges.assert_called_once_with(OWN_SERVICE_ID, ["mitxonline:programs"])
+
+    mock_queue_purges.reset_mock()
+    item.delete()
+    mock_queue_purges.assert_called_once_with(OWN_SERVICE_ID, ["mitxonline:programs"])
@@ -4,21 +4,41 @@ Tasks for the courses app
 """
 
 import logging
+from collections import Counter
+from math import ceil
 
+import celery
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db.models import Prefetch, Q
+from mitol.common.decorators import single_task
+from mitol.common.utils.collections import chunks
 from mitol.common.utils.datetime import now_in_utc
 
 from courses.models import (
     CourseRun,
     CourseRunEnrollment,
     LearnerProgramRecordShare,
+    Program,
     ProgramEnrollment,
     ProgramRequirement,
 )
 from main.celery import app
-from openedx.constants import EDX_ENROLLMENT_AUDIT_MODE
+from main.utils import get_redis_lock
+from openedx.constants import (
+    EDX_ENROLLMENT_AUDIT_MODE,
+    EDX_ENROLLMENT_VERIFIED_MODE,
+)
 
 log = logging.getLogger(__name__)
+User = get_user_model()
+
+# How long a course run's certificate generation lock is held if it isn't renewed,
+# e.g. because the worker holding it died
+COURSE_RUN_CERTIFICATES_LOCK_EXPIRE_SECONDS = 10 * 60
+
+# How many queued (user, program) pairs each program certificate evaluation task handles
+PROGRAM_CERTIFICATE_EVALUATION_CHUNK_SIZE = 200
 
 
 @app.task
@@ -55,14 +75,92 @@ def subscribe_edx_course_emails(enrollment_id):
         enrollment.save()
 
 
-@app.task
-def generate_course_certificates():
+@app.task(bind=True)
+def generate_course_certificates(self):
     """
     Task to generate certificates for courses.
+
+    The eligible course runs are split between at most
+    CERTIFICATE_GENERATION_MAX_CONCURRENT_TASKS subtasks, and the stats from each of
+    them are summarized once they have all finished.
+    """
+    from courses.api import get_certificate_grade_eligible_runs
+
+    course_run_ids = sorted(
+        get_certificate_grade_eligible_runs(now_in_utc()).values_list("id", flat=True)
+    )
+    if not course_run_ids:
+        log.info("No course runs matched the certificates generation criteria")
+        return
+
+    chunk_size = ceil(
+        len(course_run_ids) / settings.CERTIFICATE_GENERATION_MAX_CONCURRENT_TASKS
+    )
+    chunked_tasks = [
+        generate_course_run_certificates_chunk.si(chunk)
+        for chunk in chunks(course_run_ids, chunk_size=chunk_size)
+    ]
+    raise self.replace(
+        celery.chord(chunked_tasks, summarize_course_certificates_results.s())
+    )
+
+
+@app.task(acks_late=True)
+def generate_course_run_certificates_chunk(course_run_ids):
+    """
+    Generate grades and certificates for a set of course runs, one run at a time.
+
+    A run that is already being processed by another worker is skipped.
+
+    Args:
+        course_run_ids (list of int): The ids of the course runs to process
+
+    Returns:
+        dict: The grade/certificate stats, summed over the processed course runs
     """
     from courses.api import generate_course_run_certificates
 
-    generate_course_run_certificates()
+    stats = Counter()
+    for course_run in CourseRun.objects.filter(id__in=course_run_ids):
+        lock = get_redis_lock(
+            f"courses-generate-certificates-lock.{course_run.id}",
+            expire=COURSE_RUN_CERTIFICATES_LOCK_EXPIRE_SECONDS,
+            auto_renewal=True,
+        )
+        if not lock.acquire(blocking=False):
+            log.warning(
+                "Skipping certificate generation for %s, it is already being processed",
+                course_run,
+            )
+            stats["locked_runs"] += 1
+            continue
+        try:
+            stats.update(generate_course_run_certificates(course_run=course_run))
+            stats["processed_runs"] += 1
+        except Exception:
+            log.exception("Error generating certificates for %s", course_run)
+            stats["failed_runs"] += 1
+        finally:
+            lock.release()
+    return dict(stats)
+
+
+@app.task
+def summarize_course_certificates_results(results):
+    """
+    Sum up and log the stats returned by each generate_course_run_certificates_chunk task
+
+    Args:
+        results (list of dict): The stats from each chunk
+
+    Returns:
+        dict: The summed stats
+    """
+    totals = Counter()
+    for result in results:
+        totals.update(result)
+    log.info("Finished generating course certificates: %s", dict(totals))
+    return dict(totals)
 
 
 @app.task
@@ -97,6 +195,99 @@ def generate_program_certificates(batch_size=500):
     )
 
 
+@app.task(bind=True)
+@single_task(30, raise_block=False)
+def evaluate_pending_program_certificates(self):
+    """
+    Drain the queued program certificate evaluations (see
+    courses.program_certificate_queue) into chunked evaluation tasks.
+    """
+    from courses.program_certificate_queue import (
+        drain_program_certificate_evaluations,
+    )
+
+    pairs = drain_program_certificate_evaluations()
+    if not pairs:
+        return
+    log.info("Evaluating %d queued program certificate(s)", len(pairs))
+    chunked_tasks = [
+        evaluate_program_certificates_chunk.si(chunk)
+        for chunk in chunks(pairs, chunk_size=PROGRAM_CERTIFICATE_EVALUATION_CHUNK_SIZE)
+    ]
+    raise self.replace(celery.group(chunked_tasks))
+
+
+@app.task(acks_late=True)
+def evaluate_program_certificates_chunk(user_program_pairs):
+    """
+    Create the program certificates the given users have earned.
+
+    The requirements of every pair with a verified program enrollment are
+    evaluated together with evaluate_program_certificates, and certificates
+    are only created for the pairs that earned one. Pairs for programs that are
+    no longer live, or users that no longer exist, are skipped. A failure for
+    one pair is logged and doesn't stop the rest; generate_program_certificates
+    picks up any certificate missed this way.
+
+    Args:
+        user_program_pairs (list of (int, int)): (user id, program id) pairs to evaluate
+
+    Returns:
+        dict: The evaluation stats for the chunk
+    """
+    from courses.api import (
+        evaluate_program_certificates,
+        generate_program_certificate,
+    )
+
+    user_ids = {user_id for user_id, _ in user_program_pairs}
+    program_ids = {program_id for _, program_id in user_program_pairs}
+    users = User.objects.in_bulk(user_ids)
+    programs = Program.objects.filter(live=True).in_bulk(program_ids)
+    verified_pairs = set(
+        ProgramEnrollment.objects.filter(
+            user_id__in=user_ids,
+            program_id__in=program_ids,
+            enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE,
+        ).values_list("user_id", "program_id")
+    )
+    stats = Counter()
+    user_programs = []
+    for user_id, program_id in user_program_pairs:
+        user = users.get(user_id)
+        program = programs.get(program_id)
+        if user is None or program is None:
+            stats["skipped"] += 1
+        elif (user_id, program_id) not in verified_pairs:
+            stats["evaluated"] += 1
+        else:
+            user_programs.append((user, program))
+
+    earned, failed = evaluate_program_certificates(user_programs)
+    stats["failed"] += len(failed)
+    for user, program in user_programs:
+        if (user.id, program.id) in failed:
+            continue
+        if (user.id, program.id) not in earned:
+            stats["evaluated"] += 1
+            continue
+        try:
+            _, created = generate_program_certificate(user, program, force_create=True)
+        except Exception:
+            log.exception(
+                "Error creating the certificate for user %s in program %s",
+                user.id,
+                program.id,
+            )
+            stats["failed"] += 1
+            continue
+        stats["evaluated"] += 1
+        if created:
+            stats["created"] += 1
+    log.info("Finished evaluating program certificates: %s", dict(stats))
+    return dict(stats)
+
+
 @app.task
 def upgrade_eligible_program_enrollments():
     """Upgrade eligible learners for all audit-mode program enrollments."""
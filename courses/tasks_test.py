@@ -1,17 +1,28 @@
 """Tests for Course related tasks"""
 
+from collections import Counter
+
 import pytest
 
 from courses.factories import (
     CourseRunEnrollmentFactory,
+    CourseRunFactory,
     LearnerProgramRecordShareFactory,
+    ProgramCertificateFactory,
+    ProgramEnrollmentFactory,
+    ProgramFactory,
 )
 from courses.tasks import (
+    evaluate_pending_program_certificates,
+    evaluate_program_certificates_chunk,
     generate_course_certificates,
+    generate_course_run_certificates_chunk,
     generate_program_certificates,
     send_partner_school_email,
     subscribe_edx_course_emails,
+    summarize_course_certificates_results,
 )
+from openedx.constants import EDX_ENROLLMENT_VERIFIED_MODE
 
 pytestmark = pytest.mark.django_db
 
@@ -32,14 +43,95 @@ def test_subscribe_edx_course_emails(mocker, user):
     assert enrollment.edx_emails_subscription is True
 
 
-def test_generate_course_certificates_task(mocker):
-    """Test generate_course_certificates calls the right api functionality from courses"""
+def test_generate_course_certificates_task(mocker, settings):
+    """Test generate_course_certificates splits the eligible runs between chunk tasks"""
+    settings.CERTIFICATE_GENERATION_MAX_CONCURRENT_TASKS = 2
+    course_runs = CourseRunFactory.create_batch(3, certificate_available_date=None)
+    mock_replace = mocker.patch(
+        "celery.app.task.Task.replace", autospec=True, side_effect=TabError
+    )
+    mock_chord = mocker.patch("celery.chord", autospec=True)
+    mock_chunk_task = mocker.patch(
+        "courses.tasks.generate_course_run_certificates_chunk.si"
+    )
+    mock_summarize_task = mocker.patch(
+        "courses.tasks.summarize_course_certificates_results.s"
+    )
+
+    with pytest.raises(TabError):
+        generate_course_certificates.delay()
+
+    course_run_ids = sorted(course_run.id for course_run in course_runs)
+    assert mock_chunk_task.call_args_list == [
+        mocker.call(course_run_ids[:2]),
+        mocker.call(course_run_ids[2:]),
+    ]
+    mock_chord.assert_called_once_with(
+        [mock_chunk_task.return_value, mock_chunk_task.return_value],
+        mock_summarize_task.return_value,
+    )
+    mock_replace.assert_called_once()
+
+
+def test_generate_course_run_certificates_chunk(mocker):
+    """Test generate_course_run_certificates_chunk processes each run and sums up the stats"""
+    course_runs = CourseRunFactory.create_batch(2)
+    generate_course_run_certificates = mocker.patch(
+        "courses.api.generate_course_run_certificates",
+        side_effect=[
+            Counter(created_grades=2, generated_certificates=1),
+            Exception("edX is down"),
+        ],
+    )
+
+    assert generate_course_run_certificates_chunk(
+        [course_run.id for course_run in course_runs]
+    ) == {
+        "created_grades": 2,
+        "generated_certificates": 1,
+        "processed_runs": 1,
+        "failed_runs": 1,
+    }
+    assert generate_course_run_certificates.call_count == 2
+
+
+def test_summarize_course_certificates_results(mocker):
+    """Test summarize_course_certificates_results sums up the stats from each chunk"""
+    mock_log = mocker.patch("courses.tasks.log")
+    results = [
+        {"created_grades": 2, "processed_runs": 1},
+        {"created_grades": 1, "locked_runs": 1},
+    ]
+
+    assert summarize_course_certificates_results(results) == {
+        "created_grades": 3,
+        "processed_runs": 1,
+        "locked_runs": 1,
+    }
+    mock_log.info.assert_called_once()
+
 
+def test_generate_course_certificates_task_no_runs(mocker):
+    """Test generate_course_certificates does nothing when there are no eligible course runs"""
     generate_course_run_certificates = mocker.patch(
         "courses.api.generate_course_run_certificates"
     )
     generate_course_certificates.delay()
-    generate_course_run_certificates.assert_called_once()
+    generate_course_run_certificates.assert_not_called()
+
+
+def test_generate_course_run_certificates_chunk_locked(mocker):
+    """Test that a course run already being processed by another worker is skipped"""
+    course_run = CourseRunFactory.create()
+    generate_course_run_certificates = mocker.patch(
+        "courses.api.generate_course_run_certificates"
+    )
+    mocker.patch(
+        "courses.tasks.get_redis_lock"
+    ).return_value.acquire.return_value = False
+
+    assert generate_course_run_certificates_chunk([course_run.id]) == {"locked_runs": 1}
+    generate_course_run_certificates.assert_not_called()
 
 
 def test_send_partner_school_email(mocker):
@@ -66,3 +158,78 @@ def test_generate_program_certificates_task(mocker):
     )
     generate_program_certificates.delay()
     mock_api.assert_called_once_with(batch_size=500)
+
+
+def test_evaluate_pending_program_certificates(mocker):
+    """Test evaluate_pending_program_certificates drains the queue into chunk tasks"""
+    mocker.patch("courses.tasks.PROGRAM_CERTIFICATE_EVALUATION_CHUNK_SIZE", 2)
+    mocker.patch(
+        "courses.program_certificate_queue.drain_program_certificate_evaluations",
+        return_value=[(1, 10), (1, 11), (2, 10)],
+    )
+    mock_replace = mocker.patch(
+        "celery.app.task.Task.replace", autospec=True, side_effect=TabError
+    )
+    mock_group = mocker.patch("celery.group", autospec=True)
+    mock_chunk_task = mocker.patch(
+        "courses.tasks.evaluate_program_certificates_chunk.si"
+    )
+
+    with pytest.raises(TabError):
+        evaluate_pending_program_certificates.delay()
+
+    assert mock_chunk_task.call_args_list == [
+        mocker.call([(1, 10), (1, 11)]),
+        mocker.call([(2, 10)]),
+    ]
+    mock_group.assert_called_once_with(
+        [mock_chunk_task.return_value, mock_chunk_task.return_value]
+    )
+    mock_replace.assert_called_once()
+
+
+def test_evaluate_pending_program_certificates_empty(mocker):
+    """Test evaluate_pending_program_certificates does nothing when the queue is empty"""
+    mocker.patch(
+        "courses.program_certificate_queue.drain_program_certificate_evaluations",
+        return_value=[],
+    )
+    mock_chunk_task = mocker.patch(
+        "courses.tasks.evaluate_program_certificates_chunk.si"
+    )
+
+    evaluate_pending_program_certificates.delay()
+
+    mock_chunk_task.assert_not_called()
+
+
+def test_evaluate_program_certificates_chunk(mocker, user):
+    """Test evaluate_program_certificates_chunk evaluates the pairs together and sums up the stats"""
+    programs = ProgramFactory.create_batch(4)
+    for program in programs[:3]:
+        ProgramEnrollmentFactory.create(
+            user=user, program=program, enrollment_mode=EDX_ENROLLMENT_VERIFIED_MODE
+        )
+    unlive_program = ProgramFactory.create(live=False)
+    certificate = ProgramCertificateFactory.create(user=user, program=programs[0])
+    evaluate_program_certificates = mocker.patch(
+        "courses.api.evaluate_program_certificates",
+        return_value=({(user.id, programs[0].id)}, {(user.id, programs[2].id)}),
+    )
+    generate_program_certificate = mocker.patch(
+        "courses.api.generate_program_certificate", return_value=(certificate, True)
+    )
+
+    assert evaluate_program_certificates_chunk(
+        [
+            *((user.id, program.id) for program in programs),
+            (user.id, unlive_program.id),
+            (user.id + 1000, programs[0].id),
+        ]
+    ) == {"evaluated": 3, "created": 1, "failed": 1, "skipped": 2}
+    evaluate_program_certificates.assert_called_once_with(
+        [(user, program) for program in programs[:3]]
+    )
+    generate_program_certificate.assert_called_once_with(
+        user, programs[0], force_create=True
+    )
@@ -5,12 +5,18 @@ import re
 from urllib.parse import urljoin
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Prefetch, Q
 from mitol.common.utils.datetime import now_in_utc
 from requests.exceptions import HTTPError
 
+from cms.fastly_purge_queue import queue_fastly_purges
 from courses.constants import (
+    COURSE_SURROGATE_KEY_TEMPLATE,
+    COURSES_SURROGATE_KEY,
     COURSEWARE_URL_PATTERN_TEMPLATE,
+    PROGRAM_SURROGATE_KEY_TEMPLATE,
+    PROGRAMS_SURROGATE_KEY,
     UAI_COURSEWARE_ID_PREFIX,
 )
 from courses.models import (
@@ -322,3 +328,84 @@ def get_courseware_url(courseware_id: str) -> str:
 
     path = COURSEWARE_URL_PATTERN_TEMPLATE.format(courseware_id=courseware_id)
     return urljoin(settings.OPENEDX_COURSE_BASE_URL, path)
+
+
+def get_course_surrogate_key(readable_id: str) -> str:
+    """Return the Fastly surrogate key for the course with the given readable_id"""
+    return COURSE_SURROGATE_KEY_TEMPLATE.format(readable_id=readable_id)
+
+
+def get_program_surrogate_key(readable_id: str) -> str:
+    """Return the Fastly surrogate key for the program with the given readable_id"""
+    return PROGRAM_SURROGATE_KEY_TEMPLATE.format(readable_id=readable_id)
+
+
+def _queue_surrogate_key_purges(object_key: str | None, *list_keys: str):
+    """
+    Queue the Fastly purges for a changed course, program or catalog list once
+    the current transaction commits. The keys are collected in
+    cms.fastly_purge_queue and purged in batches by
+    cms.tasks.flush_pending_fastly_purges.
+
+    The object key, if any, is purged from MIT Learn's service, which tags its
+    product pages with it. If the catalog API is publicly cached, the object and
+    list keys are purged from MITx Online's own service as well.
+    """
+    purges = {}
+    if object_key is not None:
+        if settings.MIT_LEARN_FASTLY_SERVICE_ID:
+            purges[settings.MIT_LEARN_FASTLY_SERVICE_ID] = [object_key]
+        else:
+            # Logged at error level so that Sentry raises an issue: a missing
+            # setting disables cache invalidation entirely
+            log.error(
+                "MIT_LEARN_FASTLY_SERVICE_ID is not set; skipping surrogate key purge for %s",
+                object_key,
+            )
+    if settings.CATALOG_API_PUBLIC_CACHE_ENABLED and settings.FASTLY_SERVICE_ID:
+        purges[settings.FASTLY_SERVICE_ID] = [
+            key for key in (object_key, *list_keys) if key is not None
+        ]
+
+    def _queue_purges():
+        for service_id, surrogate_keys in purges.items():
+            queue_fastly_purges(service_id, surrogate_keys)
+
+    if purges:
+        transaction.on_commit(_queue_purges)
+
+
+def queue_course_cache_purge(readable_id: str):
+    """
+    Queue the Fastly purges for a course whose catalog data has changed.
+
+    Args:
+        readable_id (str): The readable_id of the course
+    """
+    _queue_surrogate_key_purges(
+        get_course_surrogate_key(readable_id), COURSES_SURROGATE_KEY
+    )
+
+
+def queue_program_cache_purge(readable_id: str):
+    """
+    Queue the Fastly purges for a program whose catalog data has changed.
+
+    Args:
+        readable_id (str): The readable_id of the program
+    """
+    _queue_surrogate_key_purges(
+        get_program_surrogate_key(readable_id), PROGRAMS_SURROGATE_KEY
+    )
+
+
+def queue_catalog_list_cache_purge(*list_keys: str):
+    """
+    Queue the Fastly purges for the publicly cached catalog list responses, for
+    changes that aren't tied to a single course or program, like a department
+    or program collection being renamed or changing its members.
+
+    Args:
+        list_keys (str): The list surrogate keys, e.g. COURSES_SURROGATE_KEY
+    """
+    _queue_surrogate_key_purges(None, *list_keys)
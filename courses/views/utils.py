@@ -5,7 +5,9 @@ These were in the views themselves, and have been moved so they're more intuitiv
 to import elsewhere.
 """
 
+from django.conf import settings
 from django.shortcuts import get_object_or_404
+from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 
 
@@ -41,3 +43,66 @@ class ReadableIdLookupMixin:
         obj = get_object_or_404(queryset, **filter_kwargs)
         self.check_object_permissions(self.request, obj)
         return obj
+
+
+class PublicCacheMixin:
+    """
+    Mixin that lets a CDN cache the responses of a read-only catalog viewset.
+
+    When CATALOG_API_PUBLIC_CACHE_ENABLED is set, successful reads are marked
+    publicly cacheable for CATALOG_API_PUBLIC_CACHE_SECONDS and tagged with
+    Fastly surrogate keys, which the course and program save signals purge
+    (see courses.utils.queue_course_cache_purge). Only anonymous requests are
+    cached: logged-in users and requests filtered by a B2B organization or
+    contract, or by the user's approved financial aid, can get user-specific
+    results, so those are left uncached.
+    """
+
+    # Surrogate keys for list responses, and by default for single objects too
+    surrogate_keys = ()
+    private_query_params = (
+        "org_id",
+        "contract_id",
+        "include_approved_financial_aid",
+    )
+
+    def get_object_surrogate_keys(self, data):  # noqa: ARG002
+        """
+        Return the surrogate keys for a single serialized object.
+
+        Args:
+            data (dict): The serialized object
+
+        Returns:
+            list of str: The surrogate keys
+        """
+        return list(self.surrogate_keys)
+
+    def is_publicly_cacheable(self, request, response):
+        """Return True if the response can be cached by the CDN"""
+        return (
+            settings.CATALOG_API_PUBLIC_CACHE_ENABLED
+            and request.method in ("GET", "HEAD")
+            and response.status_code == status.HTTP_200_OK
+            and not request.user.is_authenticated
+            and not any(
+                param in request.query_params for param in self.private_query_params
+            )
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Add the CDN caching headers to a publicly cacheable response"""
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if self.is_publicly_cacheable(request, response):
+            surrogate_keys = (
+                self.get_object_surrogate_keys(response.data)
+                if self.action == "retrieve"
+                else self.surrogate_keys
+            )
+            response["Cache-Control"] = (
+                f"public, max-age=0, s-maxage={settings.CATALOG_API_PUBLIC_CACHE_SECONDS}"
+            )
+            response["Surrogate-Key"] = " ".join(surrogate_keys)
+
+        return response
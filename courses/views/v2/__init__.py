@@ -37,7 +37,11 @@ from courses.api import (
     create_run_enrollments,
     deactivate_run_enrollment,
 )
-from courses.constants import ENROLL_CHANGE_STATUS_UNENROLLED
+from courses.constants import (
+    COURSES_SURROGATE_KEY,
+    ENROLL_CHANGE_STATUS_UNENROLLED,
+    PROGRAMS_SURROGATE_KEY,
+)
 from courses.exceptions import EnrollmentCreationFailedError
 from courses.models import (
     Course,
@@ -72,16 +76,30 @@ from courses.serializers.v2.programs import (
     UserProgramEnrollmentDetailSerializer,
 )
 from courses.utils import (
+    get_course_surrogate_key,
     get_enrollable_courses,
     get_program_certificate_by_enrollment,
+    get_program_surrogate_key,
     get_unenrollable_courses,
 )
+from courses.views.utils import PublicCacheMixin
 from ecommerce.api import create_verified_program_course_run_enrollment
 from ecommerce.models import Product
 from main import features
 from openapi.utils import extend_schema_get_queryset
-from openedx.api import sync_enrollments_with_edx
-from openedx.constants import EDX_ENROLLMENT_AUDIT_MODE, EDX_ENROLLMENT_VERIFIED_MODE
+from openedx.api import (
+    claim_enrollment_sync,
+    is_enrollment_sync_stale,
+    sync_enrollments_with_edx,
+)
+from openedx.constants import (
+    EDX_ENROLLMENT_AUDIT_MODE,
+    EDX_ENROLLMENT_VERIFIED_MODE,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_CURRENT,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING,
+)
+from openedx.tasks import sync_enrollments_with_edx_async
 from variants.models import SupportedVariant
 
 log = logging.getLogger(__name__)
@@ -188,7 +206,9 @@ class ProgramFilterSet(django_filters.FilterSet):
         return queryset.filter(b2b_only=False)
 
 
-class ProgramViewSet(ReadableIdLookupMixin, viewsets.ReadOnlyModelViewSet):
+class ProgramViewSet(
+    PublicCacheMixin, ReadableIdLookupMixin, viewsets.ReadOnlyModelViewSet
+):
     """API viewset for Programs"""
 
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -197,6 +217,11 @@ class ProgramViewSet(ReadableIdLookupMixin, viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProgramFilterSet
     lookup_value_regex = "[^/]+"  # Accept any non-slash character
+    surrogate_keys = (PROGRAMS_SURROGATE_KEY,)
+
+    def get_object_surrogate_keys(self, data):
+        """Tag a program with its own key, which its saves and page publishes purge."""
+        return [get_program_surrogate_key(data["readable_id"])]
 
     def get_serializer_context(self):
         """Add context flags used by ProgramSerializer.
@@ -398,6 +423,7 @@ class CourseParams(BaseModel):
 
 
 class CourseViewSet(
+    PublicCacheMixin,
     QueryParamsMixinView[CourseParams],
     ReadableIdLookupMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -412,6 +438,20 @@ class CourseViewSet(
     filterset_class = CourseFilterSet
     lookup_value_regex = "[^/]+"  # Accept any non-slash character
     validated_params_model = CourseParams
+    surrogate_keys = (COURSES_SURROGATE_KEY,)
+
+    def get_object_surrogate_keys(self, data):
+        """
+        Tag a course with its own key, which its saves, run and product saves
+        and page publishes purge, and with the keys of the programs it lists.
+        """
+        return [
+            get_course_surrogate_key(data["readable_id"]),
+            *[
+                get_program_surrogate_key(program["readable_id"])
+                for program in data.get("programs") or []
+            ],
+        ]
 
     def get_program_filters(self) -> Q:
         """Get filters for course programs"""
@@ -562,11 +602,12 @@ class CourseViewSet(
         return super().list(request, *args, **kwargs)
 
 
-class DepartmentViewSet(viewsets.ReadOnlyModelViewSet):
+class DepartmentViewSet(PublicCacheMixin, viewsets.ReadOnlyModelViewSet):
     """API view set for Departments"""
 
     serializer_class = DepartmentWithCoursesAndProgramsSerializer
     permission_classes = []
+    surrogate_keys = (COURSES_SURROGATE_KEY, PROGRAMS_SURROGATE_KEY)
 
     def get_queryset(self):
         return Department.objects.for_serialization().order_by("name")
@@ -600,7 +641,7 @@ class CourseTopicViewSet(viewsets.ReadOnlyModelViewSet):
         return CoursesTopic.parent_topics_with_courses()
 
 
-class ProgramCollectionViewSet(viewsets.ReadOnlyModelViewSet):
+class ProgramCollectionViewSet(PublicCacheMixin, viewsets.ReadOnlyModelViewSet):
     """
     Readonly viewset for ProgramCollection objects.
     """
@@ -608,6 +649,7 @@ class ProgramCollectionViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = ProgramCollectionSerializer
     pagination_class = Pagination
+    surrogate_keys = (PROGRAMS_SURROGATE_KEY,)
 
     def get_queryset(self):
         """
@@ -697,14 +739,40 @@ class UserEnrollmentsApiViewSet(
         else:
             return {"user": self.request.user}
 
+    def _queue_enrollment_sync(self):
+        """
+        Queue a background edX enrollment sync for the user if theirs is stale.
+
+        Returns:
+            str: the sync status to hint to the client - pending if a sync is
+                queued or running, so the client knows to poll again
+        """
+        user = self.request.user
+        if not is_enrollment_sync_stale(user):
+            return OPENEDX_ENROLLMENT_SYNC_STATUS_CURRENT
+        if claim_enrollment_sync(user):
+            sync_enrollments_with_edx_async.delay(user.id)
+        return OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING
+
     @extend_schema(
         operation_id="user_enrollments_list_v2",
         description="List user enrollments with B2B organization and contract information - API v2. "
         "Use ?exclude_b2b=true to filter out enrollments linked to course runs with B2B contracts. "
-        "Use ?org_id=<id> to filter enrollments by specific B2B organization.",
+        "Use ?org_id=<id> to filter enrollments by specific B2B organization. "
+        f"When enrollments are synced with edX in the background, the {OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER} "
+        f"header is '{OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING}' while a sync is in progress, so the list should be "
+        "requested again shortly.",
     )
     def list(self, request, *args, **kwargs):
         """List user enrollments with optional sync."""
+        if (
+            is_enabled(features.SYNC_ON_DASHBOARD_LOAD)
+            and settings.OPENEDX_ENROLLMENT_SYNC_IN_BACKGROUND
+        ):
+            sync_status = self._queue_enrollment_sync()
+            response = super().list(request, *args, **kwargs)
+            response[OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER] = sync_status
+            return response
         if is_enabled(features.SYNC_ON_DASHBOARD_LOAD):
             ignore_edx_failures = settings.FEATURES.get(
                 features.IGNORE_EDX_FAILURES, False
@@ -81,7 +81,13 @@ from ecommerce.factories import OrderFactory, ProductFactory
 from ecommerce.models import OrderStatus, Product
 from main import features
 from main.test_utils import assert_drf_json_equal, duplicate_queries_check
-from openedx.constants import EDX_ENROLLMENT_AUDIT_MODE, EDX_ENROLLMENT_VERIFIED_MODE
+from openedx.constants import (
+    EDX_ENROLLMENT_AUDIT_MODE,
+    EDX_ENROLLMENT_VERIFIED_MODE,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_CURRENT,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER,
+    OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING,
+)
 from users.factories import UserFactory
 
 pytestmark = [pytest.mark.django_db]
@@ -354,6 +360,89 @@ def test_get_course(
     assert_drf_json_equal(course_data, course_from_fixture, ignore_order=True)
 
 
+@pytest.mark.skip_nplusone_check
+@pytest.mark.parametrize("cache_enabled", [True, False])
+def test_catalog_public_cache_headers(settings, cache_enabled):
+    """Catalog responses are tagged for CDN caching when public caching is enabled"""
+    settings.CATALOG_API_PUBLIC_CACHE_ENABLED = cache_enabled
+    settings.CATALOG_API_PUBLIC_CACHE_SECONDS = 120
+    course = CourseFactory.create()
+    program = ProgramFactory.create()
+    program.add_requirement(course)
+    client = APIClient()
+
+    catalog_responses = {
+        "course": client.get(
+            reverse("v2:courses_api-detail", kwargs={"pk": course.readable_id})
+        ),
+        "courses": client.get(reverse("v2:courses_api-list")),
+        "program": client.get(
+            reverse("v2:programs_api-detail", kwargs={"pk": program.id})
+        ),
+        "departments": client.get(reverse("v2:departments_api-list")),
+        "program_collections": client.get(reverse("v2:program_collections_api-list")),
+    }
+
+    for resp in catalog_responses.values():
+        assert resp.status_code == status.HTTP_200_OK
+        if not cache_enabled:
+            assert resp["Cache-Control"] == "private, no-store"
+            assert not resp.has_header("Surrogate-Key")
+        else:
+            assert resp["Cache-Control"] == "public, max-age=0, s-maxage=120"
+    if cache_enabled:
+        assert catalog_responses["course"]["Surrogate-Key"] == (
+            f"mitxonline:course:{course.readable_id} "
+            f"mitxonline:program:{program.readable_id}"
+        )
+        assert catalog_responses["courses"]["Surrogate-Key"] == "mitxonline:courses"
+        assert (
+            catalog_responses["program"]["Surrogate-Key"]
+            == f"mitxonline:program:{program.readable_id}"
+        )
+        assert (
+            catalog_responses["departments"]["Surrogate-Key"]
+            == "mitxonline:courses mitxonline:programs"
+        )
+        assert (
+            catalog_responses["program_collections"]["Surrogate-Key"]
+            == "mitxonline:programs"
+        )
+
+
+@pytest.mark.skip_nplusone_check
+@pytest.mark.parametrize(
+    "param", ["org_id", "contract_id", "include_approved_financial_aid"]
+)
+def test_catalog_public_cache_skips_private_filters(settings, param):
+    """Catalog responses filtered by user-specific parameters are not publicly cached"""
+    settings.CATALOG_API_PUBLIC_CACHE_ENABLED = True
+    CourseFactory.create()
+
+    resp = APIClient().get(reverse("v2:courses_api-list"), {param: 1})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp["Cache-Control"] == "private, no-store"
+    assert not resp.has_header("Surrogate-Key")
+
+
+@pytest.mark.skip_nplusone_check
+def test_catalog_public_cache_skips_authenticated_users(settings, user_drf_client):
+    """Catalog responses for a logged-in user are not publicly cached"""
+    settings.CATALOG_API_PUBLIC_CACHE_ENABLED = True
+    course = CourseFactory.create()
+
+    for url in (
+        reverse("v2:courses_api-list"),
+        reverse("v2:courses_api-detail", kwargs={"pk": course.readable_id}),
+    ):
+        resp = user_drf_client.get(url)
+
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp["Cache-Control"] == "private, no-store"
+        assert not resp.has_header("Surrogate-Key")
+
+
 @pytest.mark.django_db
 def test_retrievinng_single_course_by_pk_or_readable_id_includes_programs(
     user_drf_client,
@@ -2420,6 +2509,67 @@ def test_user_enrollments_list_sync_with_flag(  # noqa: PLR0913
         sync_mock.assert_not_called()
 
 
+@pytest.mark.skip_nplusone_check
+@pytest.mark.parametrize("is_stale", [True, False])
+@pytest.mark.parametrize("is_claimed", [True, False])
+def test_user_enrollments_list_background_sync(  # noqa: PLR0913
+    mocker, settings, user_drf_client, user, is_stale, is_claimed
+):
+    """
+    Test that UserEnrollmentsApiViewSet.list() queues a background sync only when
+    the user's enrollments are stale and no sync is pending, and hints the status.
+    """
+    settings.OPENEDX_ENROLLMENT_SYNC_IN_BACKGROUND = True
+    CourseRunEnrollmentFactory.create(user=user)
+    mocker.patch(
+        "courses.views.v2.is_enabled",
+        side_effect=lambda flag: flag == features.SYNC_ON_DASHBOARD_LOAD,
+    )
+    sync_mock = mocker.patch("courses.views.v2.sync_enrollments_with_edx")
+    mocker.patch("courses.views.v2.is_enrollment_sync_stale", return_value=is_stale)
+    mocker.patch("courses.views.v2.claim_enrollment_sync", return_value=is_claimed)
+    task_mock = mocker.patch("courses.views.v2.sync_enrollments_with_edx_async")
+
+    resp = user_drf_client.get(reverse("v2:user-enrollments-api-list"))
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.json()) == 1
+    sync_mock.assert_not_called()
+    assert resp[OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER] == (
+        OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING
+        if is_stale
+        else OPENEDX_ENROLLMENT_SYNC_STATUS_CURRENT
+    )
+    if is_stale and is_claimed:
+        task_mock.delay.assert_called_once_with(user.id)
+    else:
+        task_mock.delay.assert_not_called()
+
+
+@pytest.mark.skip_nplusone_check
+def test_user_enrollments_list_sync_status_header_cors(
+    mocker, settings, user_drf_client
+):
+    """The sync status header should be readable by allowed cross-origin frontends"""
+    settings.OPENEDX_ENROLLMENT_SYNC_IN_BACKGROUND = True
+    settings.CORS_ALLOWED_ORIGINS = ["https://learn.example.com"]
+    mocker.patch(
+        "courses.views.v2.is_enabled",
+        side_effect=lambda flag: flag == features.SYNC_ON_DASHBOARD_LOAD,
+    )
+    mocker.patch("courses.views.v2.is_enrollment_sync_stale", return_value=False)
+
+    resp = user_drf_client.get(
+        reverse("v2:user-enrollments-api-list"),
+        HTTP_ORIGIN="https://learn.example.com",
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER in resp[
+        "Access-Control-Expose-Headers"
+    ].split(", ")
+
+
 @pytest.mark.skip_nplusone_check
 @pytest.mark.parametrize(
     "with_b2b",
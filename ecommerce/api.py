@@ -305,14 +305,16 @@ def check_basket_discounts_for_validity(request):
         boolean: True if all discounts are valid, False otherwise.
     """
     basket = establish_basket(request)
-
-    for basket_discount in basket.discounts.all():
-        if not basket_discount.redeemed_discount.check_validity(
-            basket.user
-        ) or not check_discount_for_products(basket_discount.redeemed_discount, basket):
-            return False
-
-    return True
+    basket_products = basket.get_products()
+    discounts = Discount.objects.filter(
+        pk__in=basket.discounts.values("redeemed_discount")
+    ).with_validity_data(basket.user)
+
+    return all(
+        discount.check_validity(basket.user)
+        and discount.check_validity_with_products(basket_products)
+        for discount in discounts
+    )
 
 
 def apply_user_discounts(request):
@@ -1149,13 +1151,17 @@ def get_auto_apply_discounts_for_basket(basket_id: int) -> QuerySet[Discount]:
         if finaid_discount:
             finaid_discounts.append(finaid_discount.id)
 
-    return Discount.objects.filter(
-        Q(activation_date__lte=now_in_utc()) | Q(activation_date=None),
-        Q(expiration_date__gt=now_in_utc()) | Q(expiration_date=None),
-    ).filter(
-        Q(user_discount_discount__user=basket.user)
-        | Q(pk__in=finaid_discounts)
-        | Q(automatic=True)
+    return (
+        Discount.objects.filter(
+            Q(activation_date__lte=now_in_utc()) | Q(activation_date=None),
+            Q(expiration_date__gt=now_in_utc()) | Q(expiration_date=None),
+        )
+        .filter(
+            Q(user_discount_discount__user=basket.user)
+            | Q(pk__in=finaid_discounts)
+            | Q(automatic=True)
+        )
+        .with_validity_data(basket.user)
     )
 
 
@@ -1194,7 +1200,7 @@ def apply_discount_to_basket(basket: Basket, discount: Discount, *, allow_finaid
             # that it should not override any user discounts that are applied,
             # and it should be better than the other discounts in the basket.
 
-            if discount.user_discount_discount.filter(user=basket.user).exists():
+            if basket.user_id in discount.get_user_ids():
                 # This is a user discount.
                 # Check for an existing tier discount - user discount shouldn't override that
                 finaid_discounts = [
@@ -2,6 +2,7 @@ import abc
 from dataclasses import dataclass
 from decimal import Decimal
 
+from django.contrib.contenttypes.models import ContentType
 from reversion.models import Version
 
 from ecommerce.constants import (
@@ -12,6 +13,25 @@ from ecommerce.constants import (
 from ecommerce.models import Discount, Product
 
 
+def get_product_version_snapshot(product_version: Version) -> Product:
+    """
+    Builds the product as it was when the specified version was saved, from the
+    version's own serialized data, so no further queries are made. The result is
+    a snapshot and should not be saved.
+
+    Returns: Product; the product as of the specified version
+    """
+    field_dict = product_version.field_dict
+    return Product(
+        id=field_dict["id"],
+        content_type_id=field_dict["content_type_id"],
+        object_id=field_dict["object_id"],
+        price=field_dict["price"],
+        description=field_dict["description"],
+        is_active=field_dict["is_active"],
+    )
+
+
 def resolve_product_version(product: Product, product_version=None):
     """
     Resolves the specified version of the product. Specify None to indicate the
@@ -23,23 +43,12 @@ def resolve_product_version(product: Product, product_version=None):
     if product_version is None:
         return product
 
-    versions = Version.objects.get_for_object(product)
-
-    if versions.count() == 0:
-        return product
+    if product_version.content_type_id != ContentType.objects.get_for_model(
+        Product
+    ).id or product_version.object_id != str(product.id):
+        raise TypeError("Invalid product version specified")  # noqa: EM101
 
-    for test_version in versions.all():
-        if test_version == product_version:
-            return Product(
-                id=test_version.field_dict["id"],
-                content_type_id=test_version.field_dict["content_type_id"],
-                object_id=test_version.field_dict["object_id"],
-                price=test_version.field_dict["price"],
-                description=test_version.field_dict["description"],
-                is_active=test_version.field_dict["is_active"],
-            )
-
-    raise TypeError("Invalid product version specified")  # noqa: EM101
+    return get_product_version_snapshot(product_version)
 
 
 @dataclass
@@ -1,12 +1,15 @@
 from decimal import Decimal
 
 import pytest
+import reversion
+from reversion.models import Version
 
 from ecommerce.discounts import (
     DiscountType,
     DollarsOffDiscount,
     FixedPriceDiscount,
     PercentDiscount,
+    resolve_product_version,
 )
 from ecommerce.factories import (
     DiscountFactory,
@@ -154,3 +157,28 @@ def test_discounted_price_uses_best_price_across_multiple_discounts():
     assert DiscountType.get_discounted_price(applied_discounts, product) == min(
         [*discounted_prices, product.price]
     )
+
+
+def test_resolve_product_version(django_assert_num_queries):
+    """
+    The product is resolved from the requested version's own data, however many
+    versions the product has, and a version of another product is rejected.
+    """
+    with reversion.create_revision():
+        product = ProductFactory.create(price=Decimal("100.00"))
+    for price in ("200.00", "300.00", "400.00"):
+        with reversion.create_revision():
+            product.price = Decimal(price)
+            product.save()
+    first_version = Version.objects.get_for_object(product).last()
+    with reversion.create_revision():
+        other_product = ProductFactory.create()
+
+    with django_assert_num_queries(0):
+        resolved = resolve_product_version(product, first_version)
+
+    assert resolved.id == product.id
+    assert resolved.price == Decimal("100.00")
+    assert resolve_product_version(product) is product
+    with pytest.raises(TypeError):
+        resolve_product_version(other_product, first_version)
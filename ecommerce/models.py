@@ -11,11 +11,13 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.contrib.postgres.expressions import ArraySubquery
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import TextChoices
 from django.utils.functional import cached_property
-from mitol.common.models import TimestampedModel
+from mitol.common.models import TimestampedModel, TimestampedModelQuerySet
 from mitol.common.utils.datetime import now_in_utc
 from mitol.payment_gateway.constants import (
     MITOL_PAYMENT_GATEWAY_CYBERSOURCE,
@@ -260,9 +262,65 @@ class BasketItem(TimestampedModel):
         return self.product.price * self.quantity
 
 
+class DiscountQuerySet(TimestampedModelQuerySet):
+    """Queryset for discounts"""
+
+    def with_validity_data(self, user=None):
+        """
+        Annotate the discounts with the redemption counts and the product and
+        user links that the validity checks need, using subqueries so they're
+        loaded in the same query as the discounts themselves.
+
+        Discounts loaded like this answer check_validity,
+        check_validity_with_products and is_valid from memory, so they can be
+        checked repeatedly while handling a request without more queries.
+
+        Args:
+            user (User or None): the user to count per-user redemptions for
+        """
+
+        def _count(queryset):
+            return models.Subquery(
+                queryset.annotate(
+                    count=models.Func(models.F("id"), function="COUNT")
+                ).values("count")
+            )
+
+        fulfilled_redemptions = DiscountRedemption.objects.filter(
+            redeemed_discount=models.OuterRef("pk"),
+            redeemed_order__state=OrderStatus.FULFILLED,
+        )
+        user_id = user.id if user is not None else None
+
+        return self.annotate(
+            validity_user_id=models.Value(user_id, output_field=models.IntegerField()),
+            validity_redemption_count=_count(
+                DiscountRedemption.objects.filter(
+                    redeemed_discount=models.OuterRef("pk")
+                )
+            ),
+            validity_fulfilled_redemption_count=_count(fulfilled_redemptions),
+            validity_user_fulfilled_redemption_count=_count(
+                fulfilled_redemptions.filter(redeemed_by_id=user_id)
+            ),
+            validity_product_ids=ArraySubquery(
+                DiscountProduct.objects.filter(discount=models.OuterRef("pk")).values(
+                    "product_id"
+                )
+            ),
+            validity_user_ids=ArraySubquery(
+                UserDiscount.objects.filter(discount=models.OuterRef("pk")).values(
+                    "user_id"
+                )
+            ),
+        )
+
+
 class Discount(TimestampedModel):
     """Discount model"""
 
+    objects = DiscountQuerySet.as_manager()
+
     amount = models.DecimalField(
         decimal_places=5,
         max_digits=20,
@@ -335,6 +393,52 @@ class Discount(TimestampedModel):
         """Returns True if the discount has been redeemed"""
         return DiscountRedemption.objects.filter(redeemed_discount=self).exists()
 
+    def _has_validity_data(self) -> bool:
+        """
+        Returns True if the discount was loaded with
+        DiscountQuerySet.with_validity_data
+        """
+        return hasattr(self, "validity_product_ids")
+
+    def get_fulfilled_redemption_count(self) -> int:
+        """Returns the number of fulfilled orders that redeemed this discount"""
+        if self._has_validity_data():
+            return self.validity_fulfilled_redemption_count
+
+        return DiscountRedemption.objects.filter(
+            redeemed_discount=self,
+            redeemed_order__state=OrderStatus.FULFILLED,
+        ).count()
+
+    def get_user_fulfilled_redemption_count(self, user) -> int:
+        """
+        Returns the number of fulfilled orders that redeemed this discount for
+        the given user
+        """
+        user_id = user.id if user is not None else None
+        if self._has_validity_data() and self.validity_user_id == user_id:
+            return self.validity_user_fulfilled_redemption_count
+
+        return DiscountRedemption.objects.filter(
+            redeemed_discount=self,
+            redeemed_order__state=OrderStatus.FULFILLED,
+            redeemed_by_id=user_id,
+        ).count()
+
+    def get_product_ids(self) -> set[int]:
+        """Returns the IDs of the products the discount is limited to, if any"""
+        if self._has_validity_data():
+            return set(self.validity_product_ids)
+
+        return set(self.products.values_list("product_id", flat=True))
+
+    def get_user_ids(self) -> set[int]:
+        """Returns the IDs of the users the discount is assigned to, if any"""
+        if self._has_validity_data():
+            return set(self.validity_user_ids)
+
+        return set(self.user_discount_discount.values_list("user_id", flat=True))
+
     def check_validity(self, user: User):
         """
         Enforces the redemption rules for a given discount.
@@ -346,29 +450,19 @@ class Discount(TimestampedModel):
         """
         if (
             self.redemption_type == REDEMPTION_TYPE_ONE_TIME
-            and DiscountRedemption.objects.filter(
-                redeemed_discount=self,
-                redeemed_order__state=OrderStatus.FULFILLED,
-            ).count()
-            > 0
+            and self.get_fulfilled_redemption_count() > 0
         ):
             return False
 
         if (
             self.redemption_type == REDEMPTION_TYPE_ONE_TIME_PER_USER
-            and DiscountRedemption.objects.filter(
-                redeemed_discount=self,
-                redeemed_order__state=OrderStatus.FULFILLED,
-                redeemed_by=user,
-            ).count()
-            > 0
+            and self.get_user_fulfilled_redemption_count(user) > 0
         ):
             return False
 
-        if (self.max_redemptions or 0) > 0 and DiscountRedemption.objects.filter(
-            redeemed_discount=self,
-            redeemed_order__state=OrderStatus.FULFILLED,
-        ).count() >= self.max_redemptions:
+        if (self.max_redemptions or 0) > 0 and (
+            self.get_fulfilled_redemption_count() >= self.max_redemptions
+        ):
             return False
 
         return self.valid_now()
@@ -383,9 +477,8 @@ class Discount(TimestampedModel):
         Returns:
             Boolean
         """
-        if self.products.exists() and not (
-            self.products.filter(product__in=products).exists()
-        ):
+        product_ids = self.get_product_ids()
+        if product_ids and product_ids.isdisjoint(product.id for product in products):
             return False
 
         return self.valid_now()
@@ -431,9 +524,9 @@ class Discount(TimestampedModel):
                 bool: True if the discount is associated to the product in the basket,
                 or not associated with any product.
             """
-            return (
-                self.products.count() == 0
-                or self.products.filter(product__in=basket.get_products()).count() > 0
+            product_ids = self.get_product_ids()
+            return not product_ids or not product_ids.isdisjoint(
+                product.id for product in basket.get_products()
             )
 
         def _discount_user_has_discount() -> bool:
@@ -444,10 +537,8 @@ class Discount(TimestampedModel):
                 bool: True if the discount is associated with the basket's user,
                 or not associated with any user.
             """
-            return (
-                self.user_discount_discount.count() == 0
-                or self.user_discount_discount.filter(user=basket.user).count() > 0
-            )
+            user_ids = self.get_user_ids()
+            return not user_ids or basket.user_id in user_ids
 
         def _discount_redemption_limit_valid() -> bool:
             """
@@ -458,10 +549,15 @@ class Discount(TimestampedModel):
                 bool: True if the discount has been redeemed less than the maximum
                 number of times, or the maximum number of redemptions is 0.
             """
-            return (
-                self.max_redemptions == 0
-                or self.order_redemptions.count() < self.max_redemptions
+            if self.max_redemptions == 0:
+                return True
+
+            redemption_count = (
+                self.validity_redemption_count
+                if self._has_validity_data()
+                else self.order_redemptions.count()
             )
+            return redemption_count < self.max_redemptions
 
         def _discount_activation_date_valid() -> bool:
             """
@@ -784,9 +880,45 @@ class OrderFlow:
             transaction.on_commit(self.order.send_ecommerce_order_receipt)
 
 
+class OrderQuerySet(TimestampedModelQuerySet):
+    """Queryset for orders"""
+
+    def for_serialization(self):
+        """
+        Load the related data the order history and receipt serializers use, so
+        serializing a page of orders takes the same number of queries however
+        many orders and lines it has: the purchaser and their legal address,
+        the lines with their product versions and purchased courseware, the
+        redeemed discounts and the transactions.
+        """
+        return self.select_related("purchaser__legal_address").prefetch_related(
+            models.Prefetch(
+                "lines",
+                queryset=Line.objects.select_related(
+                    "product_version"
+                ).prefetch_related(
+                    GenericPrefetch(
+                        "purchased_object",
+                        [
+                            CourseRun.objects.select_related("course"),
+                            Program.objects.all(),
+                        ],
+                    )
+                ),
+            ),
+            models.Prefetch(
+                "discounts",
+                queryset=DiscountRedemption.objects.select_related("redeemed_discount"),
+            ),
+            "transactions",
+        )
+
+
 class Order(TimestampedModel):
     """An order containing information for a purchase."""
 
+    objects = OrderQuerySet.as_manager()
+
     state = models.CharField(max_length=150, choices=OrderStatus)
     purchaser = models.ForeignKey(
         User,
@@ -868,6 +1000,15 @@ class Order(TimestampedModel):
             if isinstance(line.purchased_object, CourseRun)
         ]
 
+    @property
+    def latest_transaction(self):
+        """Return the most recent transaction on the order, if there is one"""
+        return max(
+            self.transactions.all(),
+            key=lambda transaction: transaction.created_on,
+            default=None,
+        )
+
     def __str__(self):
         return f"{self.state.capitalize()} Order for {self.purchaser.name} ({self.purchaser.email})"
 
@@ -1176,22 +1317,79 @@ class Line(TimestampedModel):
         ]
 
         return (
-            DiscountType.get_discounted_price(
-                discounts,
-                Product.all_objects.get(pk=self.product_version.object_id),
-                product_version=self.product_version,
-            ).quantize(Decimal("0.01"))
+            DiscountType.get_discounted_price(discounts, self.product).quantize(
+                Decimal("0.01")
+            )
             * self.quantity
         )
 
     @cached_property
     def product(self):
-        from ecommerce.discounts import resolve_product_version  # noqa: PLC0415
+        """Return the product as it was when it was purchased"""
+        from ecommerce.discounts import get_product_version_snapshot  # noqa: PLC0415
+
+        return get_product_version_snapshot(self.product_version)
 
-        return resolve_product_version(
-            Product.all_objects.get(pk=self.product_version.field_dict["id"]),
-            self.product_version,
+    @cached_property
+    def current_product(self):
+        """Return the product this line was purchased from, as it is now"""
+        return Product.all_objects.get(pk=self.product_version.object_id)
+
+    @staticmethod
+    def prefetch_current_products(lines):
+        """
+        Load current_product for all of the given lines with one query for the
+        products and a few per type of purchasable object (the object, its page,
+        and the page's feature image and instructors), rather than queries per
+        line. Lines for the same product share the same Product instance.
+
+        The pages' financial assistance form URLs and current prices are loaded
+        together too, since the page serializers would query them per page.
+
+        Args:
+            lines (iterable of Line): lines with their product versions loaded
+
+        Returns:
+            dict: page id to the data loaded for the page, see
+                cms.api.get_product_page_data
+        """
+        from cms.api import get_product_page_data  # noqa: PLC0415
+
+        lines = list(lines)
+        products = Product.all_objects.select_related("content_type").prefetch_related(
+            GenericPrefetch(
+                "purchasable_object",
+                [
+                    CourseRun.objects.select_related(
+                        "course__page__feature_image"
+                    ).prefetch_related(
+                        "course__page__linked_instructors__linked_instructor_page"
+                    ),
+                    Program.objects.select_related(
+                        "page__feature_image"
+                    ).prefetch_related(
+                        models.Prefetch("products", to_attr="prefetched_products")
+                    ),
+                ],
+            )
+        )
+        products_by_id = products.in_bulk(
+            {int(line.product_version.object_id) for line in lines}
         )
+        for line in lines:
+            product = products_by_id.get(int(line.product_version.object_id))
+            if product is not None:
+                line.current_product = product
+
+        pages = {}
+        for product in products_by_id.values():
+            purchasable_object = product.purchasable_object
+            if isinstance(purchasable_object, CourseRun):
+                purchasable_object = purchasable_object.course
+            page = getattr(purchasable_object, "page", None)
+            if page is not None:
+                pages[page.id] = page
+        return get_product_page_data(pages.values())
 
     @cached_property
     def courseware(self):
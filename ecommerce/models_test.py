@@ -33,6 +33,7 @@ from ecommerce.models import (
     Basket,
     BasketDiscount,
     BasketItem,
+    Discount,
     DiscountProduct,
     DiscountRedemption,
     FulfilledOrder,
@@ -172,6 +173,53 @@ def test_set_limit_discount_multiple_users(users, set_limited_use_discount):
     assert set_limited_use_discount.check_validity(user) is False
 
 
+@pytest.mark.parametrize(
+    "discount_fixture",
+    [
+        "onetime_discount",
+        "onetime_per_user_discount",
+        "unlimited_discount",
+        "set_limited_use_discount",
+    ],
+)
+def test_discount_validity_data(
+    request, django_assert_num_queries, users, discount_fixture
+):
+    """
+    Discounts loaded with validity data should answer the validity checks
+    without any more queries, and agree with the discounts that don't have it
+    """
+    discount = request.getfixturevalue(discount_fixture)
+    basket_item = BasketItemFactory.create(basket__user=users[0])
+    other_product = ProductFactory.create()
+    DiscountProduct.objects.create(discount=discount, product=basket_item.product)
+    UserDiscount.objects.create(discount=discount, user=users[0])
+    perform_discount_redemption(users[1], discount)
+
+    basket = Basket.objects.select_related("user").get(pk=basket_item.basket.pk)
+    products = basket.get_products()
+    loaded = Discount.objects.with_validity_data(users[0]).get(pk=discount.pk)
+
+    with django_assert_num_queries(0):
+        results = [
+            loaded.check_validity(users[0]),
+            loaded.check_validity_with_products(products),
+            loaded.check_validity_with_products([other_product]),
+        ]
+    # just the basket's products are loaded
+    with django_assert_num_queries(1):
+        results.append(loaded.is_valid(basket))
+
+    assert results == [
+        discount.check_validity(users[0]),
+        discount.check_validity_with_products(products),
+        discount.check_validity_with_products([other_product]),
+        discount.is_valid(basket),
+    ]
+    # a different user's redemptions aren't in the loaded data, so they're queried
+    assert loaded.check_validity(users[1]) == discount.check_validity(users[1])
+
+
 def test_basket_discount_conversion(user, unlimited_discount):
     """
     Tests converting discounts applied to baskets to discounts applied to
@@ -6,6 +6,8 @@ from decimal import Decimal
 from zoneinfo import ZoneInfo
 
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Manager
 from drf_spectacular.utils import extend_schema_field, extend_schema_serializer
 from rest_framework import serializers
 
@@ -87,7 +89,7 @@ class TransactionLineSerializer(serializers.Serializer):
     def to_representation(self, instance):
         """Returns the representation of the object."""
 
-        coupon_redemption = instance.order.discounts.first()
+        coupon_redemption = next(iter(instance.order.discounts.all()), None)
         discount = 0.0
 
         if coupon_redemption:
@@ -95,7 +97,11 @@ class TransactionLineSerializer(serializers.Serializer):
 
         total_paid = (instance.product.price - Decimal(discount)) * instance.quantity
 
-        content_object = instance.product.purchasable_object
+        content_object = (
+            instance.purchased_object
+            if instance.purchased_content_type_id
+            else instance.product.purchasable_object
+        )
         (content_title, readable_id) = (None, None)
 
         if isinstance(content_object, Program):
@@ -107,8 +113,8 @@ class TransactionLineSerializer(serializers.Serializer):
 
         # Add content_type from product's content_type model
         content_type = (
-            instance.product.content_type.model
-            if hasattr(instance.product, "content_type")
+            ContentType.objects.get_for_id(instance.product.content_type_id).model
+            if instance.product.content_type_id
             else None
         )
 
@@ -141,9 +147,57 @@ class ProgramRunProductPurchasableObjectSerializer(serializers.ModelSerializer):
         ]
 
 
+class LineCoursePageSerializer(CoursePageSerializer):
+    """
+    Serializes the course page of an order line, using the data loaded for the
+    page by Line.prefetch_current_products when there is some.
+    """
+
+    @extend_schema_field(serializers.URLField)
+    def get_financial_assistance_form_url(self, instance):
+        page_data = self.context.get("page_data", {}).get(instance.id)
+        if page_data is None:
+            return super().get_financial_assistance_form_url(instance)
+        return page_data["financial_assistance_form_url"]
+
+    def get_current_price(self, instance) -> int | None:
+        page_data = self.context.get("page_data", {}).get(instance.id)
+        if page_data is None:
+            return super().get_current_price(instance)
+        return page_data["current_price"]
+
+
+class LineProgramPageSerializer(ProgramPageSerializer):
+    """
+    Serializes the program page of an order line, using the data loaded for the
+    page by Line.prefetch_current_products when there is some.
+    """
+
+    @extend_schema_field(serializers.URLField)
+    def get_financial_assistance_form_url(self, instance):
+        page_data = self.context.get("page_data", {}).get(instance.id)
+        if page_data is None:
+            return super().get_financial_assistance_form_url(instance)
+        return page_data["financial_assistance_form_url"]
+
+
+def _serialize_page(context, page, serializer_class):
+    """
+    Serializes a product's page once per response, since the runs of a course
+    share the course's page.
+    """
+    serialized_pages = context.setdefault("serialized_pages", {})
+    if page.id not in serialized_pages:
+        serialized_pages[page.id] = serializer_class(
+            instance=page, context=context
+        ).data
+
+    return serialized_pages[page.id]
+
+
 class CoursePageObjectField(serializers.RelatedField):
     def to_representation(self, value):
-        return CoursePageSerializer(instance=value).data
+        return _serialize_page(self.context, value, LineCoursePageSerializer)
 
 
 class CourseProductPurchasableObjectSerializer(serializers.ModelSerializer):
@@ -176,7 +230,7 @@ class CourseRunProductPurchasableObjectSerializer(serializers.ModelSerializer):
 
 class ProgramPageObjectField(serializers.RelatedField):
     def to_representation(self, value):
-        return ProgramPageSerializer(instance=value).data
+        return _serialize_page(self.context, value, LineProgramPageSerializer)
 
 
 class ProgramProductPurchasableObjectSerializer(serializers.ModelSerializer):
@@ -243,11 +297,17 @@ class ProductPurchasableObjectField(serializers.RelatedField):
     def to_representation(self, value):
         """Serialize the purchasable object using appropriate serializer"""
         if isinstance(value, ProgramRun):
-            return ProgramRunProductPurchasableObjectSerializer(instance=value).data
+            return ProgramRunProductPurchasableObjectSerializer(
+                instance=value, context=self.context
+            ).data
         elif isinstance(value, CourseRun):
-            return CourseRunProductPurchasableObjectSerializer(instance=value).data
+            return CourseRunProductPurchasableObjectSerializer(
+                instance=value, context=self.context
+            ).data
         elif isinstance(value, Program):
-            return ProgramProductPurchasableObjectSerializer(instance=value).data
+            return ProgramProductPurchasableObjectSerializer(
+                instance=value, context=self.context
+            ).data
 
         error_message = (
             f"Unexpected type for Product.purchasable_object: {value.__class__}"
@@ -475,11 +535,16 @@ class LineSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(ProductSerializer)
     def get_product(self, instance):
-        product = models.Product.all_objects.get(
-            pk=instance.product_version.field_dict["id"]
-        )
+        # Many lines are for the same product, so each product is only
+        # serialized once per response
+        serialized_products = self.context.setdefault("serialized_products", {})
+        product = instance.current_product
+        if product.id not in serialized_products:
+            serialized_products[product.id] = ProductSerializer(
+                instance=product, context=self.context
+            ).data
 
-        return ProductSerializer(instance=product).data
+        return serialized_products[product.id]
 
     class Meta:
         fields = [
@@ -532,14 +597,11 @@ class OrderSerializer(serializers.ModelSerializer):
     )
     def get_refunds(self, instance):
         refunds = []
-        for transaction in (
-            models.Transaction.objects.filter(order=instance)
-            .filter(transaction_type=TRANSACTION_TYPE_REFUND)
-            .all()
-        ):
-            refunds.append(  # noqa: PERF401
-                {"amount": transaction.amount, "date": transaction.created_on}
-            )
+        for transaction in instance.transactions.all():
+            if transaction.transaction_type == TRANSACTION_TYPE_REFUND:
+                refunds.append(  # noqa: PERF401
+                    {"amount": transaction.amount, "date": transaction.created_on}
+                )
 
         return refunds
 
@@ -557,7 +619,7 @@ class OrderSerializer(serializers.ModelSerializer):
     )
     def get_transactions(self, instance):
         """Get transaction information if it exists"""
-        transaction = instance.transactions.order_by("-created_on").first()
+        transaction = instance.latest_transaction
         if transaction:
             data = {
                 "card_number": None,
@@ -604,7 +666,7 @@ class OrderSerializer(serializers.ModelSerializer):
     )
     def get_street_address(self, instance):
         """Get the address information from the transaction"""
-        transaction = instance.transactions.order_by("-created_on").first()
+        transaction = instance.latest_transaction
         if transaction:
             street_address = {
                 "line": [],
@@ -661,6 +723,18 @@ class OrderSerializer(serializers.ModelSerializer):
         model = models.Order
 
 
+class OrderHistoryListSerializer(serializers.ListSerializer):
+    """Serializes a page of orders, loading the lines' current products together"""
+
+    def to_representation(self, data):
+        orders = list(data.all() if isinstance(data, Manager) else data)
+        self.context["page_data"] = models.Line.prefetch_current_products(
+            line for order in orders for line in order.lines.all()
+        )
+
+        return super().to_representation(orders)
+
+
 class OrderHistorySerializer(serializers.ModelSerializer):
     titles = serializers.SerializerMethodField()
     lines = LineSerializer(many=True)
@@ -676,9 +750,7 @@ class OrderHistorySerializer(serializers.ModelSerializer):
         titles = []
 
         for line in instance.lines.all():
-            product = models.Product.all_objects.get(
-                pk=line.product_version.field_dict["id"]
-            )
+            product = line.current_product
             if product.content_type.model == "courserun" and product.purchasable_object:
                 titles.append(product.purchasable_object.course.title)
             elif product.content_type.model == "programrun":
@@ -703,6 +775,7 @@ class OrderHistorySerializer(serializers.ModelSerializer):
         ]
         model = models.Order
         depth = 1
+        list_serializer_class = OrderHistoryListSerializer
 
 
 class ProductFlexiblePriceSerializer(BaseProductSerializer):
@@ -826,7 +899,7 @@ class TransactionDataSerializer(serializers.BaseSerializer):
         if not isinstance(instance, Order):
             raise AttributeError  # noqa: TRY004
 
-        transaction = instance.transactions.order_by("-created_on").first()
+        transaction = instance.latest_transaction
 
         return transaction  # noqa: RET504
 
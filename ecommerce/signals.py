@@ -4,6 +4,8 @@ from django.db.models.signals import post_save
 from django.db.transaction import on_commit
 from django.dispatch import receiver
 
+from courses.models import CourseRun, Program
+from courses.utils import queue_course_cache_purge, queue_program_cache_purge
 from ecommerce.models import Product
 from hubspot_sync.task_helpers import sync_hubspot_product
 
@@ -14,3 +16,17 @@ def sync_product(sender, instance, created, **kwargs):  # pylint:disable=unused-
     Sync product to hubspot
     """
     on_commit(lambda: sync_hubspot_product(instance))
+
+
+@receiver(post_save, sender=Product, dispatch_uid="product_post_save_fastly_purge")
+def purge_fastly_cache_on_product_save(sender, instance, **kwargs):  # noqa: ARG001
+    """
+    Purges the Fastly surrogate key for the course or program a Product is for
+    when it is saved (e.g. a price change), so that MIT Learn product pages and
+    cached catalog API responses are invalidated.
+    """
+    purchasable_object = instance.purchasable_object
+    if isinstance(purchasable_object, CourseRun):
+        queue_course_cache_purge(purchasable_object.course.readable_id)
+    elif isinstance(purchasable_object, Program):
+        queue_program_cache_purge(purchasable_object.readable_id)
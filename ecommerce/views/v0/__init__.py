@@ -184,7 +184,9 @@ def add_discount_to_basket(request):
     discount_code = request.query_params.get("discount_code")
 
     try:
-        discount = Discount.objects.get(discount_code=discount_code)
+        discount = Discount.objects.with_validity_data(basket.user).get(
+            discount_code=discount_code
+        )
     except Discount.DoesNotExist:
         return Response(
             {"error": f"Discount '{discount_code}' not found"},
@@ -267,9 +269,11 @@ def _create_basket_from_product(
             # ever computed against a real user, and shouldn't show up at all for
             # a logged-out cart - so this whole step is skipped for anonymous
             # baskets rather than run against a basket with no user to check.
-            existing_basket_discounts = [
-                bd.redeemed_discount for bd in basket.discounts.all()
-            ]
+            existing_basket_discounts = list(
+                Discount.objects.filter(
+                    pk__in=basket.discounts.values("redeemed_discount")
+                ).with_validity_data(basket.user)
+            )
             discounts_to_apply = [
                 *existing_basket_discounts,
                 *list(get_auto_apply_discounts_for_basket(basket.id).all()),
@@ -287,9 +291,9 @@ def _create_basket_from_product(
             # better-value discount by hand if we want. (Also, turn off finaid flag here.)
             if discount_code:
                 try:
-                    supplied_discount = Discount.objects.get(
-                        discount_code=discount_code
-                    )
+                    supplied_discount = Discount.objects.with_validity_data(
+                        basket.user
+                    ).get(discount_code=discount_code)
                     apply_discount_to_basket(basket, supplied_discount)
                 except Discount.DoesNotExist:
                     pass
@@ -440,7 +444,9 @@ def create_basket_with_products(request):
 
     if discount_code:
         try:
-            discount = Discount.objects.get(discount_code=discount_code)
+            discount = Discount.objects.with_validity_data(basket.user).get(
+                discount_code=discount_code
+            )
             apply_discount_to_basket(basket, discount)
         except Discount.DoesNotExist:
             pass
@@ -955,7 +961,7 @@ class OrderHistoryViewSet(ReadOnlyModelViewSet):
             Order.objects.filter(purchaser=self.request.user)
             .filter(state__in=[OrderStatus.FULFILLED, OrderStatus.REFUNDED])
             .order_by("-created_on")
-            .all()
+            .for_serialization()
         )
 
 
@@ -967,7 +973,7 @@ class OrderReceiptView(RetrieveAPIView):
 
     def get_queryset(self):
         """Return only the user's orders"""
-        return Order.objects.filter(purchaser=self.request.user).all()
+        return Order.objects.filter(purchaser=self.request.user).for_serialization()
 
 
 class ReceiptByRunView(LoginRequiredMixin, View):
@@ -10,8 +10,10 @@ from zoneinfo import ZoneInfo
 import freezegun
 import pytest
 import reversion
+from django.db import connection
 from django.forms.models import model_to_dict
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from mitol.common.utils.datetime import now_in_utc
 from reversion.models import Version
@@ -40,6 +42,7 @@ from ecommerce.factories import (
     BasketFactory,
     BasketItemFactory,
     DiscountFactory,
+    DiscountRedemptionFactory,
     LineFactory,
     OrderFactory,
     ProductFactory,
@@ -1366,6 +1369,81 @@ def test_order_receipt_retrieve(user, user_drf_client):
     assert receipt["transactions"]["card_number"] is None
 
 
+def _create_paid_orders(user, products):
+    """Create a fulfilled order for each product, each with a discount and a transaction"""
+    discount = DiscountFactory.create()
+    orders = OrderFactory.create_batch(
+        len(products), purchaser=user, state=OrderStatus.FULFILLED
+    )
+    for order, product in zip(orders, products, strict=True):
+        LineFactory.create(
+            order=order,
+            product_version=Version.objects.get_for_object(product).last(),
+            purchased_object=product.purchasable_object,
+        )
+        DiscountRedemptionFactory.create(
+            redeemed_by=user, redeemed_order=order, redeemed_discount=discount
+        )
+        TransactionFactory.create(order=order)
+    return orders
+
+
+@pytest.mark.skip_nplusone_check
+def test_order_history_list_query_count(user, user_drf_client):
+    """The order history should take the same number of queries for 5 orders as for 50"""
+    # Each order is for a different course, with its own page
+    with reversion.create_revision():
+        products = ProductFactory.create_batch(50)
+    url = f"{reverse('v0:orderhistory_api-list')}?limit=50"
+
+    _create_paid_orders(user, products[:5])
+    # Warm up anything cached per process, like content types
+    user_drf_client.get(url)
+    with CaptureQueriesContext(connection) as few_orders:
+        resp = user_drf_client.get(url)
+    assert len(resp.json()["results"]) == 5
+
+    _create_paid_orders(user, products[5:])
+    with CaptureQueriesContext(connection) as many_orders:
+        resp = user_drf_client.get(url)
+    assert len(resp.json()["results"]) == 50
+
+    assert len(many_orders) == len(few_orders)
+
+
+@pytest.mark.skip_nplusone_check
+def test_order_receipt_query_count(user, user_drf_client):
+    """An order's receipt should take the same number of queries however many lines it has"""
+    with reversion.create_revision():
+        products = ProductFactory.create_batch(5)
+    orders = [
+        OrderFactory.create(purchaser=user, state=OrderStatus.FULFILLED)
+        for _ in range(2)
+    ]
+    for order, order_products in zip(orders, [products[:1], products], strict=True):
+        for product in order_products:
+            LineFactory.create(
+                order=order,
+                product_version=Version.objects.get_for_object(product).last(),
+                purchased_object=product.purchasable_object,
+            )
+        DiscountRedemptionFactory.create(redeemed_by=user, redeemed_order=order)
+        TransactionFactory.create(order=order)
+
+    query_counts = []
+    for order in orders:
+        url = reverse("v0:order_receipt_api", kwargs={"pk": order.id})
+        # Warm up anything cached per process, like content types
+        user_drf_client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            resp = user_drf_client.get(url)
+        assert resp.status_code == 200
+        assert len(resp.json()["lines"]) == order.lines.count()
+        query_counts.append(len(context))
+
+    assert query_counts[0] == query_counts[1]
+
+
 @pytest.mark.skip_nplusone_check
 def test_program_product_purchasing(user, user_drf_client):
     """Test that we can purchase products that are for programs."""
@@ -2,7 +2,7 @@
 
 import csv
 import logging
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from datetime import datetime
 from typing import Union
 from zoneinfo import ZoneInfo
@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo
 import requests
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.db.models import Q
@@ -20,6 +21,8 @@ from flexiblepricing.constants import (
     COUNTRY,
     DEFAULT_INCOME_THRESHOLD,
     FINAID_FORM_TEXTS,
+    FLEXIBLE_PRICE_TIERS_CACHE_KEY,
+    FLEXIBLE_PRICE_TIERS_CACHE_TIMEOUT,
     INCOME,
     INCOME_THRESHOLD_FIELDS,
     FlexiblePriceStatus,
@@ -129,6 +132,76 @@ def get_ordered_eligible_coursewares(courseware):
     return [courseware]
 
 
+def _get_courseware_keys(coursewares):
+    """
+    Returns the (content type id, object id) pairs for the given coursewares,
+    in the same order.
+    """
+    content_types = ContentType.objects.get_for_models(
+        *{type(courseware) for courseware in coursewares}
+    )
+    return [
+        (content_types[type(courseware)].id, courseware.id)
+        for courseware in coursewares
+    ]
+
+
+def get_current_tier_table():
+    """
+    Returns the thresholds of the current flexible price tiers for each
+    courseware, highest first.
+
+    The table is cached in Redis until a tier is saved or deleted (see
+    clear_current_tier_table_cache), or for an hour at most, so it's loaded with
+    one query at most.
+
+    Returns:
+        dict: (content type id, object id) -> list of (income threshold, tier id)
+    """
+    redis_cache = caches["redis"]
+    tier_table = redis_cache.get(FLEXIBLE_PRICE_TIERS_CACHE_KEY)
+    if tier_table is not None:
+        return tier_table
+
+    tier_table = defaultdict(list)
+    for tier_id, content_type_id, object_id, income_threshold in (
+        FlexiblePriceTier.objects.filter(current=True)
+        .order_by("-income_threshold_usd")
+        .values_list(
+            "id",
+            "courseware_content_type_id",
+            "courseware_object_id",
+            "income_threshold_usd",
+        )
+    ):
+        tier_table[(content_type_id, object_id)].append((income_threshold, tier_id))
+    tier_table = dict(tier_table)
+
+    redis_cache.set(
+        FLEXIBLE_PRICE_TIERS_CACHE_KEY,
+        tier_table,
+        timeout=FLEXIBLE_PRICE_TIERS_CACHE_TIMEOUT,
+    )
+    return tier_table
+
+
+def clear_current_tier_table_cache():
+    """Clears the cached table of current flexible price tiers."""
+    caches["redis"].delete(FLEXIBLE_PRICE_TIERS_CACHE_KEY)
+
+
+def _find_tier_id(tier_table, courseware_keys, income):
+    """
+    Finds the id of the highest tier that the income qualifies for, checking
+    the coursewares in order.
+    """
+    for courseware_key in courseware_keys:
+        for income_threshold, tier_id in tier_table.get(courseware_key, []):
+            if income_threshold <= income:
+                return tier_id
+    return None
+
+
 def determine_tier_courseware(courseware, income):
     """
     Determines and returns the FlexiblePriceTier for a given income.
@@ -148,21 +221,28 @@ def determine_tier_courseware(courseware, income):
     # less than or equal to the income of the user. The highest tier out of that set will
     # be the tier assigned to the user.
 
-    for eligible_courseware in get_ordered_eligible_coursewares(courseware):
-        content_type = ContentType.objects.get_for_model(eligible_courseware)
+    courseware_keys = _get_courseware_keys(get_ordered_eligible_coursewares(courseware))
+    tier_id = _find_tier_id(get_current_tier_table(), courseware_keys, income)
+    tier = (
+        FlexiblePriceTier.objects.filter(id=tier_id, current=True)
+        .select_related("discount")
+        .first()
+        if tier_id is not None
+        else None
+    )
+
+    if tier_id is not None and tier is None:
+        # The cached table is out of date, so reload it.
+        clear_current_tier_table_cache()
+        tier_id = _find_tier_id(get_current_tier_table(), courseware_keys, income)
         tier = (
-            FlexiblePriceTier.objects.filter(
-                current=True,
-                income_threshold_usd__lte=income,
-                courseware_content_type=content_type,
-                courseware_object_id=eligible_courseware.id,
-            )
-            .order_by("-income_threshold_usd")
-            .first()
+            FlexiblePriceTier.objects.select_related("discount").get(id=tier_id)
+            if tier_id is not None
+            else None
         )
 
-        if tier is not None:
-            return tier
+    if tier is not None:
+        return tier
 
     message = (
         "$0-income-threshold Tier has not yet been configured for Courseware "
@@ -248,46 +328,71 @@ def determine_courseware_flexible_price_discount(product, user):
     if not user.is_authenticated or not product:
         return None
 
-    for eligible_courseware in get_ordered_eligible_coursewares(
-        product.purchasable_object
-    ):
-        content_type = ContentType.objects.get_for_model(eligible_courseware)
-        flexible_price = (
-            FlexiblePrice.objects.filter(
-                courseware_content_type=content_type,
-                courseware_object_id=eligible_courseware.id,
-                user=user,
-            )
-            .filter(
-                (
-                    Q(tier__discount__activation_date=None)
-                    | Q(
-                        tier__discount__activation_date__lte=datetime.now(
-                            ZoneInfo(TIME_ZONE)
-                        )
-                    )
-                )
-                & (
-                    Q(tier__discount__expiration_date=None)
-                    | Q(
-                        tier__discount__expiration_date__gte=datetime.now(
-                            ZoneInfo(TIME_ZONE)
-                        )
-                    )
-                )
-            )
-            .first()
+    now = datetime.now(ZoneInfo(TIME_ZONE))
+    flexible_price = _get_approved_flexible_price(
+        get_ordered_eligible_coursewares(product.purchasable_object),
+        user,
+        (
+            Q(tier__discount__activation_date=None)
+            | Q(tier__discount__activation_date__lte=now)
         )
+        & (
+            Q(tier__discount__expiration_date=None)
+            | Q(tier__discount__expiration_date__gte=now)
+        ),
+    )
 
-        if (
-            flexible_price
-            and flexible_price.tier.current
-            and flexible_price.status
-            in (FlexiblePriceStatus.APPROVED, FlexiblePriceStatus.AUTO_APPROVED)
-        ):
-            return flexible_price.tier.discount
+    return flexible_price.tier.discount if flexible_price else None
 
-    return None
+
+def _get_approved_flexible_price(coursewares, user, *filters):
+    """
+    Gets the user's approved flexible price with a current tier for the first of
+    the coursewares that has one, with a single query.
+
+    Args:
+        coursewares (list): the coursewares to check, in order of precedence
+        user (User): the user to get the flexible price for
+        filters (Q): any additional filters for the flexible prices
+    Returns:
+        FlexiblePrice or None: the flexible price, with its tier and discount loaded
+    """
+    courseware_keys = _get_courseware_keys(coursewares)
+    if not courseware_keys:
+        return None
+
+    courseware_filter = Q()
+    for content_type_id, object_id in courseware_keys:
+        courseware_filter |= Q(
+            courseware_content_type_id=content_type_id,
+            courseware_object_id=object_id,
+        )
+
+    flexible_prices = {
+        (
+            flexible_price.courseware_content_type_id,
+            flexible_price.courseware_object_id,
+        ): flexible_price
+        for flexible_price in FlexiblePrice.objects.filter(
+            courseware_filter,
+            *filters,
+            user=user,
+            status__in=[
+                FlexiblePriceStatus.APPROVED,
+                FlexiblePriceStatus.AUTO_APPROVED,
+            ],
+            tier__current=True,
+        ).select_related("tier__discount")
+    }
+
+    return next(
+        (
+            flexible_prices[courseware_key]
+            for courseware_key in courseware_keys
+            if courseware_key in flexible_prices
+        ),
+        None,
+    )
 
 
 def is_courseware_flexible_price_approved(course_run, user):
@@ -307,23 +412,10 @@ def is_courseware_flexible_price_approved(course_run, user):
     if isinstance(user, AnonymousUser):
         return False
 
-    for eligible_courseware in get_ordered_eligible_coursewares(course_run):
-        content_type = ContentType.objects.get_for_model(eligible_courseware)
-        flexible_price = FlexiblePrice.objects.filter(
-            courseware_content_type=content_type,
-            courseware_object_id=eligible_courseware.id,
-            user=user,
-        ).first()
-
-        if (
-            flexible_price
-            and flexible_price.tier.current
-            and flexible_price.status
-            in (FlexiblePriceStatus.APPROVED, FlexiblePriceStatus.AUTO_APPROVED)
-        ):
-            return True
-
-    return False
+    return (
+        _get_approved_flexible_price(get_ordered_eligible_coursewares(course_run), user)
+        is not None
+    )
 
 
 @transaction.atomic()
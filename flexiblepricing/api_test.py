@@ -368,6 +368,34 @@ class FlexiblePriceAPITests(FlexiblePriceBaseTestCase):
         )
         assert determine_tier_courseware(courseware_object, 34938234) != not_current
 
+    def test_determine_tier_courseware_cached_tiers(self):
+        """
+        determine_tier_courseware() should use the cached tier table, which is
+        refreshed when a tier changes
+        """
+        assert (
+            determine_tier_courseware(self.program, 80000) == self.program_tiers["75k"]
+        )
+
+        with self.assertNumQueries(1):
+            assert (
+                determine_tier_courseware(self.program, 80000)
+                == self.program_tiers["75k"]
+            )
+
+        new_tier = FlexiblePriceTierFactory.create(
+            courseware_object=self.program,
+            income_threshold_usd=78000,
+            current=True,
+        )
+        assert determine_tier_courseware(self.program, 80000) == new_tier
+
+        # update() doesn't clear the cache, so the stale entry gets reloaded
+        FlexiblePriceTier.objects.filter(id=new_tier.id).update(current=False)
+        assert (
+            determine_tier_courseware(self.program, 80000) == self.program_tiers["75k"]
+        )
+
     def test_determine_tier_courseware_improper_setup(self):
         """
         Tests that determine_tier_courseware() raises ImproperlyConfigured if no $0-discount TierProgram
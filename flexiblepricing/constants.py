@@ -118,3 +118,10 @@ REQUIRED_FLEXIBLE_PRICING_FORM_FIELDS = [
         "required": True,
     },
 ]
+
+# Redis cache key for the table of current flexible price tiers, which is
+# cleared whenever a tier is saved or deleted.
+FLEXIBLE_PRICE_TIERS_CACHE_KEY = "flexiblepricing:current_tiers"
+# The table also expires after an hour, so a missed clear can't leave it stale
+# for long.
+FLEXIBLE_PRICE_TIERS_CACHE_TIMEOUT = 60 * 60
@@ -32,6 +32,7 @@ from ecommerce.constants import (
     REDEMPTION_TYPE_UNLIMITED,
 )
 from ecommerce.models import Discount
+from flexiblepricing.api import clear_current_tier_table_cache
 from flexiblepricing.models import FlexiblePriceTier
 
 
@@ -250,5 +251,7 @@ class Command(BaseCommand):
             courseware_content_type=content_type,
             discount__in=unmatched_discounts_qset.all(),
         ).update(current=False)
+        # update() doesn't send the signals that clear the cached tiers
+        clear_current_tier_table_cache()
 
         self.stdout.write(f"{unmatched_tiers} tiers deactivated")
@@ -4,11 +4,13 @@ Signals for mitxonline course certificates
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from flexiblepricing.api import clear_current_tier_table_cache
 from flexiblepricing.constants import FlexiblePriceStatus
-from flexiblepricing.models import FlexiblePrice
+from flexiblepricing.models import FlexiblePrice, FlexiblePriceTier
 from flexiblepricing.tasks import process_flexible_price_discount_task
 
 logger = logging.getLogger(__name__)
@@ -30,3 +32,18 @@ def _should_process_flexible_price(instance) -> bool:
         FlexiblePriceStatus.APPROVED,
         FlexiblePriceStatus.AUTO_APPROVED,
     )
+
+
+@receiver(
+    post_save, sender=FlexiblePriceTier, dispatch_uid="flexiblepricetier_post_save"
+)
+@receiver(
+    post_delete, sender=FlexiblePriceTier, dispatch_uid="flexiblepricetier_post_delete"
+)
+def handle_flexible_price_tier_change(sender, instance, **kwargs):  # pylint: disable=unused-argument  # noqa: ARG001
+    """
+    Clear the cached tier table so the change is picked up. It's cleared again
+    once the change is committed, in case the old tiers were cached in between.
+    """
+    clear_current_tier_table_cache()
+    transaction.on_commit(clear_current_tier_table_cache)
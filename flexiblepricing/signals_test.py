@@ -1,9 +1,10 @@
 import logging
+from unittest.mock import patch
 
 from django.test import TestCase
 
 from flexiblepricing.constants import FlexiblePriceStatus
-from flexiblepricing.factories import FlexiblePriceFactory
+from flexiblepricing.factories import FlexiblePriceFactory, FlexiblePriceTierFactory
 from flexiblepricing.signals import (
     _should_process_flexible_price,
 )
@@ -30,3 +31,18 @@ class TestFlexiblePriceSignals(TestCase):
         """Test that non-approved statuses return False"""
         fp = FlexiblePriceFactory(status=FlexiblePriceStatus.CREATED)
         assert _should_process_flexible_price(fp) is False
+
+    def test_tier_change_clears_cached_tiers_after_commit(self):
+        """
+        Saving a tier should clear the cached tier table, and clear it again once
+        the change is committed
+        """
+        with (
+            patch(
+                "flexiblepricing.signals.clear_current_tier_table_cache"
+            ) as mock_clear,
+            self.captureOnCommitCallbacks() as callbacks,
+        ):
+            FlexiblePriceTierFactory.create()
+        mock_clear.assert_called_once_with()
+        assert mock_clear in callbacks
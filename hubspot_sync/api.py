@@ -9,7 +9,7 @@ from typing import List  # noqa: UP035
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import Q
+from django.db.models.functions import Lower
 from hubspot.crm.objects import (
     ApiException,
     SimplePublicObject,
@@ -47,7 +47,7 @@ from ecommerce.constants import (
     DISCOUNT_TYPE_FIXED_PRICE,
     DISCOUNT_TYPE_PERCENT_OFF,
 )
-from ecommerce.discounts import resolve_product_version
+from ecommerce.discounts import get_product_version_snapshot
 from ecommerce.models import Line, Order, Product
 from hubspot_sync.rate_limiter import wait_for_hubspot_rate_limit
 from openedx.constants import EDX_ENROLLMENT_AUDIT_MODE, EDX_ENROLLMENT_VERIFIED_MODE
@@ -61,6 +61,10 @@ from users.models import (
 
 log = logging.getLogger(__name__)
 
+# How many HubSpot id mappings are written per bulk upsert when reconciling
+# HubSpot objects with the database.
+HUBSPOT_ID_SYNC_CHUNK_SIZE = 1000
+
 # HubSpot internal option value for the "Checkout Abandoned" deal stage.
 CART_ADD_DEAL_STAGE = "checkout_abandoned"
 
@@ -1119,6 +1123,49 @@ def sync_program_certificate_with_hubspot(cert) -> SimplePublicObject | None:
     return hubspot_certificate_result
 
 
+CONTACT_PROPERTIES_MAP = {
+    "email": "email",
+    "name": "name",
+    "country": "country",
+    "state": "state",
+    "year_of_birth": "yearofbirth",
+    "gender": "gender",
+    "company": "company",
+    "company_size": "companysize",
+    "job_title": "jobtitle",
+    "industry": "industry",
+    "job_function": "jobfunction",
+    "years_experience": "yearsexperience",
+    "leadership_level": "leadershiplevel",
+    "highest_education": "highesteducation",
+    "type_is_student": "typeisstudent",
+    "type_is_professional": "typeisprofessional",
+    "type_is_educator": "typeiseducator",
+    "type_is_other": "typeisother",
+}
+
+
+def make_contact_sync_messages_from_user_ids(
+    user_ids: List[int],  # noqa: UP006
+) -> dict[int, SimplePublicObjectInput]:
+    """
+    Create HubSpot contact sync messages for a list of User IDs, loading the users
+    along with their legal addresses and profiles in a single query.
+
+    Args:
+        user_ids (List[int]): List of user ids.
+
+    Returns:
+        dict[int, SimplePublicObjectInput]: User id to input object, ordered by user id
+    """
+    users = (
+        User.objects.filter(id__in=user_ids)
+        .select_related("legal_address", "user_profile")
+        .order_by("id")
+    )
+    return {user.id: make_contact_sync_message_from_user(user) for user in users}
+
+
 def make_contact_create_message_list_from_user_ids(
     user_ids: List[int],  # noqa: UP006
 ) -> List[SimplePublicObjectInput]:  # noqa: UP006
@@ -1131,14 +1178,7 @@ def make_contact_create_message_list_from_user_ids(
     Returns:
         List[SimplePublicObjectInput]: List of input objects for upserting User data to Hubspot
     """
-    users = list(
-        User.objects.filter(id__in=user_ids).order_by("id")
-    )  # Sorted to support unit test.
-    message_list = []
-    for user in users:
-        message_list.append(make_contact_sync_message_from_user(user))  # noqa: PERF401
-
-    return message_list
+    return list(make_contact_sync_messages_from_user_ids(user_ids).values())
 
 
 def make_contact_update_message_list_from_user_ids(
@@ -1154,17 +1194,12 @@ def make_contact_update_message_list_from_user_ids(
         List[dict]: List of dictionaries containing User properties.
     """
     chunk_dictionary = dict(chunk)
-    users = User.objects.filter(id__in=chunk_dictionary.keys())
-    request_input = []
-    for user_id, hubspot_id in chunk_dictionary.items():
-        user = users.filter(id=user_id).first()
-        request_input.append(
-            {
-                "id": hubspot_id,
-                "properties": make_contact_sync_message_from_user(user).properties,
-            }
-        )
-    return request_input
+    messages = make_contact_sync_messages_from_user_ids(chunk_dictionary.keys())
+    return [
+        {"id": hubspot_id, "properties": messages[user_id].properties}
+        for user_id, hubspot_id in chunk_dictionary.items()
+        if user_id in messages
+    ]
 
 
 def make_contact_sync_message_from_user(
@@ -1174,44 +1209,34 @@ def make_contact_sync_message_from_user(
     Create the body of a HubSpot sync message for a contact. This will flatten the contained LegalAddress and Profile
     serialized data into one larger serializable dict
 
+    Only the fields in CONTACT_PROPERTIES_MAP are serialized, so this doesn't query
+    anything beyond the user's legal address and profile (none if those were loaded
+    with select_related).
+
     Args:
         user (User): User object.
         skip_certificates (bool): Deprecated no-op, retained for backward compatibility.
     Returns:
         SimplePublicObjectInput: Input object for upserting User data to Hubspot
     """
-    from hubspot_sync.serializers import HubspotContactSerializer  # noqa: PLC0415
-
-    contact_properties_map = {
-        "email": "email",
-        "name": "name",
-        "country": "country",
-        "state": "state",
-        "year_of_birth": "yearofbirth",
-        "gender": "gender",
-        "company": "company",
-        "company_size": "companysize",
-        "job_title": "jobtitle",
-        "industry": "industry",
-        "job_function": "jobfunction",
-        "years_experience": "yearsexperience",
-        "leadership_level": "leadershiplevel",
-        "highest_education": "highesteducation",
-        "type_is_student": "typeisstudent",
-        "type_is_professional": "typeisprofessional",
-        "type_is_educator": "typeiseducator",
-        "type_is_other": "typeisother",
-    }
+    from users.serializers import (  # noqa: PLC0415
+        LegalAddressSerializer,
+        UserProfileSerializer,
+    )
 
     # skip_certificates is kept for backward API compatibility but is now a no-op
     # because certificates are synced as HubSpot custom objects, not contact properties.
     _ = skip_certificates
 
-    properties = HubspotContactSerializer(user).data
-    properties.update(properties.pop("legal_address") or {})
-    properties.update(properties.pop("user_profile") or {})
+    properties = {"email": user.email, "name": user.name}
+    legal_address = getattr(user, "legal_address", None)
+    if legal_address is not None:
+        properties.update(LegalAddressSerializer(legal_address).data)
+    user_profile = getattr(user, "user_profile", None)
+    if user_profile is not None:
+        properties.update(UserProfileSerializer(user_profile).data)
 
-    hubspot_props = transform_object_properties(properties, contact_properties_map)
+    hubspot_props = transform_object_properties(properties, CONTACT_PROPERTIES_MAP)
     return make_object_properties_message(hubspot_props)
 
 
@@ -1416,6 +1441,63 @@ def format_product_name(product: Product) -> str:
     return f"{product_obj.title}: {title_suffix} [{format_app_id(product.id)}]"
 
 
+def bulk_upsert_hubspot_objects(content_type: ContentType, hubspot_ids: dict):
+    """
+    Create or update the HubspotObjects for a set of objects in one query
+
+    Args:
+        content_type(ContentType): The content type of the objects
+        hubspot_ids(dict): object id to HubSpot id
+    """
+    HubspotObject.objects.bulk_create(
+        [
+            HubspotObject(
+                content_type=content_type, object_id=object_id, hubspot_id=hubspot_id
+            )
+            for object_id, hubspot_id in hubspot_ids.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["object_id", "content_type"],
+        update_fields=["hubspot_id"],
+    )
+
+
+class _HubspotIdSyncWriter:
+    """
+    Buffers matched HubSpot ids and writes them in chunked bulk upserts, logging
+    progress and throughput as it goes
+    """
+
+    def __init__(self, content_type: ContentType, label: str):
+        self.content_type = content_type
+        self.label = label
+        self.pending = {}
+        self.seen = 0
+        self.matched = 0
+        self.started = time.monotonic()
+
+    def add(self, object_id: int, hubspot_id: str):
+        """Record a match, flushing once a chunk's worth is pending"""
+        self.pending[object_id] = hubspot_id
+        self.matched += 1
+        if len(self.pending) >= HUBSPOT_ID_SYNC_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Write any pending matches and log progress"""
+        if self.pending:
+            bulk_upsert_hubspot_objects(self.content_type, self.pending)
+            self.pending = {}
+        elapsed = time.monotonic() - self.started
+        log.info(
+            "Synced %s hubspot ids: %d matched of %d processed (%.1f/s)",
+            self.label,
+            self.matched,
+            self.seen,
+            self.seen / elapsed if elapsed else 0,
+        )
+
+
 def sync_contact_hubspot_ids_to_db():
     """
     Create HubspotObjects for all contacts in Hubspot
@@ -1423,23 +1505,32 @@ def sync_contact_hubspot_ids_to_db():
     Returns:
         bool: True if hubspot id matches found for all Users
     """
+    content_type = ContentType.objects.get_for_model(User)
+    user_ids_by_email = {}
+    for user_id, email in (
+        User.objects.annotate(email_lower=Lower("email"))
+        .order_by("id")
+        .values_list("id", "email_lower")
+    ):
+        user_ids_by_email.setdefault(email, user_id)
+
+    writer = _HubspotIdSyncWriter(content_type, "contact")
     contacts = get_all_objects(
         HubspotObjectType.CONTACTS.value, properties=["email", "hs_additional_emails"]
     )
-    content_type = ContentType.objects.get_for_model(User)
     for contact in contacts:
-        user = User.objects.filter(email__iexact=contact.properties["email"]).first()
-        if not user and contact.properties["hs_additional_emails"]:
-            alt_email_q = Q()
-            for alt_email in contact.properties["hs_additional_emails"].split(";"):
-                alt_email_q |= Q(email__iexact=alt_email)
-            user = User.objects.filter(alt_email_q).first()
-        if user:
-            HubspotObject.objects.update_or_create(
-                content_type=content_type,
-                object_id=user.id,
-                defaults={"hubspot_id": contact.id},
-            )
+        writer.seen += 1
+        user_id = user_ids_by_email.get((contact.properties["email"] or "").lower())
+        if user_id is None and contact.properties.get("hs_additional_emails"):
+            alt_user_ids = [
+                user_ids_by_email[alt_email.lower()]
+                for alt_email in contact.properties["hs_additional_emails"].split(";")
+                if alt_email.lower() in user_ids_by_email
+            ]
+            user_id = min(alt_user_ids, default=None)
+        if user_id is not None:
+            writer.add(user_id, contact.id)
+    writer.flush()
     return (
         User.objects.count()
         == HubspotObject.objects.filter(content_type=content_type).count()
@@ -1455,36 +1546,40 @@ def sync_product_hubspot_ids_to_db() -> bool:
     """
     content_type = ContentType.objects.get_for_model(Product)
     product_mapping = {}
-    for product in Product.objects.all():
-        product_mapping.setdefault(format_product_name(product), []).append(product.id)
+    for product in Product.objects.prefetch_related("purchasable_object").order_by(
+        "-created_on"
+    ):
+        product_mapping.setdefault(format_product_name(product), []).append(product)
+    matched_ids = set(
+        HubspotObject.objects.filter(content_type=content_type).values_list(
+            "object_id", flat=True
+        )
+    )
+
+    writer = _HubspotIdSyncWriter(content_type, "product")
     products = get_all_objects(HubspotObjectType.PRODUCTS.value)
     for product in products:
+        writer.seen += 1
         matching_products = product_mapping.get(product.properties["name"])
         if not matching_products:
             continue
         if len(matching_products) > 1:
-            # Narrow down by price
-            matched_subquery = HubspotObject.objects.filter(
-                content_type=content_type
-            ).values_list("object_id", flat=True)
-            matching_product = (
-                Product.objects.exclude(id__in=matched_subquery)
-                .filter(
-                    id__in=matching_products,
-                    price=Decimal(product.properties["price"]),
-                )
-                .order_by("-created_on")
-                .values_list("id", flat=True)
-                .first()
+            # Narrow down by price, preferring the newest unmatched product
+            price = Decimal(product.properties["price"])
+            matching_product = next(
+                (
+                    candidate.id
+                    for candidate in matching_products
+                    if candidate.id not in matched_ids and candidate.price == price
+                ),
+                None,
             )
         else:
-            matching_product = matching_products[0]
+            matching_product = matching_products[0].id
         if matching_product:
-            HubspotObject.objects.update_or_create(
-                content_type=content_type,
-                object_id=matching_product,
-                defaults={"hubspot_id": product.id},
-            )
+            matched_ids.add(matching_product)
+            writer.add(matching_product, product.id)
+    writer.flush()
     return (
         Product.objects.count()
         == HubspotObject.objects.filter(content_type=content_type).count()
@@ -2332,11 +2427,7 @@ def _get_product_from_line(line: Line) -> Product | None:
     """Resolve the line's product similarly to serializer logic used for HubSpot payloads."""
     if not line.product_version:
         return None
-    version = line.product_version
-    product = Product.all_objects.filter(id=version.object_id).first()
-    if product:
-        return resolve_product_version(product, product_version=version)
-    return version.object
+    return get_product_version_snapshot(line.product_version)
 
 
 def _find_target_product_id_by_unique_app_id(
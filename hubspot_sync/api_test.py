@@ -33,6 +33,7 @@ from hubspot_sync.serializers import (
 )
 from openedx.constants import EDX_ENROLLMENT_AUDIT_MODE, EDX_ENROLLMENT_VERIFIED_MODE
 from users.factories import UserFactory
+from users.models import User
 
 pytestmark = [pytest.mark.django_db]
 
@@ -223,6 +224,41 @@ def test_make_contact_sync_message_empty_name(mocker):
     assert contact_sync_message.properties["email"] == "testuser@example.com"
 
 
+def test_make_contact_message_lists_from_user_ids(django_assert_num_queries):
+    """
+    The contact create and update message builders should load a whole chunk of
+    users in one query and match make_contact_sync_message_from_user
+    """
+    users = UserFactory.create_batch(3)
+    minimal_user = UserFactory.create(
+        legal_address=None,
+        user_profile=None,
+        openedx_user=None,
+        openedx_api_auth=None,
+    )
+    user_ids = [user.id for user in [*users, minimal_user]]
+    expected = {
+        user_id: api.make_contact_sync_message_from_user(
+            User.objects.get(id=user_id)
+        ).properties
+        for user_id in user_ids
+    }
+
+    with django_assert_num_queries(1):
+        create_messages = api.make_contact_create_message_list_from_user_ids(user_ids)
+    assert [message.properties for message in create_messages] == [
+        expected[user_id] for user_id in sorted(user_ids)
+    ]
+
+    chunk = [(user_id, f"hubspot-{user_id}") for user_id in user_ids]
+    with django_assert_num_queries(1):
+        update_messages = api.make_contact_update_message_list_from_user_ids(chunk)
+    assert update_messages == [
+        {"id": hubspot_id, "properties": expected[user_id]}
+        for user_id, hubspot_id in chunk
+    ]
+
+
 @pytest.mark.django_db
 def test_make_deal_sync_message(hubspot_order):
     """Test make_deal_sync_message serializes an order and returns a properly formatted sync message"""
@@ -769,6 +805,48 @@ def test_sync_contact_hubspot_ids_alternate(mocker, mock_hubspot_api, multiple_e
     assert HubspotObject.objects.filter(content_type__model="user").count() == 1
 
 
+def test_sync_contact_hubspot_ids_bulk(
+    mocker, mock_hubspot_api, django_assert_num_queries
+):
+    """
+    sync_contact_hubspot_ids_to_db should match contacts in memory and write the
+    mappings in bulk, updating any stale ones
+    """
+    users = UserFactory.create_batch(5)
+    content_type = ContentType.objects.get_for_model(User)
+    HubspotObjectFactory.create(
+        content_object=users[0], content_type=content_type, hubspot_id="stale"
+    )
+    contacts = [
+        SimplePublicObjectFactory(
+            id=f"3000{user.id}", properties={"email": user.email.upper()}
+        )
+        for user in users[:4]
+    ]
+    contacts.append(
+        SimplePublicObjectFactory(
+            id=f"3000{users[4].id}",
+            properties={
+                "email": "unknown@fake.edu",
+                "hs_additional_emails": f"other@fake.edu;{users[4].email}",
+            },
+        )
+    )
+    mock_hubspot_api.return_value.crm.objects.basic_api.get_page.side_effect = [
+        mocker.Mock(results=contacts[:3], paging=mocker.Mock()),
+        mocker.Mock(results=contacts[3:], paging=None),
+    ]
+
+    # email index, one upsert, and the two counts
+    with django_assert_num_queries(4):
+        assert api.sync_contact_hubspot_ids_to_db() is True
+    assert set(
+        HubspotObject.objects.filter(content_type=content_type).values_list(
+            "object_id", "hubspot_id"
+        )
+    ) == {(user.id, f"3000{user.id}") for user in users}
+
+
 @pytest.mark.parametrize("match_all", [True, False])
 def test_sync_product_hubspot_ids_to_hubspot(mocker, mock_hubspot_api, match_all):
     """sync_product_hubspot_ids_to_db should create HubspotObjects and return True if all products matched"""
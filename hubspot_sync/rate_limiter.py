@@ -2,23 +2,37 @@
 Rate limiting for HubSpot API calls
 """
 
+import contextvars
+import functools
 import logging
 import random
 import time
 import uuid
 
 from django.conf import settings
+from hubspot.crm.objects import ApiException
+from rest_framework.status import HTTP_429_TOO_MANY_REQUESTS
 
 log = logging.getLogger(__name__)
 
+# Waits shorter than this are slept through even when deferral is enabled,
+# since re-enqueueing a task costs more than that.
+DEFER_MIN_WAIT_SECONDS = 1.0
+
+# Whether the next rate limit wait in the current context may be deferred
+# instead of slept through - see defer_on_rate_limit
+_can_defer = contextvars.ContextVar("hubspot_rate_limit_can_defer", default=False)
+
 # Atomic sliding-window rate limiter implemented as a Redis Lua script.
 #
 # The sorted set stores claimed slots: member = unique ID, score = scheduled
 # execution time. Cleanup removes slots whose window has expired. When all
 # slots in the current window are claimed, the next slot is pushed past the
 # oldest slot's window boundary, distributing load across workers automatically.
+# Each claimed slot is also counted in the stats hash.
 _RATE_LIMIT_LUA = """
 local key       = KEYS[1]
+local stats_key = KEYS[2]
 local now       = tonumber(ARGV[1])
 local window    = tonumber(ARGV[2])
 local max_req   = tonumber(ARGV[3])
@@ -48,6 +62,7 @@ end
 
 redis.call('ZADD', key, target, member)
 redis.call('EXPIRE', key, math.ceil(window) + 1)
+redis.call('HINCRBY', stats_key, 'reserved', 1)
 
 local wait_ms = (target - now) * 1000
 if wait_ms < 0 then wait_ms = 0 end
@@ -55,12 +70,25 @@ return tostring(wait_ms)
 """
 
 
+class HubSpotRateLimitDeferred(Exception):  # noqa: N818
+    """
+    Raised instead of sleeping when a deferrable task would have to wait for a
+    rate limit slot
+    """
+
+    def __init__(self, countdown: float):
+        super().__init__(f"HubSpot rate limited, retry in {countdown:.3f}s")
+        self.countdown = countdown
+
+
 class HubSpotRateLimiter:
     """
     Distributed rate limiter using a Redis sorted-set sliding window.
 
     All Celery workers share the same Redis key, so rate limiting is enforced
-    globally across processes rather than per-process.
+    globally across processes rather than per-process. The reserved, released
+    and deferred slots, the time slept and the 429 responses are counted in a
+    Redis hash shared the same way, see get_stats().
     """
 
     def __init__(self):
@@ -68,36 +96,93 @@ class HubSpotRateLimiter:
         self._window_size_seconds = 1.0
         self._max_requests_per_second = 19
         self._redis_key = "hubspot:rate_limit"
+        self._stats_key = f"{self._redis_key}:stats"
+        self._script = None
 
     def _get_redis(self):
         from django_redis import get_redis_connection  # noqa: PLC0415
 
         return get_redis_connection("redis")
 
-    def wait_for_rate_limit(self) -> None:
+    def reserve_slot(self) -> tuple[str, float]:
+        """
+        Claim the next free slot in the rate limit window
+
+        Returns:
+            tuple(str, float): The slot id and the number of seconds until the slot
+        """
         redis_client = self._get_redis()
-        now = time.time()
+        if self._script is None:
+            # redis-py keeps the script's SHA and reloads it on NOSCRIPT, so it
+            # only needs registering once per process
+            self._script = redis_client.register_script(_RATE_LIMIT_LUA)
         member = str(uuid.uuid4())
-
-        script = redis_client.register_script(_RATE_LIMIT_LUA)
-        result = script(
-            keys=[self._redis_key],
+        result = self._script(
+            keys=[self._redis_key, self._stats_key],
             args=[
-                str(now),
+                str(time.time()),
                 str(self._window_size_seconds),
                 str(self._max_requests_per_second),
                 str(self.min_delay_ms / 1000),
                 member,
             ],
+            client=redis_client,
         )
-        wait_ms = float(result)
+        return member, float(result) / 1000
+
+    def release_slot(self, member: str) -> None:
+        """Give back a slot claimed by reserve_slot() that won't be used"""
+        pipeline = self._get_redis().pipeline()
+        pipeline.zrem(self._redis_key, member)
+        pipeline.hincrby(self._stats_key, "released", 1)
+        pipeline.execute()
+
+    def record_too_many_requests(self) -> None:
+        """Count a 429 response from HubSpot"""
+        self._get_redis().hincrby(self._stats_key, "too_many_requests", 1)
+
+    def get_stats(self) -> dict:
+        """
+        Counters for the rate limiter across all workers
+
+        Returns:
+            dict: reserved (slots claimed), released (slots given back), deferred
+                (tasks rescheduled rather than sleeping), too_many_requests (429
+                responses from HubSpot) and slept_seconds (total time slept
+                waiting for a slot)
+        """
+        stats = {
+            key.decode() if isinstance(key, bytes) else key: float(value)
+            for key, value in self._get_redis().hgetall(self._stats_key).items()
+        }
+        return {
+            **{
+                field: int(stats.get(field, 0))
+                for field in ("reserved", "released", "deferred", "too_many_requests")
+            },
+            "slept_seconds": stats.get("slept_seconds", 0.0),
+        }
+
+    def wait_for_rate_limit(self) -> None:
+        member, wait_seconds = self.reserve_slot()
+        can_defer = _can_defer.get()
+        # only the first wait of a deferrable task may defer, so that a task
+        # that already made HubSpot calls isn't restarted partway through
+        _can_defer.set(False)
 
-        if wait_ms > 0:
-            sleep_time = wait_ms / 1000
-            jitter = random.uniform(-0.05, 0.05) * sleep_time  # noqa: S311
-            sleep_time = max(0, sleep_time + jitter)
-            log.debug("Rate limiting: sleeping for %.3f seconds", sleep_time)
-            time.sleep(sleep_time)
+        if wait_seconds <= 0:
+            return
+
+        if can_defer and wait_seconds >= DEFER_MIN_WAIT_SECONDS:
+            self.release_slot(member)
+            self._get_redis().hincrby(self._stats_key, "deferred", 1)
+            raise HubSpotRateLimitDeferred(wait_seconds)
+
+        jitter = random.uniform(-0.05, 0.05) * wait_seconds  # noqa: S311
+        sleep_time = max(0, wait_seconds + jitter)
+        log.debug("Rate limiting: sleeping for %.3f seconds", sleep_time)
+        self._get_redis().hincrbyfloat(self._stats_key, "slept_seconds", sleep_time)
+        time.sleep(sleep_time)
 
 
 rate_limiter = HubSpotRateLimiter()
@@ -108,3 +193,45 @@ def wait_for_hubspot_rate_limit() -> None:
     Wait for HubSpot rate limits.
     """
     rate_limiter.wait_for_rate_limit()
+
+
+def get_hubspot_rate_limit_stats() -> dict:
+    """
+    Counters for the HubSpot rate limiter, see HubSpotRateLimiter.get_stats
+    """
+    return rate_limiter.get_stats()
+
+
+def defer_on_rate_limit(func):
+    """
+    Decorator for single-object HubSpot sync tasks. With HUBSPOT_RATE_LIMIT_DEFER
+    enabled, a task whose first HubSpot call would have to wait for a rate limit
+    slot is re-enqueued with a countdown instead of sleeping in the worker.
+
+    Goes between @app.task and the task function, so that it runs in the task's
+    context.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _can_defer.set(settings.HUBSPOT_RATE_LIMIT_DEFER)
+        try:
+            return func(*args, **kwargs)
+        except HubSpotRateLimitDeferred as exc:
+            from celery import current_task  # noqa: PLC0415
+
+            log.debug(
+                "Rescheduling %s in %.3f seconds for HubSpot rate limit",
+                current_task.name,
+                exc.countdown,
+            )
+            current_task.apply_async(args=args, kwargs=kwargs, countdown=exc.countdown)
+            return None
+        except ApiException as exc:
+            if int(exc.status) == HTTP_429_TOO_MANY_REQUESTS:
+                rate_limiter.record_too_many_requests()
+            raise
+        finally:
+            _can_defer.reset(token)
+
+    return wrapper
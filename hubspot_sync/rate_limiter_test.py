@@ -4,10 +4,13 @@ from unittest.mock import patch
 
 import pytest
 from django.test import override_settings
+from hubspot.crm.objects import ApiException
 
 from hubspot_sync.rate_limiter import (
     _RATE_LIMIT_LUA,
     HubSpotRateLimiter,
+    defer_on_rate_limit,
+    wait_for_hubspot_rate_limit,
 )
 
 
@@ -52,7 +55,7 @@ class TestHubSpotRateLimiter:
         _, mock_script = self._mock_redis(mocker)
         self.rate_limiter.wait_for_rate_limit()
         call_kwargs = mock_script.call_args[1]
-        assert call_kwargs["keys"] == ["hubspot:rate_limit"]
+        assert call_kwargs["keys"] == ["hubspot:rate_limit", "hubspot:rate_limit:stats"]
         args = call_kwargs["args"]
         assert args[1] == "1.0"  # window_size_seconds
         assert args[2] == "19"  # max_requests_per_second
@@ -75,3 +78,90 @@ class TestHubSpotRateLimiter:
         self.rate_limiter.wait_for_rate_limit()
         mock_log.assert_called_once()
         assert "Rate limiting: sleeping for" in mock_log.call_args[0][0]
+
+    def test_registers_script_once(self, mocker):
+        mock_redis, mock_script = self._mock_redis(mocker)
+        self.rate_limiter.wait_for_rate_limit()
+        self.rate_limiter.wait_for_rate_limit()
+        mock_redis.register_script.assert_called_once_with(_RATE_LIMIT_LUA)
+        assert mock_script.call_count == 2
+
+    @patch("hubspot_sync.rate_limiter.time.sleep")
+    def test_counts_sleep_time(self, mock_sleep, mocker):
+        mock_redis, _ = self._mock_redis(mocker, b"500.0")
+        self.rate_limiter.wait_for_rate_limit()
+        mock_redis.hincrbyfloat.assert_called_once_with(
+            "hubspot:rate_limit:stats", "slept_seconds", mock_sleep.call_args[0][0]
+        )
+
+    @pytest.mark.parametrize(
+        ("enabled", "wait_ms_bytes", "expect_defer"),
+        [
+            (True, b"1500.0", True),
+            (True, b"500.0", False),
+            (False, b"1500.0", False),
+        ],
+    )
+    @patch("hubspot_sync.rate_limiter.time.sleep")
+    def test_defer_on_rate_limit(  # noqa: PLR0913
+        self, mock_sleep, mocker, settings, enabled, wait_ms_bytes, expect_defer
+    ):
+        """A deferrable task should be rescheduled rather than sleep on its first wait"""
+        settings.HUBSPOT_RATE_LIMIT_DEFER = enabled
+        mock_redis, _ = self._mock_redis(mocker, wait_ms_bytes)
+        mocker.patch("hubspot_sync.rate_limiter.rate_limiter", self.rate_limiter)
+        mock_task = mocker.patch("celery.current_task")
+
+        @defer_on_rate_limit
+        def sync_object(object_id, *, flag):
+            wait_for_hubspot_rate_limit()
+            wait_for_hubspot_rate_limit()
+            return object_id
+
+        result = sync_object(1, flag=True)
+
+        if expect_defer:
+            assert result is None
+            mock_task.apply_async.assert_called_once_with(
+                args=(1,), kwargs={"flag": True}, countdown=1.5
+            )
+            mock_redis.pipeline.return_value.zrem.assert_called_once()
+            mock_redis.hincrby.assert_called_once_with(
+                "hubspot:rate_limit:stats", "deferred", 1
+            )
+            mock_sleep.assert_not_called()
+        else:
+            assert result == 1
+            mock_task.apply_async.assert_not_called()
+            # only the first wait may defer, later ones always sleep
+            assert mock_sleep.call_count == 2
+
+    def test_defer_on_rate_limit_counts_429s(self, mocker):
+        mock_redis, _ = self._mock_redis(mocker)
+        mocker.patch("hubspot_sync.rate_limiter.rate_limiter", self.rate_limiter)
+
+        @defer_on_rate_limit
+        def sync_object():
+            raise ApiException(status=429)
+
+        with pytest.raises(ApiException):
+            sync_object()
+        mock_redis.hincrby.assert_called_once_with(
+            "hubspot:rate_limit:stats", "too_many_requests", 1
+        )
+
+    def test_get_stats(self, mocker):
+        mock_redis, _ = self._mock_redis(mocker)
+        mock_redis.hgetall.return_value = {
+            b"reserved": b"10",
+            b"deferred": b"2",
+            b"slept_seconds": b"1.5",
+        }
+        assert self.rate_limiter.get_stats() == {
+            "reserved": 10,
+            "released": 0,
+            "deferred": 2,
+            "too_many_requests": 0,
+            "slept_seconds": 1.5,
+        }
+        mock_redis.hgetall.assert_called_once_with("hubspot:rate_limit:stats")
@@ -14,11 +14,9 @@ from courses.models import (
 )
 from ecommerce import models
 from ecommerce.constants import DISCOUNT_TYPE_DOLLARS_OFF, DISCOUNT_TYPE_PERCENT_OFF
-from ecommerce.discounts import resolve_product_version
-from ecommerce.models import Product
+from ecommerce.discounts import get_product_version_snapshot
 from hubspot_sync.api import format_product_name, get_hubspot_id_for_object
 from main.utils import format_decimal
-from users.serializers import UserSerializer
 
 """
 Map order state to hubspot ids for pipeline stages
@@ -50,14 +48,11 @@ def _get_prefetched_first_related(instance, relation_name: str):
 
 
 def _resolve_product_from_version(version):
-    """Resolve a product from a ProductVersion while preserving previous behavior."""
+    """Resolve the product as it was at the given ProductVersion."""
     if version is None:
         return None
 
-    product = Product.all_objects.filter(id=version.object_id).first()
-    if product:
-        return resolve_product_version(product, product_version=version)
-    return version.object
+    return get_product_version_snapshot(version)
 
 
 def _get_line_enrollment(instance):
@@ -352,15 +347,6 @@ class ProductSerializer(serializers.ModelSerializer):
         model = models.Product
 
 
-class HubspotContactSerializer(UserSerializer):
-    """User Serializer for Hubspot"""
-
-    class Meta:
-        fields = (*UserSerializer.Meta.fields,)
-        read_only_fields = fields
-        model = models.User
-
-
 def get_hubspot_serializer(obj: object) -> serializers.ModelSerializer:
     """Get the appropriate serializer for an object"""
     if isinstance(obj, models.Order):
@@ -0,0 +1,104 @@
+"""
+Coalescing queue for per-object HubSpot syncs
+
+Sync triggers add object ids to a Redis set per sync type instead of each
+enqueueing a Celery task, so repeated triggers for the same object collapse
+into one pending entry. hubspot_sync.tasks.flush_pending_hubspot_syncs
+periodically drains the sets into sync tasks.
+"""
+
+import logging
+
+log = logging.getLogger(__name__)
+
+SYNC_TYPE_CONTACT = "contact"
+SYNC_TYPE_DEAL = "deal"
+SYNC_TYPE_UAI_DEAL = "uai_deal"
+SYNC_TYPE_COURSE_RUN_CERTIFICATE = "course_run_certificate"
+SYNC_TYPE_PROGRAM_CERTIFICATE = "program_certificate"
+SYNC_TYPES = (
+    SYNC_TYPE_CONTACT,
+    SYNC_TYPE_DEAL,
+    SYNC_TYPE_UAI_DEAL,
+    SYNC_TYPE_COURSE_RUN_CERTIFICATE,
+    SYNC_TYPE_PROGRAM_CERTIFICATE,
+)
+
+_PENDING_KEY_PREFIX = "hubspot:pending_sync"
+_STATS_KEY = f"{_PENDING_KEY_PREFIX}:stats"
+
+
+def _get_redis():
+    from django_redis import get_redis_connection  # noqa: PLC0415
+
+    return get_redis_connection("redis")
+
+
+def _pending_key(sync_type: str) -> str:
+    return f"{_PENDING_KEY_PREFIX}:{sync_type}"
+
+
+def queue_hubspot_sync(sync_type: str, object_id: int) -> bool:
+    """
+    Add an object to the pending set for a sync type
+
+    Args:
+        sync_type(str): One of SYNC_TYPES
+        object_id(int): The id of the object to sync
+
+    Returns:
+        bool: True if the object wasn't already pending
+    """
+    pipeline = _get_redis().pipeline()
+    pipeline.sadd(_pending_key(sync_type), object_id)
+    pipeline.hincrby(_STATS_KEY, f"{sync_type}:triggered", 1)
+    added, _ = pipeline.execute()
+    if added:
+        _get_redis().hincrby(_STATS_KEY, f"{sync_type}:queued", 1)
+    return bool(added)
+
+
+def drain_pending_hubspot_syncs(sync_type: str) -> list[int]:
+    """
+    Atomically remove and return every pending object id for a sync type
+
+    Args:
+        sync_type(str): One of SYNC_TYPES
+
+    Returns:
+        list of int: The pending object ids, sorted
+    """
+    redis_client = _get_redis()
+    key = _pending_key(sync_type)
+    count = redis_client.scard(key)
+    if not count:
+        return []
+    return sorted(int(object_id) for object_id in redis_client.spop(key, count))
+
+
+def get_pending_hubspot_sync_metrics() -> dict:
+    """
+    Queue depth and coalescing counters per sync type
+
+    Returns:
+        dict: sync type to a dict of depth (pending objects), triggered (sync
+            triggers received), queued (triggers that added a new pending object)
+            and coalesce_ratio (share of triggers that were collapsed into an
+            already-pending sync)
+    """
+    redis_client = _get_redis()
+    stats = {
+        key.decode() if isinstance(key, bytes) else key: int(value)
+        for key, value in redis_client.hgetall(_STATS_KEY).items()
+    }
+    metrics = {}
+    for sync_type in SYNC_TYPES:
+        triggered = stats.get(f"{sync_type}:triggered", 0)
+        queued = stats.get(f"{sync_type}:queued", 0)
+        metrics[sync_type] = {
+            "depth": redis_client.scard(_pending_key(sync_type)),
+            "triggered": triggered,
+            "queued": queued,
+            "coalesce_ratio": 1 - queued / triggered if triggered else 0.0,
+        }
+    return metrics
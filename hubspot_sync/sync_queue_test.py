@@ -0,0 +1,54 @@
+"""Tests for hubspot_sync.sync_queue"""
+
+import pytest
+
+from hubspot_sync import sync_queue
+
+
+@pytest.fixture(autouse=True)
+def clear_sync_queue():
+    """Start each test with an empty queue and counters"""
+    redis_client = sync_queue._get_redis()  # noqa: SLF001
+    keys = [
+        sync_queue._STATS_KEY,  # noqa: SLF001
+        *[sync_queue._pending_key(sync_type) for sync_type in sync_queue.SYNC_TYPES],  # noqa: SLF001
+    ]
+    redis_client.delete(*keys)
+    yield
+    redis_client.delete(*keys)
+
+
+def test_queue_coalesces_duplicates():
+    """Repeated triggers for the same object should leave a single pending entry"""
+    assert sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_CONTACT, 1) is True
+    assert sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_CONTACT, 1) is False
+    assert sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_CONTACT, 2) is True
+    assert sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_CONTACT, 1) is False
+    sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_DEAL, 1)
+
+    metrics = sync_queue.get_pending_hubspot_sync_metrics()
+    assert metrics[sync_queue.SYNC_TYPE_CONTACT] == {
+        "depth": 2,
+        "triggered": 4,
+        "queued": 2,
+        "coalesce_ratio": 0.5,
+    }
+    assert metrics[sync_queue.SYNC_TYPE_DEAL]["depth"] == 1
+    assert metrics[sync_queue.SYNC_TYPE_PROGRAM_CERTIFICATE] == {
+        "depth": 0,
+        "triggered": 0,
+        "queued": 0,
+        "coalesce_ratio": 0.0,
+    }
+
+    assert sync_queue.drain_pending_hubspot_syncs(sync_queue.SYNC_TYPE_CONTACT) == [
+        1,
+        2,
+    ]
+    assert sync_queue.drain_pending_hubspot_syncs(sync_queue.SYNC_TYPE_CONTACT) == []
+    assert (
+        sync_queue.get_pending_hubspot_sync_metrics()[sync_queue.SYNC_TYPE_CONTACT][
+            "depth"
+        ]
+        == 0
+    )
@@ -7,7 +7,7 @@ from django.conf import settings
 from courses.models import CourseRun, ProgramEnrollment
 from courses.utils import is_uai_order
 from ecommerce.models import Order, Product
-from hubspot_sync import tasks
+from hubspot_sync import sync_queue, tasks
 from hubspot_sync.api import _resolve_hubspot_token
 from users.models import User
 
@@ -33,6 +33,15 @@ def sync_hubspot_user(user: User):
         return
 
     if settings.MITOL_HUBSPOT_API_PRIVATE_TOKEN:
+        if settings.HUBSPOT_SYNC_COALESCE:
+            try:
+                sync_queue.queue_hubspot_sync(sync_queue.SYNC_TYPE_CONTACT, user.id)
+            except:  # noqa: E722
+                log.exception(
+                    "Exception queueing HubSpot sync for user %s", user.edx_username
+                )
+            else:
+                return
         try:
             tasks.sync_contact_with_hubspot.delay(user.id)
         except:  # noqa: E722
@@ -89,6 +98,20 @@ def sync_hubspot_deal(order: Order):
         is_uai = is_uai_order(order)
 
         if _resolve_hubspot_token(is_uai=is_uai):
+            if settings.HUBSPOT_SYNC_COALESCE:
+                try:
+                    sync_queue.queue_hubspot_sync(
+                        sync_queue.SYNC_TYPE_UAI_DEAL
+                        if is_uai
+                        else sync_queue.SYNC_TYPE_DEAL,
+                        order.id,
+                    )
+                except:  # noqa: E722
+                    log.exception(
+                        "Exception queueing HubSpot sync for order %d", order.id
+                    )
+                else:
+                    return
             try:
                 tasks.sync_deal_with_hubspot_targeted.apply_async(
                     args=(order.id,), kwargs={"is_uai": is_uai}, countdown=10
@@ -100,6 +123,49 @@ def sync_hubspot_deal(order: Order):
                 )
 
 
+def sync_hubspot_course_run_certificate(cert_id: int):
+    """
+    Trigger celery task to sync a CourseRunCertificate to Hubspot
+
+    Args:
+        cert_id (int): The ID of the CourseRunCertificate
+    """
+    if settings.HUBSPOT_SYNC_COALESCE:
+        try:
+            sync_queue.queue_hubspot_sync(
+                sync_queue.SYNC_TYPE_COURSE_RUN_CERTIFICATE, cert_id
+            )
+        except:  # noqa: E722
+            log.exception(
+                "Exception queueing HubSpot sync for course run certificate %d",
+                cert_id,
+            )
+        else:
+            return
+    tasks.sync_course_run_certificate_with_hubspot.delay(cert_id)
+
+
+def sync_hubspot_program_certificate(cert_id: int):
+    """
+    Trigger celery task to sync a ProgramCertificate to Hubspot
+
+    Args:
+        cert_id (int): The ID of the ProgramCertificate
+    """
+    if settings.HUBSPOT_SYNC_COALESCE:
+        try:
+            sync_queue.queue_hubspot_sync(
+                sync_queue.SYNC_TYPE_PROGRAM_CERTIFICATE, cert_id
+            )
+        except:  # noqa: E722
+            log.exception(
+                "Exception queueing HubSpot sync for program certificate %d", cert_id
+            )
+        else:
+            return
+    tasks.sync_program_certificate_with_hubspot.delay(cert_id)
+
+
 def sync_hubspot_line_by_line_id(line_id: int):
     """
     Trigger celery task to sync a Line to Hubspot.
@@ -10,8 +10,10 @@ from courses.models import ProgramRequirementNodeType
 from ecommerce.factories import LineFactory, OrderFactory, ProductFactory
 from hubspot_sync.task_helpers import (
     sync_hubspot_cart_add,
+    sync_hubspot_course_run_certificate,
     sync_hubspot_deal,
     sync_hubspot_product,
+    sync_hubspot_program_certificate,
     sync_hubspot_user,
 )
 from users.factories import UserFactory
@@ -292,3 +294,73 @@ def test_sync_hubspot_cart_add(mocker, mock_exception_log, user, raise_exc):
         )
     else:
         mock_exception_log.assert_not_called()
+
+
+@pytest.mark.parametrize("is_uai", [True, False])
+def test_sync_hubspot_triggers_coalesced(mocker, settings, hubspot_order, is_uai):
+    """With HUBSPOT_SYNC_COALESCE on, sync triggers should queue the object instead of a task"""
+    settings.MITOL_HUBSPOT_API_PRIVATE_TOKEN = "faketoken"  # noqa: S105
+    settings.UAI_MITOL_HUBSPOT_API_PRIVATE_TOKEN = "uai-token"  # noqa: S105
+    settings.HUBSPOT_SYNC_COALESCE = True
+    mocker.patch("hubspot_sync.task_helpers.is_uai_order", return_value=is_uai)
+    mock_queue = mocker.patch("hubspot_sync.task_helpers.sync_queue.queue_hubspot_sync")
+    mock_tasks = mocker.patch("hubspot_sync.task_helpers.tasks")
+    user = UserFactory.create()
+
+    sync_hubspot_user(user)
+    sync_hubspot_deal(hubspot_order)
+    sync_hubspot_course_run_certificate(4)
+    sync_hubspot_program_certificate(5)
+
+    assert mock_queue.call_args_list == [
+        mocker.call("contact", user.id),
+        mocker.call("uai_deal" if is_uai else "deal", hubspot_order.id),
+        mocker.call("course_run_certificate", 4),
+        mocker.call("program_certificate", 5),
+    ]
+    assert mock_tasks.mock_calls == []
+
+
+def test_sync_hubspot_user_coalesce_redis_failure(mocker, settings, mock_exception_log):
+    """If the sync can't be queued in Redis, sync_hubspot_user should run the task directly"""
+    settings.HUBSPOT_SYNC_COALESCE = True
+    mocker.patch(
+        "hubspot_sync.task_helpers.sync_queue.queue_hubspot_sync",
+        side_effect=ConnectionError,
+    )
+    mock_sync = mocker.patch(
+        "hubspot_sync.task_helpers.tasks.sync_contact_with_hubspot.delay"
+    )
+    user = UserFactory.create()
+
+    sync_hubspot_user(user)
+
+    mock_sync.assert_called_once_with(user.id)
+    mock_exception_log.assert_called_once_with(
+        "Exception queueing HubSpot sync for user %s", user.edx_username
+    )
+
+
+def test_sync_hubspot_deal_coalesce_redis_failure(
+    mocker, settings, mock_exception_log, hubspot_order
+):
+    """If the sync can't be queued in Redis, sync_hubspot_deal should run the task directly"""
+    settings.HUBSPOT_SYNC_COALESCE = True
+    settings.MITOL_HUBSPOT_API_PRIVATE_TOKEN = "regular-token"  # noqa: S105
+    mocker.patch("hubspot_sync.task_helpers.is_uai_order", return_value=False)
+    mocker.patch(
+        "hubspot_sync.task_helpers.sync_queue.queue_hubspot_sync",
+        side_effect=ConnectionError,
+    )
+    mock_sync = mocker.patch(
+        "hubspot_sync.task_helpers.tasks.sync_deal_with_hubspot_targeted.apply_async"
+    )
+
+    sync_hubspot_deal(hubspot_order)
+
+    mock_sync.assert_called_once_with(
+        args=(hubspot_order.id,), kwargs={"is_uai": False}, countdown=10
+    )
+    mock_exception_log.assert_called_once_with(
+        "Exception queueing HubSpot sync for order %d", hubspot_order.id
+    )
@@ -9,10 +9,13 @@ from typing import List, Tuple  # noqa: UP035
 import celery
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import F
+from django.db.models.functions import Lower
 from hubspot.crm.associations import BatchInputPublicAssociation, PublicAssociation
 from hubspot.crm.objects import (
     ApiException,
+    SimplePublicObject,
 )
 from hubspot.crm.objects import (
     BatchInputSimplePublicObjectBatchInputForCreate as BatchInputCreate,
@@ -26,11 +29,15 @@ from mitol.hubspot_api.exceptions import TooManyRequestsException
 from mitol.hubspot_api.models import HubspotObject
 
 from ecommerce.models import Line, Order, Product
-from hubspot_sync import api
+from hubspot_sync import api, sync_queue
 from hubspot_sync.api import (
     get_hubspot_id_for_object,
 )
-from hubspot_sync.rate_limiter import wait_for_hubspot_rate_limit
+from hubspot_sync.rate_limiter import (
+    defer_on_rate_limit,
+    get_hubspot_rate_limit_stats,
+    wait_for_hubspot_rate_limit,
+)
 from main.celery import app
 from users.models import User
 
@@ -144,6 +151,7 @@ def handle_failed_batch_chunk(chunk: List[int], hubspot_type: str) -> List[int]:
     retry_backoff_max=600,  # Cap backoff at 10 minutes
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_contact_with_hubspot(user_id: int) -> str:
     """
@@ -167,6 +175,7 @@ def sync_contact_with_hubspot(user_id: int) -> str:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_product_with_hubspot(product_id: int) -> str:
     """
@@ -189,6 +198,7 @@ def sync_product_with_hubspot(product_id: int) -> str:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_deal_with_hubspot(order_id: int) -> str | None:
     """
@@ -212,6 +222,7 @@ def sync_deal_with_hubspot(order_id: int) -> str | None:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_deal_with_hubspot_targeted(order_id: int, *, is_uai: bool) -> str | None:
     """
@@ -243,6 +254,7 @@ def sync_deal_with_hubspot_targeted(order_id: int, *, is_uai: bool) -> str | Non
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_course_run_certificate_with_hubspot(cert_id: int) -> str | None:
     """Sync a CourseRunCertificate to a HubSpot custom object record."""
@@ -261,6 +273,7 @@ def sync_course_run_certificate_with_hubspot(cert_id: int) -> str | None:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_program_certificate_with_hubspot(cert_id: int) -> str | None:
     """Sync a ProgramCertificate to a HubSpot custom object record."""
@@ -279,6 +292,7 @@ def sync_program_certificate_with_hubspot(cert_id: int) -> str | None:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_line_with_hubspot(line_id: int) -> str:
     """
@@ -301,6 +315,7 @@ def sync_line_with_hubspot(line_id: int) -> str:
     retry_jitter=True,
 )
 @raise_429
+@defer_on_rate_limit
 @single_task(10, key=task_obj_lock)
 def sync_cart_add_event_with_hubspot(
     user_id: int, product_id: int, *, is_uai_course: bool
@@ -323,6 +338,68 @@ def sync_cart_add_event_with_hubspot(
     )
 
 
+def _get_active_user_ids_by_email(emails) -> dict[str, int]:
+    """
+    Look up active users by case-insensitive email in a single query
+
+    Args:
+        emails(iterable of str): Email addresses returned by HubSpot
+
+    Returns:
+        dict: lowercased email to the id of the first matching active user
+    """
+    user_ids = {}
+    for user_id, email in (
+        User.objects.annotate(email_lower=Lower("email"))
+        .filter(
+            email_lower__in={email.lower() for email in emails if email},
+            is_active=True,
+        )
+        .order_by("id")
+        .values_list("id", "email_lower")
+    ):
+        user_ids.setdefault(email, user_id)
+    return user_ids
+
+
+def _save_created_hubspot_objects(
+    content_type: ContentType,
+    ct_model_name: str,
+    results: List[SimplePublicObject],  # noqa: UP006
+):
+    """
+    Store the HubSpot ids for a batch of newly created HubSpot objects, and mark
+    synced users, with one query per step rather than per object
+
+    Args:
+        content_type(ContentType): The content type of the synced objects
+        ct_model_name(str): The corresponding model name
+        results(list): The SimplePublicObjects returned by the batch create call
+    """
+    hubspot_ids = {}
+    if ct_model_name == "user":
+        user_ids = _get_active_user_ids_by_email(
+            result.properties["email"] for result in results
+        )
+        for result in results:
+            user_id = user_ids.get(result.properties["email"].lower())
+            if user_id is None:
+                log.warning("No active user found for HubSpot contact %s", result.id)
+                continue
+            hubspot_ids[user_id] = result.id
+    else:
+        for result in results:
+            object_id = int(result.properties["unique_app_id"].split("-")[-1])
+            hubspot_ids[object_id] = result.id
+
+    with transaction.atomic():
+        api.bulk_upsert_hubspot_objects(content_type, hubspot_ids)
+        if ct_model_name == "user":
+            User.objects.filter(id__in=hubspot_ids.keys()).update(
+                hubspot_sync_datetime=now_in_utc()
+            )
+
+
 @app.task(
     acks_late=True,
     autoretry_for=(TooManyRequestsException,),
@@ -385,24 +462,9 @@ def batch_create_hubspot_objects_chunked(
                     inputs=api.MODEL_CREATE_FUNCTION_MAPPING[ct_model_name](chunk)
                 ),
             )
-            chunk_created_count = 0
-            for result in response.results:
-                if ct_model_name == "user":
-                    user = User.objects.filter(
-                        email__iexact=result.properties["email"], is_active=True
-                    ).first()
-                    user.hubspot_sync_datetime = now_in_utc()
-                    user.save()
-                    object_id = user.id
-                else:
-                    object_id = result.properties["unique_app_id"].split("-")[-1]
-                HubspotObject.objects.update_or_create(
-                    content_type=content_type,
-                    hubspot_id=result.id,
-                    object_id=object_id,
-                )
-                created_ids.append(result.id)
-                chunk_created_count += 1
+            _save_created_hubspot_objects(content_type, ct_model_name, response.results)
+            chunk_created_count = len(response.results)
+            created_ids.extend(result.id for result in response.results)
 
             log.info(
                 "Successfully created %d %s(s) in chunk %d/%d",
@@ -490,11 +552,12 @@ def batch_update_hubspot_objects_chunked(
                 hubspot_type, BatchInputCreate(inputs=inputs)
             )
             chunk_updated_ids = [result.id for result in response.results]
-            for result in response.results:
-                if ct_model_name == "user":
-                    User.objects.filter(
-                        email__iexact=result.properties["email"], is_active=True
-                    ).update(hubspot_sync_datetime=now_in_utc())
+            if ct_model_name == "user":
+                User.objects.filter(
+                    id__in=_get_active_user_ids_by_email(
+                        result.properties["email"] for result in response.results
+                    ).values()
+                ).update(hubspot_sync_datetime=now_in_utc())
             updated_ids.extend(chunk_updated_ids)
             log.info("Updated the following HubSpot ID's %s", chunk_updated_ids)
             percent_complete = (len(updated_ids) / len(object_ids)) * 100
@@ -663,3 +726,103 @@ def batch_upsert_associations(self, order_ids: List[int] = None):  # noqa: UP006
         for chunk in chunks(sorted(deal_ids), chunk_size=chunk_size)
     ]
     raise self.replace(celery.group(chunked_tasks))
+
+
+def _flush_pending_contact_syncs():
+    """Drain the queued contact syncs into batch upserts, one per create/update"""
+    contact_ids = sync_queue.drain_pending_hubspot_syncs(sync_queue.SYNC_TYPE_CONTACT)
+    if not contact_ids:
+        return
+    synced_contact_ids = set(
+        HubspotObject.objects.filter(
+            content_type=ContentType.objects.get_for_model(User),
+            object_id__in=contact_ids,
+        ).values_list("object_id", flat=True)
+    )
+    for create, object_ids in (
+        (True, [id_ for id_ in contact_ids if id_ not in synced_contact_ids]),
+        (False, [id_ for id_ in contact_ids if id_ in synced_contact_ids]),
+    ):
+        if object_ids:
+            batch_upsert_hubspot_objects.delay(
+                HubspotObjectType.CONTACTS.value,
+                User._meta.model_name,  # noqa: SLF001
+                User._meta.app_label,  # noqa: SLF001
+                create,
+                object_ids,
+            )
+
+
+def _flush_pending_deal_syncs():
+    """Drain the queued deal syncs into a sync task per order"""
+    for sync_type, is_uai in (
+        (sync_queue.SYNC_TYPE_DEAL, False),
+        (sync_queue.SYNC_TYPE_UAI_DEAL, True),
+    ):
+        for order_id in sync_queue.drain_pending_hubspot_syncs(sync_type):
+            sync_deal_with_hubspot_targeted.delay(order_id, is_uai=is_uai)
+
+
+def _flush_pending_certificate_syncs():
+    """Drain the queued certificate syncs into a sync task per certificate"""
+    for sync_type, task in (
+        (
+            sync_queue.SYNC_TYPE_COURSE_RUN_CERTIFICATE,
+            sync_course_run_certificate_with_hubspot,
+        ),
+        (
+            sync_queue.SYNC_TYPE_PROGRAM_CERTIFICATE,
+            sync_program_certificate_with_hubspot,
+        ),
+    ):
+        for cert_id in sync_queue.drain_pending_hubspot_syncs(sync_type):
+            task.delay(cert_id)
+
+
+@app.task
+@single_task(10, raise_block=False)
+def flush_pending_hubspot_syncs():
+    """
+    Drain the coalesced HubSpot sync queue (see hubspot_sync.sync_queue) into
+    sync tasks, one per pending object or one batch upsert per contact chunk
+    """
+    if not settings.HUBSPOT_SYNC_COALESCE:
+        # Nothing is queued while coalescing is off, but anything left over from
+        # when it was on still needs to be synced
+        metrics = sync_queue.get_pending_hubspot_sync_metrics()
+        if not any(type_metrics["depth"] for type_metrics in metrics.values()):
+            return metrics
+
+    _flush_pending_contact_syncs()
+    _flush_pending_deal_syncs()
+    _flush_pending_certificate_syncs()
+
+    metrics = sync_queue.get_pending_hubspot_sync_metrics()
+    for sync_type, type_metrics in metrics.items():
+        log.info(
+            "HubSpot %s sync queue: depth=%d triggered=%d queued=%d coalesce_ratio=%.2f",
+            sync_type,
+            type_metrics["depth"],
+            type_metrics["triggered"],
+            type_metrics["queued"],
+            type_metrics["coalesce_ratio"],
+        )
+    return metrics
+
+
+@app.task
+def log_hubspot_rate_limit_stats():
+    """
+    Log the HubSpot rate limiter counters shared by all workers
+    """
+    stats = get_hubspot_rate_limit_stats()
+    log.info(
+        "HubSpot rate limiter: reserved=%d released=%d deferred=%d "
+        "too_many_requests=%d slept_seconds=%.1f",
+        stats["reserved"],
+        stats["released"],
+        stats["deferred"],
+        stats["too_many_requests"],
+        stats["slept_seconds"],
+    )
+    return stats
@@ -479,6 +479,74 @@ def test_batch_create_hubspot_objects_chunked(mocker, id_count):
         assert user.hubspot_sync_datetime is not None
 
 
+def test_batch_create_hubspot_objects_chunked_bookkeeping(
+    mocker, django_assert_num_queries
+):
+    """
+    batch_create_hubspot_objects_chunked should store the HubSpot ids for a chunk
+    with a fixed number of queries, matching contacts by case-insensitive email
+    """
+    contacts = UserFactory.create_batch(4)
+    existing = HubspotObjectFactory.create(
+        content_object=contacts[0],
+        content_type=ContentType.objects.get_for_model(User),
+        hubspot_id="stale",
+    )
+    mock_hubspot_api = mocker.patch("hubspot_sync.tasks.HubspotApi")
+    mock_hubspot_api.return_value.crm.objects.batch_api.create.return_value = (
+        mocker.Mock(
+            results=[
+                SimplePublicObjectFactory(
+                    id=f"2000{user.id}", properties={"email": user.email.upper()}
+                )
+                for user in contacts
+            ]
+        )
+    )
+
+    # content type, contact messages, email lookup, upsert, sync datetime
+    # update, plus the savepoint
+    with django_assert_num_queries(7):
+        tasks.batch_create_hubspot_objects_chunked(
+            HubspotObjectType.CONTACTS.value, "user", [user.id for user in contacts]
+        )
+
+    existing.refresh_from_db()
+    assert existing.hubspot_id == f"2000{contacts[0].id}"
+    assert set(
+        HubspotObject.objects.filter(
+            content_type=ContentType.objects.get_for_model(User)
+        ).values_list("object_id", "hubspot_id")
+    ) == {(user.id, f"2000{user.id}") for user in contacts}
+    for user in contacts:
+        user.refresh_from_db()
+        assert user.hubspot_sync_datetime is not None
+
+
+def test_batch_update_hubspot_objects_chunked_marks_synced(mocker):
+    """batch_update_hubspot_objects_chunked should mark the updated contacts as synced"""
+    updated, not_updated = UserFactory.create_batch(2)
+    mock_hubspot_api = mocker.patch("hubspot_sync.tasks.HubspotApi")
+    mock_hubspot_api.return_value.crm.objects.batch_api.update.return_value = (
+        mocker.Mock(
+            results=[
+                SimplePublicObjectFactory(
+                    id="10001", properties={"email": updated.email.upper()}
+                )
+            ]
+        )
+    )
+    tasks.batch_update_hubspot_objects_chunked(
+        HubspotObjectType.CONTACTS.value,
+        "user",
+        [(updated.id, "10001"), (not_updated.id, "10002")],
+    )
+    updated.refresh_from_db()
+    not_updated.refresh_from_db()
+    assert updated.hubspot_sync_datetime is not None
+    assert not_updated.hubspot_sync_datetime is None
+
+
 @pytest.mark.parametrize(
     "status, expected_error",  # noqa: PT006
     [[429, TooManyRequestsException], [500, ApiException]],  # noqa: PT007
@@ -929,3 +997,98 @@ class TestRateLimitingInBatchFunctions:
 
         # Should have one API call followed by one rate limit call
         assert call_order == ["api_call", "rate_limit"]
+
+
+def test_flush_pending_hubspot_syncs(mocker, settings):
+    """flush_pending_hubspot_syncs should drain each queue into sync tasks"""
+    settings.HUBSPOT_SYNC_COALESCE = True
+    synced_user, new_user = UserFactory.create_batch(2)
+    HubspotObjectFactory.create(
+        content_object=synced_user,
+        content_type=ContentType.objects.get_for_model(User),
+    )
+    pending = {
+        "contact": [synced_user.id, new_user.id],
+        "deal": [1, 2],
+        "uai_deal": [3],
+        "course_run_certificate": [4],
+        "program_certificate": [5],
+    }
+    mocker.patch(
+        "hubspot_sync.tasks.sync_queue.drain_pending_hubspot_syncs",
+        side_effect=lambda sync_type: pending[sync_type],
+    )
+    mocker.patch(
+        "hubspot_sync.tasks.sync_queue.get_pending_hubspot_sync_metrics",
+        return_value={},
+    )
+    mock_batch = mocker.patch("hubspot_sync.tasks.batch_upsert_hubspot_objects.delay")
+    mock_deal = mocker.patch("hubspot_sync.tasks.sync_deal_with_hubspot_targeted.delay")
+    mock_course_run_cert = mocker.patch(
+        "hubspot_sync.tasks.sync_course_run_certificate_with_hubspot.delay"
+    )
+    mock_program_cert = mocker.patch(
+        "hubspot_sync.tasks.sync_program_certificate_with_hubspot.delay"
+    )
+
+    tasks.flush_pending_hubspot_syncs()
+
+    mock_batch.assert_has_calls(
+        [
+            mocker.call(
+                HubspotObjectType.CONTACTS.value,
+                "user",
+                "users",
+                True,  # noqa: FBT003
+                [new_user.id],
+            ),
+            mocker.call(
+                HubspotObjectType.CONTACTS.value,
+                "user",
+                "users",
+                False,  # noqa: FBT003
+                [synced_user.id],
+            ),
+        ]
+    )
+    assert mock_deal.call_args_list == [
+        mocker.call(1, is_uai=False),
+        mocker.call(2, is_uai=False),
+        mocker.call(3, is_uai=True),
+    ]
+    mock_course_run_cert.assert_called_once_with(4)
+    mock_program_cert.assert_called_once_with(5)
+
+
+def test_flush_pending_hubspot_syncs_coalescing_off(mocker, settings):
+    """With coalescing off and nothing left in the queue, flushing should do nothing"""
+    settings.HUBSPOT_SYNC_COALESCE = False
+    mocker.patch(
+        "hubspot_sync.tasks.sync_queue.get_pending_hubspot_sync_metrics",
+        return_value={"contact": {"depth": 0}, "deal": {"depth": 0}},
+    )
+    mock_drain = mocker.patch(
+        "hubspot_sync.tasks.sync_queue.drain_pending_hubspot_syncs"
+    )
+    mock_log = mocker.patch("hubspot_sync.tasks.log.info")
+
+    tasks.flush_pending_hubspot_syncs()
+
+    mock_drain.assert_not_called()
+    mock_log.assert_not_called()
+
+
+def test_log_hubspot_rate_limit_stats(mocker):
+    """log_hubspot_rate_limit_stats should log and return the rate limiter counters"""
+    stats = {
+        "reserved": 10,
+        "released": 1,
+        "deferred": 2,
+        "too_many_requests": 3,
+        "slept_seconds": 1.5,
+    }
+    mocker.patch("hubspot_sync.tasks.get_hubspot_rate_limit_stats", return_value=stats)
+    mock_log = mocker.patch("hubspot_sync.tasks.log.info")
+
+    assert tasks.log_hubspot_rate_limit_stats() == stats
+    assert mock_log.call_args[0][1:] == (10, 1, 2, 3, 1.5)
@@ -19,6 +19,8 @@ messages = messages_for_recipients([
 send_messages(messages)
 """
 
+import hashlib
+import json
 import logging
 import re
 from collections import namedtuple
@@ -30,6 +32,7 @@ from django.conf import settings
 from django.core import mail
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db.models import Model
 from django.template.loader import render_to_string
 
 from mail.exceptions import EmailSendFailureException, MultiEmailValidationError
@@ -163,6 +166,68 @@ def render_email_templates(template_name, context):
     return subject_text, fallback_text, html_text
 
 
+def _context_key_default(value):
+    """JSON fallback used when hashing an email context"""
+    if isinstance(value, Model):
+        return f"{value._meta.label}:{value.pk}"  # noqa: SLF001
+    return repr(value)
+
+
+class EmailRenderCache:
+    """
+    Caches rendered email templates for the duration of a send
+
+    Renders are keyed on the template name and a hash of the context, so
+    recipients that share a context only pay for rendering the templates and
+    parsing the HTML body once. The hash isn't guaranteed to be unique for
+    contexts that hold arbitrary objects, so this is only for sends where every
+    recipient gets the same context, never for user-specific contexts.
+    """
+
+    def __init__(self):
+        self._rendered = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(template_name, context):
+        """
+        Returns the cache key for a template and context
+
+        Args:
+            template_name (str): name of the template, this should match a directory in mail/templates
+            context (dict): context data for the email
+
+        Returns:
+            str: the cache key
+        """
+        context_hash = hashlib.sha256(
+            json.dumps(context, sort_keys=True, default=_context_key_default).encode()
+        ).hexdigest()
+        return f"{template_name}:{context_hash}"
+
+    def render(self, template_name, context):
+        """
+        Renders the email templates, reusing an earlier render for the same context
+
+        Args:
+            template_name (str): name of the template, this should match a directory in mail/templates
+            context (dict): context data for the email
+
+        Returns:
+            (str, str, str): tuple of the templates for subject, text_body, html_body
+        """
+        key = self.get_key(template_name, context)
+        if key in self._rendered:
+            self.hits += 1
+        else:
+            self.misses += 1
+            # render_email_templates adds the subject to the context, so give it a
+            # copy to keep the caller's (possibly shared) context hashing the same
+            self._rendered[key] = render_email_templates(template_name, {**context})
+        return self._rendered[key]
+
+
 def messages_for_recipients(recipients_and_contexts, template_name):
     """
     Creates message objects for a set of recipients with user-specific context in each message.
@@ -214,6 +279,7 @@ def build_messages(template_name, recipients, extra_context, metadata=None):
         django.core.mail.EmailMultiAlternatives: email message with rendered content
     """
     context = {**get_base_context(), **(extra_context or {})}
+    render_cache = EmailRenderCache()
     with mail.get_connection(settings.NOTIFICATION_EMAIL_BACKEND) as connection:
         for recipient in recipients:
             yield build_message(
@@ -222,6 +288,7 @@ def build_messages(template_name, recipients, extra_context, metadata=None):
                 recipient=recipient,
                 context=context,
                 metadata=metadata,
+                render_cache=render_cache,
             )
 
 
@@ -247,7 +314,9 @@ def build_user_specific_messages(template_name, user_message_props_iter):
             )
 
 
-def build_message(connection, template_name, recipient, context, metadata=None):
+def build_message(  # noqa: PLR0913
+    connection, template_name, recipient, context, metadata=None, render_cache=None
+):
     """
     Creates a message object
 
@@ -257,11 +326,19 @@ def build_message(connection, template_name, recipient, context, metadata=None):
         recipient (str): Recipient email address
         context (dict or None): A dict of context variables
         metadata (EmailMetadata or None): An object containing extra data to attach to the message
+        render_cache (EmailRenderCache or None): A cache of rendered templates to reuse across messages
 
     Returns:
         django.core.mail.EmailMultiAlternatives: email message with rendered content
     """
-    subject, text_body, html_body = render_email_templates(template_name, context or {})
+    if render_cache is not None:
+        subject, text_body, html_body = render_cache.render(
+            template_name, context or {}
+        )
+    else:
+        subject, text_body, html_body = render_email_templates(
+            template_name, context or {}
+        )
     msg = AnymailMessage(
         subject=subject,
         body=text_body,
@@ -8,6 +8,7 @@ from pytest_lazy_fixtures import lf
 
 from mail.api import (
     EmailMetadata,
+    EmailRenderCache,
     UserMessageProps,
     build_message,
     build_messages,
@@ -136,6 +137,7 @@ def test_build_messages(mocker):
             recipient=recipient,
             context={"base": "context", "extra": "context"},
             metadata=metadata,
+            render_cache=any_instance_of(EmailRenderCache),
         )
 
 
@@ -172,6 +174,41 @@ def test_build_user_specific_messages(mocker):
         )
 
 
+def test_build_messages_renders_once(mocker):
+    """Tests that build_messages renders the templates once for a shared context"""
+    patched_render = mocker.patch(
+        "mail.api.render_email_templates", wraps=render_email_templates
+    )
+    recipients = ["a@b.com", "c@d.com", "e@f.com"]
+
+    messages = list(
+        build_messages(
+            "sample",
+            recipients,
+            {"user": {"name": "Jane Smith"}, "url": "http://example.com"},
+        )
+    )
+
+    patched_render.assert_called_once()
+    assert [msg.to for msg in messages] == [[recipient] for recipient in recipients]
+    assert {msg.subject for msg in messages} == {"Welcome Jane Smith"}
+
+
+def test_email_render_cache(user):
+    """Tests that EmailRenderCache only reuses renders for an identical context"""
+    render_cache = EmailRenderCache()
+    context = context_for_user(user=user, extra_context={"url": "http://example.com"})
+
+    first = render_cache.render("sample", context)
+    assert "subject" not in context
+    assert render_cache.render("sample", {**context}) == first
+    assert (render_cache.hits, render_cache.misses) == (1, 1)
+
+    other_user = UserFactory.create()
+    render_cache.render("sample", {**context, "user": other_user})
+    assert (render_cache.hits, render_cache.misses) == (1, 2)
+
+
 def test_build_message(mocker, settings):
     """
     Tests that build_message correctly builds a message object using the Anymail APIs
@@ -15,7 +15,12 @@ ANONYMOUS_BASKET_HANDOFF_PARAM = "anonymous_basket_id"
 
 
 class CachelessAPIMiddleware(MiddlewareMixin):
-    """Add Cache-Control header to API responses"""
+    """
+    Add Cache-Control header to API responses
+
+    Responses tagged with a Surrogate-Key have opted into CDN caching (see
+    courses.views.utils.PublicCacheMixin) and keep their own Cache-Control.
+    """
 
     def process_response(self, request, response):
         """Add a Cache-Control header to an API response"""
@@ -23,7 +28,7 @@ class CachelessAPIMiddleware(MiddlewareMixin):
             request.path.startswith("/api/")
             or request.path.startswith("/courses/")
             or request.path.startswith("/checkout/")
-        ):
+        ) and not response.has_header("Surrogate-Key"):
             response["Cache-Control"] = "private, no-store"
 
         return response
@@ -4,12 +4,39 @@ import pytest
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponse
 
-from main.middleware import AnonymousBasketHandoffMiddleware, HostBasedCSRFMiddleware
+from main.middleware import (
+    AnonymousBasketHandoffMiddleware,
+    CachelessAPIMiddleware,
+    HostBasedCSRFMiddleware,
+)
 from users.factories import UserFactory
 
 pytestmark = [pytest.mark.django_db]
 
 
+@pytest.mark.parametrize(
+    ("path", "surrogate_key", "expected_cache_control"),
+    [
+        ("/api/v2/courses/", None, "private, no-store"),
+        ("/api/v2/courses/", "mitxonline:courses", "public, s-maxage=300"),
+        ("/checkout/", None, "private, no-store"),
+        ("/about/", None, "public, s-maxage=300"),
+    ],
+)
+def test_cacheless_api_middleware(rf, path, surrogate_key, expected_cache_control):
+    """API responses are marked uncacheable unless they are tagged with a Surrogate-Key"""
+    response = HttpResponse()
+    response["Cache-Control"] = "public, s-maxage=300"
+    if surrogate_key:
+        response["Surrogate-Key"] = surrogate_key
+
+    response = CachelessAPIMiddleware(lambda _: response).process_response(
+        rf.get(path), response
+    )
+
+    assert response["Cache-Control"] == expected_cache_control
+
+
 @pytest.mark.parametrize(
     ("host", "expected_domain"),
     [
@@ -151,6 +151,11 @@ CORS_ALLOW_HEADERS = (
     "baggage",
     "sentry-trace",
 )
+# Response headers that cross-origin frontends (e.g. MIT Learn) need to read
+CORS_EXPOSE_HEADERS = (
+    # openedx.constants.OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER
+    "X-Enrollment-Sync-Status",
+)
 
 SESSION_COOKIE_DOMAIN = get_string(
     name="SESSION_COOKIE_DOMAIN",
@@ -957,12 +962,37 @@ CERTIFICATE_CREATION_WINDOW_IN_DAYS = get_int(
     default=31,
     description="The number of days a course run is eligible for certificate creation after it ends.",
 )
+CERTIFICATE_GENERATION_MAX_CONCURRENT_TASKS = get_int(
+    name="CERTIFICATE_GENERATION_MAX_CONCURRENT_TASKS",
+    default=4,
+    description="Max number of concurrent tasks the scheduled course certificate generation is split into",
+)
 
 RETRY_FAILED_EDX_ENROLLMENT_FREQUENCY = get_int(
     name="RETRY_FAILED_EDX_ENROLLMENT_FREQUENCY",
     default=60 * 30,
     description="How many seconds between retrying failed edX enrollments",
 )
+OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS = get_int(
+    name="OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS",
+    default=4,
+    description="Max number of threads used to retry failed edX enrollments concurrently",
+)
+OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT = get_int(
+    name="OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT",
+    default=10,
+    description="Max number of failed edX enrollments retried per second (0 for no limit)",
+)
+OPENEDX_ENROLLMENT_SYNC_IN_BACKGROUND = get_bool(
+    name="OPENEDX_ENROLLMENT_SYNC_IN_BACKGROUND",
+    default=False,
+    description="When syncing enrollments with edX on dashboard load, return local data immediately and sync in a Celery task instead of during the request",
+)
+OPENEDX_ENROLLMENT_SYNC_TTL = get_int(
+    name="OPENEDX_ENROLLMENT_SYNC_TTL",
+    default=60 * 5,
+    description="How many seconds a user's enrollments are considered fresh after a background sync with edX",
+)
 REPAIR_OPENEDX_USERS_FREQUENCY = get_int(
     name="REPAIR_OPENEDX_USERS_FREQUENCY",
     default=60 * 30,
@@ -1002,6 +1032,30 @@ B2B_GSHEETS_UPDATE_OFFSET = get_int(
     description="Offset for the B2B enrollment code sheet updates",
 )
 
+HUBSPOT_SYNC_FLUSH_FREQUENCY = get_int(
+    name="HUBSPOT_SYNC_FLUSH_FREQUENCY",
+    default=30,
+    description="How many seconds between flushes of the queued Hubspot syncs",
+)
+
+HUBSPOT_RATE_LIMIT_STATS_FREQUENCY = get_int(
+    name="HUBSPOT_RATE_LIMIT_STATS_FREQUENCY",
+    default=300,
+    description="How many seconds between logs of the Hubspot rate limiter counters",
+)
+
+PROGRAM_CERTIFICATE_EVALUATION_FREQUENCY = get_int(
+    name="PROGRAM_CERTIFICATE_EVALUATION_FREQUENCY",
+    default=60,
+    description="How many seconds between runs of the queued program certificate evaluations",
+)
+
+FASTLY_PURGE_FLUSH_FREQUENCY = get_int(
+    name="FASTLY_PURGE_FLUSH_FREQUENCY",
+    default=30,
+    description="How many seconds between flushes of the queued Fastly surrogate key purges",
+)
+
 CELERY_BEAT_SCHEDULE = {
     "retry-failed-edx-enrollments": {
         "task": "openedx.tasks.retry_failed_edx_enrollments",
@@ -1087,6 +1141,22 @@ CELERY_BEAT_SCHEDULE = {
             offset=timedelta(seconds=B2B_GSHEETS_UPDATE_OFFSET),
         ),
     },
+    "flush-pending-hubspot-syncs": {
+        "task": "hubspot_sync.tasks.flush_pending_hubspot_syncs",
+        "schedule": HUBSPOT_SYNC_FLUSH_FREQUENCY,
+    },
+    "log-hubspot-rate-limit-stats": {
+        "task": "hubspot_sync.tasks.log_hubspot_rate_limit_stats",
+        "schedule": HUBSPOT_RATE_LIMIT_STATS_FREQUENCY,
+    },
+    "flush-pending-fastly-purges": {
+        "task": "cms.tasks.flush_pending_fastly_purges",
+        "schedule": FASTLY_PURGE_FLUSH_FREQUENCY,
+    },
+    "evaluate-pending-program-certificates": {
+        "task": "courses.tasks.evaluate_pending_program_certificates",
+        "schedule": PROGRAM_CERTIFICATE_EVALUATION_FREQUENCY,
+    },
     "cull-anonymous-baskets": {
         "task": "ecommerce.tasks.perform_cull_anonymous_baskets",
         "schedule": crontab(minute=0, hour=4),
@@ -1416,6 +1486,12 @@ FASTLY_URL = get_string(
     description="The URL to the Fastly API.",
 )
 
+FASTLY_REQUEST_TIMEOUT = get_int(
+    name="MITX_ONLINE_FASTLY_REQUEST_TIMEOUT",
+    default=10,
+    description="How many seconds to wait for a response from the Fastly API",
+)
+
 # Not MITX_ONLINE_-prefixed, because the value is not MITxOnline's: MIT_LEARN_* is
 # this file's namespace for MIT Learn config, and those seven settings all use the
 # env var name unchanged.
@@ -1430,6 +1506,30 @@ MIT_LEARN_FASTLY_SERVICE_ID = get_string(
     ),
 )
 
+FASTLY_SERVICE_ID = get_string(
+    name="MITX_ONLINE_FASTLY_SERVICE_ID",
+    default=None,
+    description=(
+        "Fastly service ID for MITxOnline's own site, used for surrogate key "
+        "(tag) purging of the publicly cached catalog API responses."
+    ),
+)
+
+CATALOG_API_PUBLIC_CACHE_ENABLED = get_bool(
+    name="CATALOG_API_PUBLIC_CACHE_ENABLED",
+    default=False,
+    description=(
+        "Mark the anonymous catalog API responses as publicly cacheable and tag "
+        "them with Fastly surrogate keys, so they can be served from the edge."
+    ),
+)
+
+CATALOG_API_PUBLIC_CACHE_SECONDS = get_int(
+    name="CATALOG_API_PUBLIC_CACHE_SECONDS",
+    default=300,
+    description="How many seconds the CDN may cache a public catalog API response",
+)
+
 # Hubspot sync settings
 MITOL_HUBSPOT_API_PRIVATE_TOKEN = get_string(
     name="MITOL_HUBSPOT_API_PRIVATE_TOKEN",
@@ -1461,6 +1561,22 @@ HUBSPOT_TASK_DELAY = get_int(
     default=60,
     description="Number of milliseconds to wait between consecutive Hubspot calls",
 )
+HUBSPOT_SYNC_COALESCE = get_bool(
+    name="HUBSPOT_SYNC_COALESCE",
+    default=False,
+    description=(
+        "Queue contact, deal and certificate Hubspot syncs in Redis so that repeated "
+        "triggers for the same object are synced once per flush"
+    ),
+)
+HUBSPOT_RATE_LIMIT_DEFER = get_bool(
+    name="HUBSPOT_RATE_LIMIT_DEFER",
+    default=False,
+    description=(
+        "Reschedule single-object Hubspot sync tasks with a countdown when rate "
+        "limited, instead of sleeping in the worker"
+    ),
+)
 
 # HomePage Hubspot Form Settings
 HUBSPOT_HOME_PAGE_FORM_GUID = get_string(
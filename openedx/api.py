@@ -2,21 +2,29 @@
 
 import logging
 import random
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial
+from itertools import groupby
 from urllib.parse import parse_qs, quote, urljoin, urlparse
 
 import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import F
 from django.shortcuts import reverse
 from edx_api.client import EdxApi
 from edx_api.course_detail.models import CourseMode
 from edx_api.course_runs.exceptions import CourseRunAPIError
 from edx_api.course_runs.models import CourseRun, CourseRunList
+from edx_api.grades.models import CurrentGrade
 from mitol.common.utils import (
+    chunks,
     find_object_with_matching_attr,
     get_error_response_summary,
     now_in_utc,
@@ -34,7 +42,9 @@ from main import features
 from main.utils import get_partitioned_set_difference, get_redis_lock
 from openedx.constants import (
     EDX_DEFAULT_ENROLLMENT_MODE,
+    OPENEDX_ENROLLMENT_LOOKUP_CHUNK_SIZE,
     OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES,
+    OPENEDX_ENROLLMENT_SYNC_LOCK_EXPIRE_SECONDS,
     OPENEDX_REPAIR_GRACE_PERIOD_MINS,
     OPENEDX_USERNAME_MAX_LEN,
     PLATFORM_EDX,
@@ -53,7 +63,7 @@ from openedx.exceptions import (
     UserNameUpdateFailedException,
 )
 from openedx.models import OpenEdxApiAuth, OpenEdxUser
-from openedx.utils import SyncResult, edx_url
+from openedx.utils import RateLimiter, SyncResult, edx_url
 
 log = logging.getLogger(__name__)
 User = get_user_model()
@@ -1181,16 +1191,74 @@ def get_edx_api_grades_client():
     return edx_client.current_grades
 
 
-def get_edx_grades_with_users(course_run, user=None):
+def _iter_edx_course_grade_pages(grades_client, course_id):
+    """
+    Yields the current grades for a course run from the edX grades API one page at a time
+
+    UserCurrentGrades.get_course_current_grades follows every "next" link before
+    returning, so the whole course roster ends up in memory before the first grade
+    can be processed. This walks the same endpoint lazily instead.
+
+    Args:
+        grades_client (UserCurrentGrades): edx api grades client instance
+        course_id (str): The edX course id
+
+    Yields:
+        list of CurrentGrade: The grades on each page of results
+    """
+    resp = grades_client.requester.get(
+        urljoin(grades_client.base_url, f"/api/grades/v1/courses/{course_id}/")
+    )
+    resp.raise_for_status()
+    resp_json = resp.json()
+    if "results" not in resp_json:
+        # unpaginated response
+        yield [CurrentGrade(entry) for entry in resp_json]
+        return
+
+    yield [CurrentGrade(entry) for entry in resp_json["results"]]
+    while resp_json["next"] is not None:
+        resp = grades_client.requester.get(resp_json["next"])
+        resp.raise_for_status()
+        resp_json = resp.json()
+        yield [CurrentGrade(entry) for entry in resp_json["results"]]
+
+
+def _get_users_by_edx_username(edx_usernames):
+    """
+    Looks up the users for a set of edX usernames in a single query
+
+    Args:
+        edx_usernames (iterable of str): The edX usernames to look up
+
+    Returns:
+        dict: edX username -> User
+    """
+    return {
+        user.matched_edx_username: user
+        for user in User.objects.filter(
+            openedx_users__edx_username__in=edx_usernames
+        ).annotate(matched_edx_username=F("openedx_users__edx_username"))
+    }
+
+
+def get_edx_grades_with_users(course_run, user=None, stats=None):
     """
     Get all current grades for a course run from OpenEdX along with the enrolled user object
 
+    Grades are fetched from edX a page at a time and the users for each page are
+    resolved with a single query, so the (grade, user) pairs are yielded as soon as
+    their page has been read rather than after the whole course has been loaded.
+
     Args:
         course_run (CourseRun): The course run for which to fetch the grades and users
         user (users.models.User): Limit the grades to this user
+        stats (Counter): If provided, incremented with the number of grade pages
+            fetched, the time spent looking up users (in ms) and the number of
+            edX usernames that didn't match a user
 
-    Returns:
-        List of (UserCurrentGrade, User) tuples
+    Yields:
+        (UserCurrentGrade, User) tuples
     """
     grades_client = get_edx_api_grades_client()
     if user:
@@ -1198,18 +1266,31 @@ def get_edx_grades_with_users(course_run, user=None):
             user.edx_username, course_run.courseware_id
         )
         yield edx_grade, user
-    else:
-        edx_course_grades = grades_client.get_course_current_grades(
-            course_run.courseware_id
+        return
+
+    stats = stats if stats is not None else Counter()
+    for page in _iter_edx_course_grade_pages(grades_client, course_run.courseware_id):
+        stats["grade_pages"] += 1
+        lookup_start = time.monotonic()
+        users_by_username = _get_users_by_edx_username(
+            {edx_grade.username for edx_grade in page}
         )
-        all_grades = list(edx_course_grades.all_current_grades)
-        for edx_grade in all_grades:
-            try:
-                user = User.objects.get(openedx_users__edx_username=edx_grade.username)
-            except User.DoesNotExist:  # noqa: PERF203
+        stats["user_lookup_ms"] += int((time.monotonic() - lookup_start) * 1000)
+        for edx_grade in page:
+            grade_user = users_by_username.get(edx_grade.username)
+            if grade_user is None:
+                stats["unmatched_usernames"] += 1
                 log.warning("User with username %s not found", edx_grade.username)
-            else:
-                yield edx_grade, user
+                continue
+            yield edx_grade, grade_user
+
+    log.info(
+        "Fetched edX grades for %s: %d page(s), %dms spent looking up users, %d unmatched username(s)",
+        course_run.courseware_id,
+        stats["grade_pages"],
+        stats["user_lookup_ms"],
+        stats["unmatched_usernames"],
+    )
 
 
 def existing_edx_enrollment(user, course_id, mode, is_active=True):  # noqa: FBT002
@@ -1242,6 +1323,7 @@ def enroll_in_edx_course_runs(
     *,
     mode=EDX_DEFAULT_ENROLLMENT_MODE,
     force_enrollment=True,
+    check_existing=True,
 ):
     """
     Enrolls a user in edx course runs. If the user doesn't have a valid
@@ -1253,6 +1335,8 @@ def enroll_in_edx_course_runs(
         mode (str): The course mode to enroll the user with
         force_enrollment (bool): If True, Enforces Enrollment after the enrollment end date
                                     has been passed or upgrade_deadline is ended
+        check_existing (bool): If False, skip looking up an existing edX enrollment
+            before creating one (the caller has already checked)
 
     Returns:
         list of edx_api.enrollments.models.Enrollment:
@@ -1278,8 +1362,10 @@ def enroll_in_edx_course_runs(
     results = []
     for course_run in course_runs:
         try:
-            enrollment = existing_edx_enrollment(
-                user, course_run.courseware_id, mode=mode
+            enrollment = (
+                existing_edx_enrollment(user, course_run.courseware_id, mode=mode)
+                if check_existing
+                else None
             )
             if enrollment is None:
                 enrollment = edx_client.enrollments.create_student_enrollment(
@@ -1342,10 +1428,111 @@ def _is_permanent_enrollment_failure(exc):
     )
 
 
+def _get_edx_usernames(user_ids):
+    """
+    Returns a dict of user id to edX username for the given users, matching
+    what User.edx_username returns without a query per user
+    """
+    edx_usernames = {}
+    for user_id, edx_username in (
+        OpenEdxUser.objects.filter(user_id__in=user_ids)
+        .order_by("user_id", "id")
+        .values_list("user_id", "edx_username")
+    ):
+        edx_usernames.setdefault(user_id, edx_username)
+    return edx_usernames
+
+
+def _get_existing_edx_enrollments(course_run, usernames):
+    """
+    Looks up the edX enrollments in a course run for a set of usernames
+
+    Args:
+        course_run (courses.models.CourseRun): The course run
+        usernames (iterable of str): The edX usernames to look up
+
+    Returns:
+        dict or None: edX username to a list of edx_api.enrollments.models.Enrollment,
+            or None if the lookup failed
+    """
+    existing = {}
+    try:
+        edx_client = get_edx_api_service_client()
+        for username_chunk in chunks(
+            sorted(usernames), chunk_size=OPENEDX_ENROLLMENT_LOOKUP_CHUNK_SIZE
+        ):
+            for edx_enrollment in edx_client.enrollments.get_enrollments(
+                course_id=course_run.courseware_id, usernames=list(username_chunk)
+            ):
+                existing.setdefault(edx_enrollment.user, []).append(edx_enrollment)
+    except (requests.exceptions.RequestException, ValueError, ImproperlyConfigured):
+        log.warning(
+            "Unable to look up existing edX enrollments in course run %s, "
+            "checking them individually instead",
+            course_run.courseware_id,
+            exc_info=True,
+        )
+        return None
+    return existing
+
+
+def _retry_edx_enrollment(enrollment, rate_limiter, *, check_existing):
+    """
+    Retries a single failed edX enrollment.
+
+    Returns:
+        Exception or None: The exception raised by the enrollment attempt, if any
+    """
+    try:
+        rate_limiter.wait()
+        enroll_in_edx_course_runs(
+            enrollment.user,
+            [enrollment.run],
+            mode=enrollment.enrollment_mode,
+            check_existing=check_existing,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return exc
+    return None
+
+
+def _retry_user_edx_enrollments(user_enrollments, rate_limiter):
+    """
+    Retries a user's failed edX enrollments one after another. Runs in a worker
+    thread. A user's enrollments share a thread so that repairing their edX user
+    and auth token never runs concurrently for the same user.
+
+    Args:
+        user_enrollments (list of (CourseRunEnrollment, bool)): The enrollments,
+            each with whether to check for an existing edX enrollment first
+        rate_limiter (RateLimiter): Limits the rate of enrollment attempts
+
+    Returns:
+        list of Exception or None: The exception raised by each enrollment attempt, if any
+    """
+    try:
+        return [
+            _retry_edx_enrollment(
+                enrollment, rate_limiter, check_existing=check_existing
+            )
+            for enrollment, check_existing in user_enrollments
+        ]
+    finally:
+        # worker threads open their own DB connections, don't leak them
+        connections.close_all()
+
+
 def retry_failed_edx_enrollments():
     """
     Gathers all CourseRunEnrollments with edx_enrolled=False and retries them via the edX API.
 
+    Enrollments are grouped by course run so that the ones that already exist
+    in edX can be found with one enrollments API request per run. The rest are
+    retried concurrently on up to OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS threads,
+    at no more than OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT per second, with each
+    user's enrollments retried in turn on one thread. Results are recorded on
+    the calling thread.
+
     An enrollment that has already failed OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES
     times with a permanent, per-enrollment error (see
     _is_permanent_enrollment_failure) is excluded going forward instead of
@@ -1360,27 +1547,86 @@ def retry_failed_edx_enrollments():
         list of CourseRunEnrollment: All CourseRunEnrollments that were successfully retried
     """
     now = now_in_utc()
-    failed_run_enrollments = courses.models.CourseRunEnrollment.objects.select_related(
-        "user", "run"
-    ).filter(
-        user__is_active=True,
-        edx_enrolled=False,
-        created_on__lt=now - timedelta(minutes=OPENEDX_REPAIR_GRACE_PERIOD_MINS),
-        edx_enrollment_retry_count__lt=OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES,
+    failed_run_enrollments = list(
+        courses.models.CourseRunEnrollment.objects.select_related("user", "run")
+        .filter(
+            user__is_active=True,
+            edx_enrolled=False,
+            created_on__lt=now - timedelta(minutes=OPENEDX_REPAIR_GRACE_PERIOD_MINS),
+            edx_enrollment_retry_count__lt=OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES,
+        )
+        .order_by("run_id", "id")
     )
-    succeeded = []
-    for enrollment in failed_run_enrollments:
-        user = enrollment.user
-        course_run = enrollment.run
-        try:
-            enroll_in_edx_course_runs(
-                user, [course_run], mode=enrollment.enrollment_mode
+    if not failed_run_enrollments:
+        return []
+
+    edx_usernames = _get_edx_usernames(
+        {enrollment.user_id for enrollment in failed_run_enrollments}
+    )
+    rate_limiter = RateLimiter(settings.OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT)
+    attempts = []
+    # user id to a list of (enrollment, check_existing) still to be retried
+    pending = defaultdict(list)
+    for _, run_enrollments in groupby(
+        failed_run_enrollments, key=lambda enrollment: enrollment.run_id
+    ):
+        run_enrollments = list(run_enrollments)  # noqa: PLW2901
+        existing = _get_existing_edx_enrollments(
+            run_enrollments[0].run,
+            {
+                edx_usernames[enrollment.user_id]
+                for enrollment in run_enrollments
+                if edx_usernames.get(enrollment.user_id)
+            },
+        )
+        for enrollment in run_enrollments:
+            edx_username = edx_usernames.get(enrollment.user_id)
+            checked = existing is not None and edx_username is not None
+            if checked and any(
+                edx_enrollment.mode == enrollment.enrollment_mode
+                and edx_enrollment.is_active
+                for edx_enrollment in existing.get(edx_username, [])
+            ):
+                attempts.append((enrollment, None))
+                continue
+            pending[enrollment.user_id].append((enrollment, not checked))
+
+    with ThreadPoolExecutor(
+        max_workers=settings.OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS
+    ) as executor:
+        futures = [
+            (
+                user_enrollments,
+                executor.submit(
+                    _retry_user_edx_enrollments, user_enrollments, rate_limiter
+                ),
             )
-        except Exception as exc:  # pylint: disable=broad-except
+            for user_enrollments in pending.values()
+        ]
+        for user_enrollments, future in futures:
+            attempts.extend(
+                zip(
+                    (enrollment for enrollment, _ in user_enrollments),
+                    future.result(),
+                    strict=True,
+                )
+            )
+
+        succeeded = []
+        for enrollment, exc in attempts:
+            if exc is None:
+                enrollment.edx_enrolled = True
+                enrollment.edx_emails_subscription = True
+                enrollment.save_and_log(None)
+                succeeded.append(enrollment)
+                continue
+
+            user = enrollment.user
+            course_run = enrollment.run
             if not _is_permanent_enrollment_failure(exc):
                 # transient/unexpected - worth a Sentry event since it may
                 # signal a real edX outage or a new failure mode
-                log.exception(str(exc))  # noqa: TRY401
+                log.exception(str(exc), exc_info=exc)
                 continue
             # permanent, per-enrollment failure that is already tracked via
             # edx_enrollment_retry_count and visible in the admin - logging
@@ -1394,7 +1640,7 @@ def retry_failed_edx_enrollments():
                 user.edx_username,
                 course_run.courseware_id,
                 type(exc).__name__,
-                exc_info=True,
+                exc_info=exc,
             )
             enrollment.edx_enrollment_retry_count += 1
             enrollment.save(update_fields=["edx_enrollment_retry_count"])
@@ -1409,11 +1655,6 @@ def retry_failed_edx_enrollments():
                     course_run.courseware_id,
                     enrollment.edx_enrollment_retry_count,
                 )
-        else:
-            enrollment.edx_enrolled = True
-            enrollment.edx_emails_subscription = True
-            enrollment.save_and_log(None)
-            succeeded.append(enrollment)
     return succeeded
 
 
@@ -1537,6 +1778,53 @@ def sync_enrollments_with_edx(
     return results
 
 
+def _get_enrollment_sync_key(user: User) -> str:
+    return f"openedx-enrollment-sync.{user.id}"
+
+
+def _get_enrollment_sync_lock(user: User):
+    return get_redis_lock(
+        f"openedx-enrollment-sync-lock.{user.id}",
+        expire=OPENEDX_ENROLLMENT_SYNC_LOCK_EXPIRE_SECONDS,
+    )
+
+
+def is_enrollment_sync_stale(user: User) -> bool:
+    """
+    Returns True if the user's enrollments haven't been synced with edX in the background
+    within OPENEDX_ENROLLMENT_SYNC_TTL seconds
+    """
+    return caches["redis"].get(_get_enrollment_sync_key(user)) is None
+
+
+def claim_enrollment_sync(user: User) -> bool:
+    """
+    Claims the background enrollment sync for a user so only one sync is queued at a time
+
+    The claim is released by complete_enrollment_sync, or expires after
+    OPENEDX_ENROLLMENT_SYNC_LOCK_EXPIRE_SECONDS if the sync never finishes.
+
+    Returns:
+        bool: True if the caller should queue the sync, False if one is already pending
+    """
+    return _get_enrollment_sync_lock(user).acquire(blocking=False)
+
+
+def complete_enrollment_sync(user: User):
+    """
+    Marks the user's enrollments as freshly synced and releases the sync claim
+
+    This is called whether or not the sync succeeded, so that edX being down
+    doesn't cause a sync attempt on every dashboard load.
+    """
+    caches["redis"].set(
+        _get_enrollment_sync_key(user),
+        now_in_utc().isoformat(),
+        timeout=settings.OPENEDX_ENROLLMENT_SYNC_TTL,
+    )
+    _get_enrollment_sync_lock(user).reset()
+
+
 def subscribe_to_edx_course_emails(user, course_run):
     """
     Subscribes a user to course emails in edX
@@ -3,6 +3,7 @@
 # pylint: disable=redefined-outer-name
 import itertools
 import logging
+from collections import Counter
 from datetime import timedelta
 from unittest.mock import ANY, call, patch
 from urllib.parse import parse_qsl
@@ -13,6 +14,7 @@ import responses
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ImproperlyConfigured
 from edx_api.course_runs.exceptions import CourseRunAPIError
+from edx_api.enrollments.models import Enrollment
 from freezegun import freeze_time
 from mitol.common.utils.datetime import now_in_utc
 from mitol.common.utils.user import _reformat_for_username, usernameify
@@ -32,6 +34,8 @@ from openedx.api import (
     OPENEDX_AUTH_DEFAULT_TTL_IN_SECONDS,
     OPENEDX_REGISTRATION_VALIDATION_PATH,
     bulk_retire_edx_users,
+    claim_enrollment_sync,
+    complete_enrollment_sync,
     create_edx_auth_token,
     create_edx_user,
     create_user,
@@ -40,8 +44,10 @@ from openedx.api import (
     generate_unique_username,
     get_edx_api_client,
     get_edx_course_outline,
+    get_edx_grades_with_users,
     get_edx_retirement_service_client,
     get_valid_edx_api_auth,
+    is_enrollment_sync_stale,
     process_course_run_clone,
     push_edx_modes_from_run,
     reconcile_edx_username,
@@ -81,7 +87,7 @@ from openedx.exceptions import (
 )
 from openedx.factories import OpenEdxApiAuthFactory
 from openedx.models import OpenEdxApiAuth, OpenEdxUser
-from openedx.utils import SyncResult
+from openedx.utils import SyncResult, edx_url
 from users.factories import UserFactory
 
 User = get_user_model()
@@ -1165,6 +1171,18 @@ def test_enroll_pro_unknown_fail(settings, mocker, user):
         enroll_in_edx_course_runs(user, [course_run])
 
 
+@pytest.fixture
+def existing_edx_enrollments(mocker, settings):
+    """
+    Patches the per-run lookup of existing edX enrollments done by
+    retry_failed_edx_enrollments, and retries on a single worker thread
+    """
+    settings.OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS = 1
+    settings.OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT = 0
+    return mocker.patch("openedx.api._get_existing_edx_enrollments", return_value={})
+
+
+@pytest.mark.usefixtures("existing_edx_enrollments")
 @pytest.mark.parametrize("exception_raised", [Exception("An error happened"), None])
 def test_retry_failed_edx_enrollments(mocker, exception_raised):
     """
@@ -1202,6 +1220,7 @@ def test_retry_failed_edx_enrollments(mocker, exception_raised):
             assert enrollment.edx_emails_subscription is True
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 def test_retry_failed_enroll_grace_period(mocker):
     """
     Tests that retry_failed_edx_enrollments does not attempt to repair any enrollments that were recently created
@@ -1218,7 +1237,10 @@ def test_retry_failed_enroll_grace_period(mocker):
 
     assert successful_enrollments == [older_enrollment]
     patched_enroll_in_edx.assert_called_once_with(
-        older_enrollment.user, [older_enrollment.run], mode=EDX_ENROLLMENT_AUDIT_MODE
+        older_enrollment.user,
+        [older_enrollment.run],
+        mode=EDX_ENROLLMENT_AUDIT_MODE,
+        check_existing=False,
     )
 
 
@@ -1233,6 +1255,7 @@ def _permanent_enroll_error(user, course_run, status_code=status.HTTP_400_BAD_RE
     )
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 def test_retry_failed_edx_enrollments_increments_retry_count(mocker):
     """A failed retry attempt from a permanent (4xx) error should bump edx_enrollment_retry_count by 1"""
     with freeze_time(now_in_utc() - timedelta(days=1)):
@@ -1251,6 +1274,7 @@ def test_retry_failed_edx_enrollments_increments_retry_count(mocker):
     assert enrollment.edx_enrollment_retry_count == 1
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 def test_retry_failed_edx_enrollments_counts_missing_openedx_user(mocker):
     """
     OpenEdxUserMissingError (repair_faulty_edx_user couldn't create/verify
@@ -1273,6 +1297,7 @@ def test_retry_failed_edx_enrollments_counts_missing_openedx_user(mocker):
     assert enrollment.edx_enrollment_retry_count == 1
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 @pytest.mark.parametrize(
     "exception",
     [
@@ -1326,6 +1351,7 @@ def test_retry_failed_edx_enrollments_does_not_count_transient_failures(
     assert enrollment.edx_enrollment_retry_count == 0
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 def test_retry_failed_edx_enrollments_excludes_after_max_retries(mocker):
     """
     Once an enrollment has failed OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES times
@@ -1350,6 +1376,7 @@ def test_retry_failed_edx_enrollments_excludes_after_max_retries(mocker):
     )
 
 
+@pytest.mark.usefixtures("existing_edx_enrollments")
 def test_retry_failed_edx_enrollments_dead_letters_at_max_retries(mocker):
     """Reaching the retry cap should log a distinct give-up message"""
     with freeze_time(now_in_utc() - timedelta(days=1)):
@@ -1378,6 +1405,125 @@ def test_retry_failed_edx_enrollments_dead_letters_at_max_retries(mocker):
     assert "Giving up" in patched_log_warning.call_args_list[-1][0][0]
 
 
+def test_retry_failed_edx_enrollments_batches_existing_lookup(
+    mocker, existing_edx_enrollments
+):
+    """
+    Existing edX enrollments should be looked up once per course run, and
+    enrollments that already exist in edX shouldn't be created again
+    """
+    with freeze_time(now_in_utc() - timedelta(days=1)):
+        run = CourseRunFactory.create()
+        enrolled, missing, inactive = CourseRunEnrollmentFactory.create_batch(
+            3, run=run, edx_enrolled=False, user__is_active=True
+        )
+        no_edx_user = CourseRunEnrollmentFactory.create(
+            run=run,
+            edx_enrolled=False,
+            user__is_active=True,
+            user__no_openedx_user=True,
+        )
+    existing_edx_enrollments.return_value = {
+        enrolled.user.edx_username: [
+            Enrollment({"mode": enrolled.enrollment_mode, "is_active": True})
+        ],
+        inactive.user.edx_username: [
+            Enrollment({"mode": inactive.enrollment_mode, "is_active": False})
+        ],
+    }
+    patched_enroll_in_edx = mocker.patch("openedx.api.enroll_in_edx_course_runs")
+
+    successful_enrollments = retry_failed_edx_enrollments()
+
+    existing_edx_enrollments.assert_called_once_with(
+        run,
+        {
+            enrolled.user.edx_username,
+            missing.user.edx_username,
+            inactive.user.edx_username,
+        },
+    )
+    assert {enrollment.id for enrollment in successful_enrollments} == {
+        enrolled.id,
+        missing.id,
+        inactive.id,
+        no_edx_user.id,
+    }
+    assert {
+        (call.args[0], call.kwargs["check_existing"])
+        for call in patched_enroll_in_edx.call_args_list
+    } == {
+        (missing.user, False),
+        (inactive.user, False),
+        (no_edx_user.user, True),
+    }
+
+
+def test_retry_failed_edx_enrollments_groups_by_user(mocker, settings):
+    """
+    A user's failed enrollments in different course runs should be retried on
+    the same worker thread, so their edX user is never repaired concurrently
+    """
+    settings.OPENEDX_ENROLLMENT_REPAIR_MAX_WORKERS = 4
+    settings.OPENEDX_ENROLLMENT_REPAIR_RATE_LIMIT = 0
+    mocker.patch("openedx.api._get_existing_edx_enrollments", return_value=None)
+    with freeze_time(now_in_utc() - timedelta(days=1)):
+        user = UserFactory.create(is_active=True)
+        user_enrollments = CourseRunEnrollmentFactory.create_batch(
+            2, user=user, edx_enrolled=False
+        )
+        other_enrollment = CourseRunEnrollmentFactory.create(
+            edx_enrolled=False, user__is_active=True
+        )
+    mocker.patch("openedx.api.enroll_in_edx_course_runs")
+    patched_retry = mocker.patch(
+        "openedx.api._retry_user_edx_enrollments",
+        side_effect=lambda enrollments, _: [None] * len(enrollments),
+    )
+
+    successful_enrollments = retry_failed_edx_enrollments()
+
+    assert {enrollment.id for enrollment in successful_enrollments} == {
+        *(enrollment.id for enrollment in user_enrollments),
+        other_enrollment.id,
+    }
+    assert sorted(
+        [enrollment.id for enrollment, _ in call.args[0]]
+        for call in patched_retry.call_args_list
+    ) == sorted(
+        [
+            [enrollment.id for enrollment in user_enrollments],
+            [other_enrollment.id],
+        ]
+    )
+
+
+def test_retry_failed_edx_enrollments_lookup_failure(mocker, settings):
+    """
+    If the existing edX enrollments can't be looked up for a run, each
+    enrollment should be checked individually instead
+    """
+    settings.OPENEDX_SERVICE_WORKER_API_TOKEN = "mock_api_token"  # noqa: S105
+    with freeze_time(now_in_utc() - timedelta(days=1)):
+        enrollment = CourseRunEnrollmentFactory.create(
+            edx_enrolled=False, user__is_active=True
+        )
+    mock_client = mocker.MagicMock()
+    mock_client.enrollments.get_enrollments.side_effect = HTTPError(
+        response=MockResponse({}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    )
+    mocker.patch("openedx.api.get_edx_api_service_client", return_value=mock_client)
+    patched_enroll_in_edx = mocker.patch("openedx.api.enroll_in_edx_course_runs")
+
+    assert retry_failed_edx_enrollments() == [enrollment]
+    patched_enroll_in_edx.assert_called_once_with(
+        enrollment.user,
+        [enrollment.run],
+        mode=enrollment.enrollment_mode,
+        check_existing=True,
+    )
+
+
 @pytest.mark.parametrize(
     "no_openedx_user,no_edx_auth",  # noqa: PT006
     itertools.product([True, False], [True, False]),
@@ -1500,6 +1646,72 @@ def test_retry_users_grace_period(mocker):
     )
 
 
+@responses.activate
+def test_get_edx_grades_with_users(settings, django_assert_num_queries):
+    """
+    Tests that get_edx_grades_with_users pages through the edX grades and resolves
+    the users for each page with a single query
+    """
+    settings.OPENEDX_SERVICE_WORKER_API_TOKEN = "mock_api_token"  # noqa: S105
+    course_run = CourseRunFactory.create()
+    users = UserFactory.create_batch(3)
+    grades_url = edx_url(f"/api/grades/v1/courses/{course_run.courseware_id}/")
+    next_url = f"{grades_url}?cursor=abc"
+
+    def _grade(username):
+        return {
+            "username": username,
+            "course_id": course_run.courseware_id,
+            "passed": True,
+            "percent": 0.8,
+            "letter_grade": "B",
+        }
+
+    responses.add(
+        responses.GET,
+        grades_url,
+        json={
+            "next": next_url,
+            "results": [_grade(users[0].edx_username), _grade("unknown-user")],
+        },
+        match=[responses.matchers.query_string_matcher("")],
+    )
+    responses.add(
+        responses.GET,
+        next_url,
+        json={
+            "next": None,
+            "results": [_grade(users[1].edx_username), _grade(users[2].edx_username)],
+        },
+    )
+
+    stats = Counter()
+    with django_assert_num_queries(2):
+        results = list(get_edx_grades_with_users(course_run, stats=stats))
+
+    assert [(grade.username, user) for grade, user in results] == [
+        (user.edx_username, user) for user in users
+    ]
+    assert stats["grade_pages"] == 2
+    assert stats["unmatched_usernames"] == 1
+
+
+def test_get_edx_grades_with_users_single_user(mocker, user):
+    """Tests that get_edx_grades_with_users fetches only the given user's grade when a user is passed"""
+    mock_grades_client = mocker.Mock()
+    mocker.patch(
+        "openedx.api.get_edx_api_grades_client", return_value=mock_grades_client
+    )
+    course_run = CourseRunFactory.create()
+
+    assert list(get_edx_grades_with_users(course_run, user=user)) == [
+        (mock_grades_client.get_student_current_grade.return_value, user)
+    ]
+    mock_grades_client.get_student_current_grade.assert_called_once_with(
+        user.edx_username, course_run.courseware_id
+    )
+
+
 def test_unenroll_edx_course_run(mocker):
     """Tests that unenroll_edx_course_run makes a call to unenroll in edX via the API client"""
     mock_client = mocker.MagicMock()
@@ -1703,6 +1915,24 @@ def test_sync_enrollments_with_edx_not_synced(mocker, user):
     assert result == SyncResult()
 
 
+def test_background_enrollment_sync_claims(settings, user):
+    """Only one background enrollment sync can be claimed until it completes, after which it's fresh"""
+    settings.OPENEDX_ENROLLMENT_SYNC_TTL = 60
+    other_user = UserFactory.create()
+
+    assert is_enrollment_sync_stale(user) is True
+    assert claim_enrollment_sync(user) is True
+    assert claim_enrollment_sync(user) is False
+    assert claim_enrollment_sync(other_user) is True
+
+    complete_enrollment_sync(user)
+    complete_enrollment_sync(other_user)
+
+    assert is_enrollment_sync_stale(user) is False
+    assert claim_enrollment_sync(user) is True
+    complete_enrollment_sync(user)
+
+
 def test_subscribe_to_edx_course_emails(mocker, user):
     """Tests that subscribe_to_edx_course_emails makes a call to subscribe for course emails in edX via api client"""
     mock_client = mocker.MagicMock()
@@ -23,5 +23,15 @@ OPENEDX_REPAIR_GRACE_PERIOD_MINS = 5
 # course mode, deleted course run, etc) gets re-attempted on every repair run
 # forever - see MITXONLINE-5ZV.
 OPENEDX_ENROLLMENT_REPAIR_MAX_RETRIES = 5
+# How many usernames are looked up per edX enrollments API request when
+# checking which failed enrollments already exist in edX
+OPENEDX_ENROLLMENT_LOOKUP_CHUNK_SIZE = 100
+
+# Background enrollment sync on dashboard load. The lock expiry bounds how long a
+# lost or stuck sync task can block the next one.
+OPENEDX_ENROLLMENT_SYNC_LOCK_EXPIRE_SECONDS = 120
+OPENEDX_ENROLLMENT_SYNC_STATUS_HEADER = "X-Enrollment-Sync-Status"
+OPENEDX_ENROLLMENT_SYNC_STATUS_CURRENT = "current"
+OPENEDX_ENROLLMENT_SYNC_STATUS_PENDING = "pending"
 
 OPENEDX_USERNAME_MAX_LEN = 30
@@ -52,6 +52,18 @@ def retry_failed_edx_enrollments():
     ]
 
 
+@app.task(acks_late=True)
+def sync_enrollments_with_edx_async(user_id):
+    """Syncs a user's enrollments with edX in the background for the dashboard"""
+    user = get_user_by_id(user_id)
+    try:
+        api.sync_enrollments_with_edx(user)
+    except Exception:
+        log.exception("Failed to sync enrollments with edX for user: %s", user_id)
+    finally:
+        api.complete_enrollment_sync(user)
+
+
 @app.task(acks_late=True)
 def repair_faulty_openedx_users():
     """Calls the API method to repair faulty openedx users"""
@@ -19,6 +19,22 @@ def test_create_edx_user_from_id(mocker):
     patch_create_user.assert_called_once_with(user)
 
 
+@pytest.mark.parametrize("sync_raises", [True, False])
+def test_sync_enrollments_with_edx_async(mocker, sync_raises):
+    """sync_enrollments_with_edx_async syncs the user and always marks the sync complete"""
+    patch_sync = mocker.patch(
+        "openedx.tasks.api.sync_enrollments_with_edx",
+        side_effect=Exception("edX is down") if sync_raises else None,
+    )
+    patch_complete = mocker.patch("openedx.tasks.api.complete_enrollment_sync")
+    user = UserFactory.create()
+
+    tasks.sync_enrollments_with_edx_async.delay(user.id)
+
+    patch_sync.assert_called_once_with(user)
+    patch_complete.assert_called_once_with(user)
+
+
 def test_update_edx_user_email_async(mocker):
     """Test that create_edx_user_from_id loads a user and calls the API method to create an edX user"""
     patch_update_user = mocker.patch("openedx.tasks.api.update_edx_user_email")
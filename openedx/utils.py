@@ -1,5 +1,7 @@
 """Utility functions for the openedx app"""
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import Generic, List, TypeVar  # noqa: UP035
 from urllib.parse import urljoin
@@ -48,3 +50,26 @@ class SyncResult(Generic[T]):
                 len(self.deactivated) == 0,
             ]
         )
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls to wait() so that at most `rate`
+    of them return per second. A falsy rate disables limiting.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next_at = time.monotonic()
+
+    def wait(self):
+        """Blocks until the caller is allowed to proceed"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            proceed_at = max(self._next_at, now)
+            self._next_at = proceed_at + self.interval
+        if proceed_at > now:
+            time.sleep(proceed_at - now)
@@ -386,8 +386,8 @@ class TestEdxCertificateWebhook:
             return_value=iter([(grade_obj, user)]),
         )
         mocker.patch(
-            "courses.api.ensure_course_run_grade",
-            return_value=(grade_obj, True, False),
+            "courses.api.ensure_course_run_grades",
+            return_value=[(grade_obj, user, True, False)],
         )
 
         response = admin_drf_client.post(
@@ -426,8 +426,8 @@ class TestEdxCertificateWebhook:
             return_value=iter([(passed_grade, user)]),
         )
         mocker.patch(
-            "courses.api.ensure_course_run_grade",
-            return_value=(passed_grade, True, False),
+            "courses.api.ensure_course_run_grades",
+            return_value=[(passed_grade, user, True, False)],
         )
 
         response1 = admin_drf_client.post(
@@ -81,7 +81,9 @@ class Command(BaseCommand):
         patched, would_patch, unpatchable, up_to_date = [], [], [], []
         patch_count = 0
 
-        for keycloak_user in self._paginate_keycloak_users(client):
+        for keycloak_user in client.list(
+            "users", UserRepresentation, page_size=PAGE_SIZE
+        ):
             user = mitxonline_users_by_scim_id.get(keycloak_user.id)
             if user is None:
                 continue  # not a user we can trace back to mitxonline
@@ -185,15 +187,6 @@ class Command(BaseCommand):
                 by_id[user.scim_external_id] = user
         return by_id
 
-    def _paginate_keycloak_users(self, client):
-        first = 0
-        while True:
-            page = client.list("users", UserRepresentation, first=first, max=PAGE_SIZE)
-            if not page:
-                return
-            yield from page
-            first += PAGE_SIZE
-
     @staticmethod
     def _row(keycloak_user, user, given_name, family_name, full_name):
         return {
@@ -13,9 +13,9 @@ COMMAND = remediate_keycloak_user_names.Command()
 
 
 def _mock_client(mocker, pages):
-    """pages: list of lists of UserRepresentation, terminated by an empty list"""
+    """pages: list of lists of UserRepresentation, as the client would page through them"""
     client = mocker.Mock()
-    client.list.side_effect = [*pages, []]
+    client.list.return_value = (user for page in pages for user in page)
     return client
 
 
@@ -280,7 +280,7 @@ def test_unmatched_keycloak_user_is_ignored(mocker):
 
 @pytest.mark.django_db
 def test_paginates_across_multiple_pages(mocker):
-    """The command keeps paging until it gets an empty page back"""
+    """The command goes through every page the client returns"""
     user = UserFactory.create(name="Joe Smith", scim_external_id="kc-page2")
     user.legal_address.first_name = "Joe"
     user.legal_address.last_name = "Smith"
@@ -296,4 +296,6 @@ def test_paginates_across_multiple_pages(mocker):
 
     COMMAND.handle(apply=False, limit=None, report_path=None)
 
-    assert client.list.call_count == 3  # page1, page2, empty terminator
+    client.list.assert_called_once_with(
+        "users", UserRepresentation, page_size=remediate_keycloak_user_names.PAGE_SIZE
+    )